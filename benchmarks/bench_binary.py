@@ -0,0 +1,90 @@
+"""
+Binary codec vs JSON benchmark
+
+Compares payload size and encode/decode time of CarmModel.to_bytes() /
+from_bytes() against model_dump_json() / model_validate_json() for an
+OrchestrationResponse with embedded companies and drafts.
+
+Usage:
+    python benchmarks/bench_binary.py
+    python benchmarks/bench_binary.py --sizes 10 100 1000 --repeat 20
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from carm_data_models import Company, ContactInfo, EmailDraft, OrchestrationResponse
+
+
+def build_response(size: int) -> OrchestrationResponse:
+    """OrchestrationResponse with `size` companies and one draft per company"""
+    start = datetime(2024, 1, 1)
+    companies = [
+        Company(
+            name=f"Company {i}",
+            website=f"https://company{i}.example.com",
+            industry=("Technology", "Retail", "Finance")[i % 3],
+            description="Builds software for small businesses " * 3,
+            employee_count=10 + i,
+            founded_year=1990 + i % 30,
+            contact_info=ContactInfo(email=f"info@company{i}.example.com", phone="+1-555-0100"),
+            services=["Web Design", "Consulting"],
+            source="research-agent",
+            found_at=start + timedelta(minutes=i),
+            confidence_score=0.5 + (i % 50) / 100,
+        )
+        for i in range(size)
+    ]
+    drafts = [
+        EmailDraft(
+            subject=f"Partnership opportunity for {c.name}",
+            body="Hi there,\n\nI noticed your company is growing quickly...\n" * 4,
+            recipient_email=f"ceo@company{i}.example.com",
+            company=c,
+            created_at=start,
+        )
+        for i, c in enumerate(companies)
+    ]
+    return OrchestrationResponse(
+        task_id="bench",
+        status="completed",
+        research_results=companies,
+        drafts=drafts,
+        total_duration_seconds=12.5,
+        step_durations={"research": 4.0, "draft": 8.5},
+    )
+
+
+def per_call_ms(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Binary codec vs JSON benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    header = f"{'size':>6} {'format':<14} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        response = build_response(size)
+        as_json = response.model_dump_json()
+        as_bytes = response.to_bytes()
+        rows: List[tuple] = [
+            ("json", len(as_json.encode()),
+             per_call_ms(response.model_dump_json, args.repeat),
+             per_call_ms(lambda: OrchestrationResponse.model_validate_json(as_json), args.repeat)),
+            ("binary", len(as_bytes),
+             per_call_ms(response.to_bytes, args.repeat),
+             per_call_ms(lambda: OrchestrationResponse.from_bytes(as_bytes), args.repeat)),
+        ]
+        for name, nbytes, encode_ms, decode_ms in rows:
+            print(f"{size:>6} {name:<14} {nbytes:>10} {encode_ms:>10.2f} {decode_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Import-time benchmark for carm_data_models
+
+Each scenario runs in a fresh interpreter so nothing is cached between runs.
+The "eager" scenario touches every public name, which is what the package
+used to do on `import carm_data_models`.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --repeat 20 --max-ratio 0.5
+
+Importing pydantic itself is a fixed cost we cannot avoid, so the
+regression check works on time spent *beyond* `from pydantic import
+BaseModel`. It exits with status 1 when the `Status`-only import costs more
+than --max-ratio of the eager import, so an eager import sneaking back into
+__init__ fails CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+SCENARIOS: Dict[str, str] = {
+    "pydantic": "from pydantic import BaseModel",
+    "package": "import carm_data_models",
+    "status_only": "from carm_data_models import Status",
+    "metrics_only": "from carm_data_models import ServiceMetrics",
+    "company": "from carm_data_models import Company",
+    "eager": "import carm_data_models as m; [getattr(m, n) for n in m.__all__]",
+}
+
+_TIMER = """
+import time
+_start = time.perf_counter()
+{statement}
+print(time.perf_counter() - _start)
+"""
+
+
+def time_import(statement: str, repeat: int) -> List[float]:
+    """Run `statement` in `repeat` fresh interpreters; returns seconds per run"""
+    timings = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(out.stdout.strip()))
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Interpreter launches per scenario")
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=0.5,
+        help="Fail if status_only / eager (beyond pydantic) exceeds this ratio",
+    )
+    args = parser.parse_args()
+
+    medians = {}
+    print(f"{'scenario':<14} {'median ms':>10} {'min ms':>10}")
+    for name, statement in SCENARIOS.items():
+        timings = time_import(statement, args.repeat)
+        medians[name] = statistics.median(timings)
+        print(f"{name:<14} {medians[name] * 1000:>10.2f} {min(timings) * 1000:>10.2f}")
+
+    base = medians["pydantic"]
+    ratio = max(medians["status_only"] - base, 0.0) / max(medians["eager"] - base, 1e-9)
+    print(f"\nstatus_only / eager beyond pydantic = {ratio:.2f} (limit {args.max_ratio:.2f})")
+    if ratio > args.max_ratio:
+        print("REGRESSION: lightweight imports are no longer lazy")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Model benchmark suite
+
+Times construction, model_validate, model_validate_json, model_dump and
+model_dump_json for every public model at several payload sizes, measures
+the peak memory of each operation, and compares against a stored baseline.
+
+Payloads come from carm_data_models.synthetic (seeded, fully offline).
+`size` is the number of list items for request/response models (companies,
+drafts, scraped records) and the batch size for entity models.
+
+Usage:
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --models Company OrchestrationResponse --sizes 10 500
+    python benchmarks/bench_models.py --update-baseline
+    python benchmarks/bench_models.py --threshold 0.5   # fail when >50% slower
+
+Exit status is 1 when any operation regressed beyond the threshold. Timings
+are machine-specific: refresh the baseline with --update-baseline when the
+benchmark machine changes.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import carm_data_models
+from carm_data_models.synthetic import GENERATORS, SIZED_MODELS, SyntheticData
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline_models.json")
+
+# Ignore differences below these floors (timer and allocator noise)
+MIN_MS_DELTA = 0.05
+MIN_KB_DELTA = 16.0
+
+
+def build_operations(model_name: str, size: int, seed: int) -> Dict[str, Callable[[], Any]]:
+    """One zero-argument callable per operation, over the same payloads"""
+    model_cls = getattr(carm_data_models, model_name)
+    data = SyntheticData(seed)
+    if model_name in SIZED_MODELS:
+        payloads = [data.payload(model_cls, size)]
+    else:
+        payloads = [data.payload(model_cls) for _ in range(size)]
+    instances = [model_cls.model_validate(p) for p in payloads]
+    texts = [m.model_dump_json() for m in instances]
+    return {
+        "construct": lambda: [model_cls(**p) for p in payloads],
+        "model_validate": lambda: [model_cls.model_validate(p) for p in payloads],
+        "model_validate_json": lambda: [model_cls.model_validate_json(t) for t in texts],
+        "model_dump": lambda: [m.model_dump() for m in instances],
+        "model_dump_json": lambda: [m.model_dump_json() for m in instances],
+    }
+
+
+def per_call_ms(func: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def peak_kb(func: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def run(models: List[str], sizes: List[int], repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for model_name in models:
+        for size in sizes:
+            for operation, func in build_operations(model_name, size, seed).items():
+                func()  # warm up (schema build, caches)
+                results[f"{model_name}/{size}/{operation}"] = {
+                    "ms": round(per_call_ms(func, repeat), 4),
+                    "peak_kb": round(peak_kb(func), 1),
+                }
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[Tuple[str, str, float, float]]:
+    """(case, metric, baseline, current) for every regression beyond `threshold`"""
+    regressions = []
+    for case, current in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        for metric, floor in (("ms", MIN_MS_DELTA), ("peak_kb", MIN_KB_DELTA)):
+            before, after = base[metric], current[metric]
+            if after > before * (1 + threshold) and after - before > floor:
+                regressions.append((case, metric, before, after))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Model benchmark suite")
+    parser.add_argument(
+        "--models", nargs="+", default=sorted(GENERATORS), choices=sorted(GENERATORS)
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Store this run as the baseline"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)"
+    )
+    args = parser.parse_args()
+
+    results = run(args.models, args.sizes, args.repeat, args.seed)
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    header = f"{'case':<48} {'ms':>10} {'base ms':>10} {'peak KB':>10} {'base KB':>10}"
+    print(header)
+    print("-" * len(header))
+    for case, current in results.items():
+        base = baseline.get(case, {})
+        print(
+            f"{case:<48} {current['ms']:>10.3f} {base.get('ms', float('nan')):>10.3f} "
+            f"{current['peak_kb']:>10.1f} {base.get('peak_kb', float('nan')):>10.1f}"
+        )
+
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(dict(sorted(baseline.items())), indent=1) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for case, metric, before, after in regressions:
+            print(f"  {case} {metric}: {before} -> {after}")
+        sys.exit(1)
+    if baseline:
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
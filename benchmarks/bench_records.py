@@ -0,0 +1,78 @@
+"""
+Record memory benchmark
+
+Retained memory per Company as a pydantic model versus a compact record
+(carm_data_models.records), plus conversion times.
+
+Both sides are built from the same JSON lines, so neither shares string
+objects with the input.
+
+Usage:
+    python benchmarks/bench_records.py
+    python benchmarks/bench_records.py --count 100000 --fill-rate 0.6
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from carm_data_models import Company
+from carm_data_models.records import from_records, to_record
+from carm_data_models.synthetic import SyntheticConfig, SyntheticData
+
+
+def retained_bytes(build: Callable[[], List[Any]]) -> float:
+    """Bytes still allocated after build() returns (its result is kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record memory benchmark")
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--fill-rate", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = SyntheticData(args.seed, SyntheticConfig(fill_rate=args.fill_rate))
+    lines = [json.dumps(p) for p in data.iter_payloads(Company, args.count)]
+
+    model_bytes = retained_bytes(lambda: [Company.model_validate_json(line) for line in lines])
+    record_bytes = retained_bytes(
+        lambda: [to_record(Company.model_validate_json(line)) for line in lines]
+    )
+
+    models = [Company.model_validate_json(line) for line in lines]
+    records: List[Any] = []
+    to_seconds = timed(lambda: records.extend(to_record(m) for m in models))
+    back_seconds = timed(lambda: from_records(records))
+
+    print(f"{args.count} companies (fill rate {args.fill_rate:.0%})")
+    print(f"{'':<16} {'bytes/record':>14} {'total MB':>10}")
+    print(f"{'pydantic model':<16} {model_bytes / args.count:>14.0f} {model_bytes / 1e6:>10.1f}")
+    print(f"{'record':<16} {record_bytes / args.count:>14.0f} {record_bytes / 1e6:>10.1f}")
+    print(f"saving: {1 - record_bytes / model_bytes:.0%}")
+    print(f"model -> record: {to_seconds / args.count * 1e6:.1f} us/record")
+    print(f"record -> model: {back_seconds / args.count * 1e6:.1f} us/record")
+
+
+if __name__ == "__main__":
+    main()
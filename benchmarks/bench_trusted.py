@@ -0,0 +1,80 @@
+"""
+Trusted construction vs validation benchmark
+
+Compares from_trusted_payload(..., trusted=True) against full validation
+for a DraftResponse and for a list of Company records, both from the
+JSON-mode data a trusted hop carries.
+
+"fresh" decodes a payload with addresses and URLs this process has not
+seen yet (a new one each run), "warm" decodes the same payload again, so
+validation is answered from the email / URL validation caches.
+
+Usage:
+    python benchmarks/bench_trusted.py
+    python benchmarks/bench_trusted.py --sizes 10 200 1000 --repeat 20
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from carm_data_models import validators
+from carm_data_models.company import Company
+from carm_data_models.responses import DraftResponse
+from carm_data_models.synthetic import SyntheticData
+from carm_data_models.trusted import construct_trusted, from_trusted_payload, to_trusted_payload
+
+Decode = Callable[[Any], object]
+
+
+def best_ms(decode: Decode, inputs: List[Any]) -> float:
+    """Fastest of decode(item) over the inputs"""
+    best = float("inf")
+    for item in inputs:
+        start = time.perf_counter()
+        decode(item)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Trusted construction vs validation benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    data = SyntheticData(seed=args.seed)
+    header = f"{'case':<22} {'data':<7} {'validate ms':>12} {'trusted ms':>11} {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for size in args.sizes:
+        # Two fresh inputs per run: one for each side
+        responses: List[Dict[str, Any]] = [
+            to_trusted_payload(DraftResponse.model_validate(data.payload(DraftResponse, size=size)))
+            for _ in range(2 * args.repeat)
+        ]
+        companies: List[List[Dict[str, Any]]] = [
+            [Company.model_validate(data.company()).model_dump(mode="json") for _ in range(size)]
+            for _ in range(2 * args.repeat)
+        ]
+        validators.clear()  # building the inputs validated them
+        cases: List[tuple] = [
+            (f"DraftResponse/{size}", responses,
+             lambda p: from_trusted_payload(DraftResponse, p),
+             lambda p: from_trusted_payload(DraftResponse, p, trusted=True)),
+            (f"Company x{size}", companies,
+             lambda cs: [Company.model_validate(c) for c in cs],
+             lambda cs: [construct_trusted(Company, c) for c in cs]),
+        ]
+        for name, inputs, validate, trusted in cases:
+            fresh = (best_ms(validate, inputs[::2]), best_ms(trusted, inputs[1::2]))
+            warm = (best_ms(validate, inputs[:1] * args.repeat),
+                    best_ms(trusted, inputs[:1] * args.repeat))
+            for label, (validate_ms, trusted_ms) in (("fresh", fresh), ("warm", warm)):
+                print(f"{name:<22} {label:<7} {validate_ms:>12.2f} {trusted_ms:>11.2f} "
+                      f"{validate_ms / trusted_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
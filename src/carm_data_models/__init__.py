@@ -1,40 +1,91 @@
 """
 carm-data-models: Shared data models for CarmVisuals services
+
+Public models are resolved lazily on first access, so a process that only
+needs `Status` or `ServiceMetrics` does not build every model (or load
+email-validator) at import time. `from carm_data_models import Company`
+works exactly as before.
 """
 
-# Company models
-from .company import Company, ContactInfo, CompanyProfile, Address
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    # Company models
+    from .company import Company, ContactInfo, CompanyProfile, Address
 
-# Email models
-from .email import EmailDraft, EmailTemplate, Message
+    # Email models
+    from .email import EmailDraft, EmailTemplate, Message
 
-# User models
-from .user import User, UserProfile
+    # User models
+    from .user import User, UserProfile
 
-# Tool models
-from .tool import Tool, ToolSettings, ToolExecution
+    # Tool models
+    from .tool import Tool, ToolSettings, ToolExecution
 
-# Request models
-from .requests import (
-    ResearchRequest,
-    ScrapeRequest,
-    DraftRequest,
-    OrchestrationRequest,
-)
+    # Scraped record models
+    from .payloads import WebsiteScrape, LinkedInScrape, GenericScrape
 
-# Response models
-from .responses import (
-    ResearchResponse,
-    ScrapeResponse,
-    DraftResponse,
-    OrchestrationResponse,
-)
+    # Request models
+    from .requests import (
+        ResearchRequest,
+        ScrapeRequest,
+        DraftRequest,
+        OrchestrationRequest,
+    )
 
-# Common models
-from .common import ServiceMetrics, ErrorResponse, Status
+    # Response models
+    from .responses import (
+        ResearchResponse,
+        ScrapeResponse,
+        DraftResponse,
+        OrchestrationResponse,
+    )
+
+    # Common models
+    from .common import CarmModel, ServiceMetrics, ErrorResponse, Status
 
 __version__ = "0.1.0"
 
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Company
+    "Company": ".company",
+    "ContactInfo": ".company",
+    "CompanyProfile": ".company",
+    "Address": ".company",
+    # Email
+    "EmailDraft": ".email",
+    "EmailTemplate": ".email",
+    "Message": ".email",
+    # User
+    "User": ".user",
+    "UserProfile": ".user",
+    # Tool
+    "Tool": ".tool",
+    "ToolSettings": ".tool",
+    "ToolExecution": ".tool",
+    # Scraped records
+    "WebsiteScrape": ".payloads",
+    "LinkedInScrape": ".payloads",
+    "GenericScrape": ".payloads",
+    # Requests
+    "ResearchRequest": ".requests",
+    "ScrapeRequest": ".requests",
+    "DraftRequest": ".requests",
+    "OrchestrationRequest": ".requests",
+    # Responses
+    "ResearchResponse": ".responses",
+    "ScrapeResponse": ".responses",
+    "DraftResponse": ".responses",
+    "OrchestrationResponse": ".responses",
+    # Common
+    "CarmModel": ".common",
+    "ServiceMetrics": ".common",
+    "ErrorResponse": ".common",
+    "Status": ".common",
+}
+
 __all__ = [
     # Company
     "Company",
@@ -52,6 +103,10 @@ __all__ = [
     "Tool",
     "ToolSettings",
     "ToolExecution",
+    # Scraped records
+    "WebsiteScrape",
+    "LinkedInScrape",
+    "GenericScrape",
     # Requests
     "ResearchRequest",
     "ScrapeRequest",
@@ -63,7 +118,22 @@ __all__ = [
     "DraftResponse",
     "OrchestrationResponse",
     # Common
+    "CarmModel",
     "ServiceMetrics",
     "ErrorResponse",
     "Status",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access and cache the result"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,45 @@
+"""
+Typing helpers shared by the codec modules
+"""
+
+from inspect import isclass
+from typing import Any, Dict, List, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+try:  # Python 3.10+ "X | Y" unions
+    from types import UnionType
+except ImportError:  # pragma: no cover
+    UnionType = Union  # type: ignore[assignment,misc]
+
+try:
+    from typing import Annotated
+except ImportError:  # pragma: no cover
+    from typing_extensions import Annotated
+
+__all__ = ["Annotated", "UnionType", "classify"]
+
+
+def classify(annotation: Any) -> Tuple[str, Any]:
+    """
+    Classify a field annotation for the codecs
+
+    Returns ("model", cls), ("list", item type), ("dict", value type) or
+    ("leaf", None). Optional[X] is treated as X; unions of several types are
+    leaves, since the member cannot be known without validation.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return classify(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return classify(options[0]) if len(options) == 1 else ("leaf", None)
+    if origin in (list, List):
+        args = get_args(annotation)
+        return ("list", args[0]) if args else ("leaf", None)
+    if origin in (dict, Dict):
+        args = get_args(annotation)
+        return ("dict", args[1]) if len(args) == 2 else ("leaf", None)
+    if isclass(annotation) and issubclass(annotation, BaseModel):
+        return ("model", annotation)
+    return ("leaf", None)
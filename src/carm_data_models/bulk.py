@@ -0,0 +1,141 @@
+"""
+Bulk Validation
+
+Validate large lists of models in a single pydantic-core pass.
+
+PSEUDO CODE:
+------------
+1. Keep one cached TypeAdapter per list type (built once per process)
+2. Validate the whole batch at once
+3. On failure, group errors by list index and re-validate only the good items
+4. Optionally split very large batches across a process pool
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from .company import Company
+from .email import EmailDraft
+from .tool import ToolExecution
+
+# Errors for one item, as returned by ValidationError.errors()
+ItemErrors = List[Dict[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def item_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter for a single model"""
+    return TypeAdapter(model)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter for List[model]"""
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+# Adapters for the hot paths, built at import time
+COMPANY_LIST_ADAPTER = list_adapter(Company)
+EMAIL_DRAFT_LIST_ADAPTER = list_adapter(EmailDraft)
+TOOL_EXECUTION_LIST_ADAPTER = list_adapter(ToolExecution)
+
+
+class BulkValidationResult(BaseModel):
+    """
+    Result of validate_many()
+
+    `items` is aligned with the input: position i holds the validated model,
+    or None when item i failed (its errors are in `errors[i]`).
+    """
+    items: List[Any] = Field(default_factory=list, description="Validated models (None on failure)")
+    errors: Dict[int, ItemErrors] = Field(default_factory=dict, description="Errors per input index")
+
+    @property
+    def ok(self) -> bool:
+        """True when every item validated"""
+        return not self.errors
+
+    @property
+    def valid(self) -> List[Any]:
+        """Only the successfully validated models, in input order"""
+        return [item for item in self.items if item is not None]
+
+
+def _group_errors(exc: ValidationError) -> Dict[int, ItemErrors]:
+    """Split list validation errors by item index (loc[0])"""
+    grouped: Dict[int, ItemErrors] = {}
+    for error in exc.errors(include_url=False):
+        loc = error["loc"]
+        if not loc or not isinstance(loc[0], int):
+            # Not an item-level error (e.g. input is not a list at all)
+            raise exc
+        grouped.setdefault(loc[0], []).append({**error, "loc": loc[1:]})
+    return grouped
+
+
+def _validate_chunk(
+    model: Type[BaseModel], items: List[Any], offset: int = 0
+) -> Tuple[List[Any], Dict[int, ItemErrors]]:
+    """Validate one chunk; error indices are shifted by `offset`"""
+    adapter = list_adapter(model)
+    try:
+        return adapter.validate_python(items), {}
+    except ValidationError as exc:
+        errors = _group_errors(exc)
+
+    good = [i for i in range(len(items)) if i not in errors]
+    results: List[Any] = [None] * len(items)
+    for i, value in zip(good, adapter.validate_python([items[i] for i in good])):
+        results[i] = value
+    return results, {offset + i: errs for i, errs in errors.items()}
+
+
+def validate_many(
+    data: Union[bytes, bytearray, str, Iterable[Any]],
+    model: Type[BaseModel] = Company,
+    processes: Optional[int] = None,
+    chunk_size: int = 10_000,
+) -> BulkValidationResult:
+    """
+    Validate a batch of `model` items without stopping at the first failure
+
+    Args:
+        data: JSON array (bytes/str) or any iterable of dicts/models
+        model: Model class of each item
+        processes: Worker processes for very large inputs (None = in-process)
+        chunk_size: Items per worker task when `processes` is set
+
+    Raises:
+        ValueError: If `data` is not a valid JSON array
+    """
+    if isinstance(data, (bytes, bytearray, str)):
+        try:
+            return BulkValidationResult(items=list_adapter(model).validate_json(data))
+        except ValidationError:
+            # Fall back to per-index error reporting below
+            pass
+        data = json.loads(data)
+        if not isinstance(data, list):
+            raise ValueError("Expected a JSON array")
+
+    items = data if isinstance(data, list) else list(data)
+
+    if not processes or len(items) <= chunk_size:
+        results, errors = _validate_chunk(model, items)
+        return BulkValidationResult(items=results, errors=errors)
+
+    result = BulkValidationResult()
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(_validate_chunk, model, items[start:start + chunk_size], start)
+            for start in range(0, len(items), chunk_size)
+        ]
+        for future in futures:
+            chunk_items, chunk_errors = future.result()
+            result.items.extend(chunk_items)
+            result.errors.update(chunk_errors)
+    return result
@@ -2,11 +2,35 @@
 Common/Shared Data Models
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Type, TypeVar
 from pydantic import BaseModel, Field
 from datetime import datetime
 from enum import Enum
 
+ModelT = TypeVar("ModelT", bound="CarmModel")
+
+
+class CarmModel(BaseModel):
+    """
+    Base class for all CarmVisuals models
+
+    Adds the compact binary wire format on top of pydantic's JSON support
+    (see carm_data_models.binary; requires the [binary] extra).
+    """
+
+    def to_bytes(self) -> bytes:
+        """Encode this model in the binary wire format"""
+        from .binary import encode
+
+        return encode(self)
+
+    @classmethod
+    def from_bytes(cls: Type[ModelT], data: bytes) -> ModelT:
+        """Decode a model from the binary wire format"""
+        from .binary import decode
+
+        return decode(cls, data)
+
 
 class Status(str, Enum):
     """Status enumeration"""
@@ -17,7 +41,7 @@ class Status(str, Enum):
     CANCELLED = "cancelled"
 
 
-class ServiceMetrics(BaseModel):
+class ServiceMetrics(CarmModel):
     """
     Service performance metrics
     
@@ -43,7 +67,7 @@ class ServiceMetrics(BaseModel):
         }
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(CarmModel):
     """
     Standard error response
     """
@@ -11,11 +11,13 @@ PSEUDO CODE:
 """
 
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, HttpUrl, EmailStr
+from pydantic import Field
 from datetime import datetime
+from .common import CarmModel
+from .validators import CachedEmailStr, CachedHttpUrl
 
 
-class Address(BaseModel):
+class Address(CarmModel):
     """
     Physical address
     
@@ -39,7 +41,7 @@ class Address(BaseModel):
         }
 
 
-class ContactInfo(BaseModel):
+class ContactInfo(CarmModel):
     """
     Contact information for a company or person
     
@@ -49,12 +51,12 @@ class ContactInfo(BaseModel):
     3. Store social media links
     4. All fields optional since we may not have all info
     """
-    email: Optional[EmailStr] = Field(None, description="Contact email")
+    email: Optional[CachedEmailStr] = Field(None, description="Contact email")
     phone: Optional[str] = Field(None, description="Phone number")
-    website: Optional[HttpUrl] = Field(None, description="Website URL")
-    linkedin: Optional[HttpUrl] = Field(None, description="LinkedIn URL")
-    instagram: Optional[HttpUrl] = Field(None, description="Instagram URL")
-    twitter: Optional[HttpUrl] = Field(None, description="Twitter/X URL")
+    website: Optional[CachedHttpUrl] = Field(None, description="Website URL")
+    linkedin: Optional[CachedHttpUrl] = Field(None, description="LinkedIn URL")
+    instagram: Optional[CachedHttpUrl] = Field(None, description="Instagram URL")
+    twitter: Optional[CachedHttpUrl] = Field(None, description="Twitter/X URL")
     
     class Config:
         json_schema_extra = {
@@ -67,7 +69,7 @@ class ContactInfo(BaseModel):
         }
 
 
-class Company(BaseModel):
+class Company(CarmModel):
     """
     Company entity model
     
@@ -87,7 +89,7 @@ class Company(BaseModel):
     name: str = Field(..., description="Company name", min_length=1)
     
     # Basic info
-    website: Optional[HttpUrl] = Field(None, description="Company website")
+    website: Optional[CachedHttpUrl] = Field(None, description="Company website")
     industry: Optional[str] = Field(None, description="Industry/sector")
     description: Optional[str] = Field(None, description="Company description")
     
@@ -132,7 +134,7 @@ class Company(BaseModel):
         }
 
 
-class AzureConfig(BaseModel):
+class AzureConfig(CarmModel):
     """
     Azure infrastructure configuration for a company
 
@@ -169,7 +171,7 @@ class AzureConfig(BaseModel):
         }
 
 
-class CompanyProfile(BaseModel):
+class CompanyProfile(CarmModel):
     """
     Full company profile with detailed information
 
@@ -9,13 +9,19 @@ PSEUDO CODE:
 4. Add validation for email addresses
 """
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field, EmailStr
+from typing import Optional, Dict, Any, List, Iterable, TYPE_CHECKING
+from pydantic import Field, PrivateAttr
 from datetime import datetime
+from .common import CarmModel
 from .company import Company
+from .validators import CachedEmailStr
 
+if TYPE_CHECKING:
+    from .company import CompanyProfile
+    from .templating import CompiledTemplate, Overrides, RenderBatchResult
 
-class EmailDraft(BaseModel):
+
+class EmailDraft(CarmModel):
     """
     Email draft model
     
@@ -35,7 +41,7 @@ class EmailDraft(BaseModel):
     preview_text: Optional[str] = Field(None, description="Preview text (for email clients)")
     
     # Recipient info
-    recipient_email: EmailStr = Field(..., description="Recipient email address")
+    recipient_email: CachedEmailStr = Field(..., description="Recipient email address")
     recipient_name: Optional[str] = Field(None, description="Recipient name")
     
     # Company context
@@ -83,7 +89,7 @@ class EmailDraft(BaseModel):
         }
 
 
-class EmailTemplate(BaseModel):
+class EmailTemplate(CarmModel):
     """
     Reusable email template
     
@@ -118,6 +124,32 @@ class EmailTemplate(BaseModel):
     created_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = Field(default_factory=datetime.utcnow)
     usage_count: Optional[int] = Field(0, description="How many times used")
+
+    # Compiled form, rebuilt when the template content changes
+    _compiled: Optional["CompiledTemplate"] = PrivateAttr(default=None)
+
+    def compile(self) -> "CompiledTemplate":
+        """
+        Parse and verify placeholders once; the result is cached on this template
+
+        Raises:
+            TemplateError: If a placeholder is not declared in
+                required_variables / optional_variables
+        """
+        from .templating import CompiledTemplate, compile_key
+
+        if self._compiled is None or self._compiled.key != compile_key(self):
+            self._compiled = CompiledTemplate(self)
+        return self._compiled
+
+    def render_batch(
+        self,
+        companies: Iterable[Company],
+        sender_profile: Optional["CompanyProfile"] = None,
+        overrides: "Overrides" = None,
+    ) -> "RenderBatchResult":
+        """Render one EmailDraft per company (see CompiledTemplate.render_batch)"""
+        return self.compile().render_batch(companies, sender_profile, overrides)
     
     class Config:
         json_schema_extra = {
@@ -135,7 +167,7 @@ class EmailTemplate(BaseModel):
         }
 
 
-class Message(BaseModel):
+class Message(CarmModel):
     """
     Generic message model
     
@@ -0,0 +1,288 @@
+"""
+Orchestration Task Events
+
+Delta updates for a long-running orchestration task, so clients receive
+only what is new instead of re-downloading the whole OrchestrationResponse
+on every poll.
+
+PSEUDO CODE:
+------------
+1. The orchestrator records every change as a typed event
+   (research result added, scrape finished, draft produced, step
+   completed, error, status changed) with the task_id and the next
+   sequence number (1, 2, 3, ...)
+2. TaskEventLog keeps the events; since(seq) returns the ones after seq
+3. TaskReducer folds events into an OrchestrationResponse in place:
+   items are appended, so applying an event costs O(1) however large the
+   response already is
+4. A client keeps a reducer, polls with reducer.seq and applies what it
+   gets; duplicates are ignored, gaps raise EventSequenceError
+5. Folding all events gives the same response as the snapshot
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Type, Union, cast
+
+from pydantic import Field, TypeAdapter
+
+from ._compat import Annotated
+from .common import CarmModel
+from .company import Company
+from .email import EmailDraft
+from .payloads import ScrapedData
+from .responses import OrchestrationResponse
+
+
+class EventSequenceError(ValueError):
+    """Raised when events are missing between the reducer's position and a new event"""
+
+
+class TaskEvent(CarmModel):
+    """Fields shared by every task event"""
+    task_id: str = Field(..., description="Task the event belongs to")
+    seq: int = Field(..., description="Position in the task's event stream (from 1)", ge=1)
+    timestamp: datetime = Field(default_factory=datetime.utcnow, description="When it happened")
+
+
+class ResearchResultAdded(TaskEvent):
+    """The research step found a company"""
+    type: Literal["research_result"] = "research_result"
+    company: Company = Field(..., description="Found company")
+
+
+class ScrapeFinished(TaskEvent):
+    """One scrape finished"""
+    type: Literal["scrape_finished"] = "scrape_finished"
+    record: ScrapedData = Field(..., description="Scraped record")
+
+
+class DraftProduced(TaskEvent):
+    """The draft step produced an email"""
+    type: Literal["draft_produced"] = "draft_produced"
+    draft: EmailDraft = Field(..., description="Email draft")
+
+
+class StepCompleted(TaskEvent):
+    """A workflow step finished"""
+    type: Literal["step_completed"] = "step_completed"
+    step: str = Field(..., description="Step name (research, scrape, draft, ...)")
+    duration_seconds: float = Field(..., description="How long the step took", ge=0)
+
+
+class TaskErrorOccurred(TaskEvent):
+    """Something went wrong (the task may continue)"""
+    type: Literal["error"] = "error"
+    error: str = Field(..., description="Error message")
+    step: Optional[str] = Field(None, description="Step that failed")
+
+
+class StatusChanged(TaskEvent):
+    """The task changed status"""
+    type: Literal["status"] = "status"
+    status: str = Field(..., description="New task status")
+    total_duration_seconds: Optional[float] = Field(
+        None, description="Total workflow duration so far", ge=0
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_id": "task-42",
+                "seq": 17,
+                "type": "status",
+                "status": "completed",
+                "total_duration_seconds": 19.0,
+            }
+        }
+
+
+AnyTaskEvent = Annotated[
+    Union[
+        ResearchResultAdded,
+        ScrapeFinished,
+        DraftProduced,
+        StepCompleted,
+        TaskErrorOccurred,
+        StatusChanged,
+    ],
+    Field(discriminator="type"),
+]
+
+EVENT_ADAPTER: TypeAdapter = TypeAdapter(AnyTaskEvent)
+EVENTS_ADAPTER: TypeAdapter = TypeAdapter(List[AnyTaskEvent])
+
+
+def parse_event(data: Union[str, bytes, Dict[str, Any]]) -> TaskEvent:
+    """Validate one event from JSON or a dict into its event class"""
+    if isinstance(data, dict):
+        return cast(TaskEvent, EVENT_ADAPTER.validate_python(data))
+    return cast(TaskEvent, EVENT_ADAPTER.validate_json(data))
+
+
+def parse_events(data: Union[str, bytes]) -> List[TaskEvent]:
+    """Validate a JSON array of events (e.g. from TaskEventLog.since_json())"""
+    return cast(List[TaskEvent], EVENTS_ADAPTER.validate_json(data))
+
+
+# ============================================================================
+# Reducer
+# ============================================================================
+
+
+class TaskReducer:
+    """
+    Folds a task's events into an OrchestrationResponse
+
+    Usage:
+        reducer = TaskReducer("task-42")
+        reducer.apply_all(poll(task_id, since=reducer.seq))
+        reducer.response  # up to date
+
+    The response is updated in place; copy it before handing it to code
+    that should not see later events.
+    """
+
+    def __init__(self, task_id: str, response: Optional[OrchestrationResponse] = None,
+                 seq: int = 0) -> None:
+        if response is not None and response.task_id != task_id:
+            raise ValueError(f"Response belongs to task {response.task_id!r}, not {task_id!r}")
+        self.task_id = task_id
+        self.seq = seq
+        if response is None:
+            response = OrchestrationResponse(
+                task_id=task_id, status="pending", total_duration_seconds=0.0
+            )
+        self.response = response
+
+    def apply(self, event: TaskEvent) -> bool:
+        """
+        Apply one event; returns False if it was already applied
+
+        Raises:
+            ValueError: If the event belongs to another task
+            EventSequenceError: If earlier events are missing
+        """
+        if event.task_id != self.task_id:
+            raise ValueError(f"Event for task {event.task_id!r} applied to {self.task_id!r}")
+        if event.seq <= self.seq:
+            return False
+        if event.seq != self.seq + 1:
+            raise EventSequenceError(
+                f"Task {self.task_id!r}: expected event {self.seq + 1}, got {event.seq}"
+            )
+        _APPLY[type(event)](self.response, event)
+        self.seq = event.seq
+        return True
+
+    def apply_all(self, events: Iterable[TaskEvent]) -> int:
+        """Apply events in order; returns how many were new"""
+        return sum(self.apply(event) for event in events)
+
+
+def _append(response: OrchestrationResponse, field: str, item: Any) -> None:
+    items = getattr(response, field)
+    if items is None:
+        setattr(response, field, [item])
+    else:
+        items.append(item)
+
+
+def _step_completed(response: OrchestrationResponse, event: StepCompleted) -> None:
+    if response.step_durations is None:
+        response.step_durations = {}
+    response.step_durations[event.step] = event.duration_seconds
+
+
+def _error(response: OrchestrationResponse, event: TaskErrorOccurred) -> None:
+    _append(response, "errors", f"{event.step}: {event.error}" if event.step else event.error)
+
+
+def _status(response: OrchestrationResponse, event: StatusChanged) -> None:
+    response.status = event.status
+    if event.total_duration_seconds is not None:
+        response.total_duration_seconds = event.total_duration_seconds
+
+
+_APPLY: Dict[Type[TaskEvent], Callable[[OrchestrationResponse, Any], None]] = {
+    ResearchResultAdded: lambda r, e: _append(r, "research_results", e.company),
+    ScrapeFinished: lambda r, e: _append(r, "scraped_data", e.record),
+    DraftProduced: lambda r, e: _append(r, "drafts", e.draft),
+    StepCompleted: _step_completed,
+    TaskErrorOccurred: _error,
+    StatusChanged: _status,
+}
+
+
+def reduce_events(task_id: str, events: Iterable[TaskEvent]) -> OrchestrationResponse:
+    """OrchestrationResponse built from a task's complete event stream"""
+    reducer = TaskReducer(task_id)
+    reducer.apply_all(events)
+    return reducer.response
+
+
+# ============================================================================
+# Producer side
+# ============================================================================
+
+
+class TaskEventLog:
+    """
+    Event stream of one task, as kept by the orchestrator
+
+    Each helper creates the event with the next sequence number, records it
+    and folds it into the response that `snapshot` copies. Thread-safe.
+    """
+
+    def __init__(self, task_id: str) -> None:
+        self.task_id = task_id
+        self.events: List[TaskEvent] = []
+        self._reducer = TaskReducer(task_id)
+        self._lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the latest event (0 before the first one)"""
+        return self._reducer.seq
+
+    @property
+    def snapshot(self) -> OrchestrationResponse:
+        """Copy of the full response as of the latest event"""
+        with self._lock:
+            return self._reducer.response.model_copy(deep=True)
+
+    def _emit(self, event_cls: type, **fields: Any) -> TaskEvent:
+        with self._lock:
+            event = cast(TaskEvent, event_cls(task_id=self.task_id, seq=self.seq + 1, **fields))
+            self._reducer.apply(event)
+            self.events.append(event)
+            return event
+
+    def research_result(self, company: Union[Company, Dict[str, Any]]) -> TaskEvent:
+        return self._emit(ResearchResultAdded, company=company)
+
+    def scrape_finished(self, record: Any) -> TaskEvent:
+        return self._emit(ScrapeFinished, record=record)
+
+    def draft_produced(self, draft: Union[EmailDraft, Dict[str, Any]]) -> TaskEvent:
+        return self._emit(DraftProduced, draft=draft)
+
+    def step_completed(self, step: str, duration_seconds: float) -> TaskEvent:
+        return self._emit(StepCompleted, step=step, duration_seconds=duration_seconds)
+
+    def error(self, error: str, step: Optional[str] = None) -> TaskEvent:
+        return self._emit(TaskErrorOccurred, error=error, step=step)
+
+    def status(self, status: str, total_duration_seconds: Optional[float] = None) -> TaskEvent:
+        return self._emit(
+            StatusChanged, status=status, total_duration_seconds=total_duration_seconds
+        )
+
+    def since(self, seq: int = 0) -> List[TaskEvent]:
+        """Events after sequence number `seq` (what a client at `seq` is missing)"""
+        with self._lock:
+            return self.events[max(seq, 0):]
+
+    def since_json(self, seq: int = 0) -> bytes:
+        """since() encoded as a JSON array, ready to send"""
+        return EVENTS_ADAPTER.dump_json(self.since(seq))
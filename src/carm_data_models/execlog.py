@@ -0,0 +1,433 @@
+"""
+Tool Execution Log
+
+High-volume, append-only log of ToolExecution records with rollups.
+
+File format:
+------------
+executions-<start time>-<pid>-<n>.ndjson.gz: a gzip file made of one gzip
+member per block, each holding NDJSON lines (one ToolExecution each), so
+standard tools (zcat, gzip.open) can read it.
+
+PSEUDO CODE:
+------------
+1. write() encodes the record and appends it to the current block
+   (in memory, no I/O)
+2. A block is sealed when it reaches max_block_records / max_block_bytes,
+   or when it is older than flush_interval
+3. Sealed blocks (including stale ones sealed by the background thread)
+   go through one queue to a background thread that compresses and
+   appends them (and rolls over to a new file at max_file_bytes), so
+   flush() returning means every block is on disk
+4. Backpressure: when max_pending_blocks are waiting, write() blocks
+   (or raises ExecutionLogFull after `timeout`), so memory stays bounded
+   by about (max_pending_blocks + 1) * max_block_bytes
+5. Readers decode lines to plain dicts and fold them into per-key rollups
+   (count, failures, duration histogram) without building models;
+   a partially written last block (after a crash) is skipped; timestamps
+   are compared in UTC (naive ones are taken as UTC)
+"""
+
+import gzip
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pydantic import Field
+from pydantic_core import from_json
+
+from .common import CarmModel
+from .metrics import MIN_VALUE, LatencyHistogram, _bucket
+from .tool import ToolExecution
+from .trusted import _parse_datetime
+
+logger = logging.getLogger(__name__)
+
+FILE_PATTERN = "executions-*.ndjson.gz"
+
+# Statuses counted as failures (in addition to any record with an error_message)
+FAILED_STATUSES = frozenset({"failed", "error", "timeout", "cancelled"})
+
+PathLike = Union[str, Path]
+RollupKey = Union[str, Sequence[str]]
+
+
+class ExecutionLogFull(RuntimeError):
+    """Raised when a write times out waiting for the background writer"""
+
+
+# ============================================================================
+# Writer
+# ============================================================================
+
+
+class ExecutionLogWriter:
+    """
+    Buffered, compressed writer for ToolExecution records
+
+    Usage:
+        with ExecutionLogWriter("/var/log/carm/executions") as log:
+            log.write(execution)          # cheap: encode + append to a buffer
+
+    Thread-safe. Records in one block keep their write order; blocks sealed
+    concurrently by different threads may be written in either order.
+    """
+
+    def __init__(
+        self,
+        directory: PathLike,
+        max_block_records: int = 1000,
+        max_block_bytes: int = 1024 * 1024,
+        flush_interval: float = 1.0,
+        max_pending_blocks: int = 8,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        compresslevel: int = 6,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_block_records = max_block_records
+        self.max_block_bytes = max_block_bytes
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.compresslevel = compresslevel
+        self.fsync = fsync
+
+        # Counters
+        self.records_written = 0
+        self.blocks_written = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.backpressure_waits = 0
+
+        self._lines: List[bytes] = []
+        self._size = 0
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+        self.max_pending_blocks = max_pending_blocks
+        # Producers take a slot per queued block; the writer frees it on dequeue.
+        # Stale blocks sealed by the writer itself need no slot (it cannot wait on itself).
+        self._slots = threading.BoundedSemaphore(max_pending_blocks)
+        self._queue: "queue.Queue[Optional[Tuple[bytes, int, bool]]]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._file_index = 0
+        self._file_prefix = f"executions-{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self._file: Optional[IO[bytes]] = None
+        self._file_size = 0
+        self._thread = threading.Thread(target=self._run, name="execution-log", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def write(
+        self, execution: Union[ToolExecution, Dict[str, Any]], timeout: Optional[float] = None
+    ) -> None:
+        """
+        Add one record (a ToolExecution, or a dict validated as one)
+
+        Blocks while the background writer is max_pending_blocks behind;
+        with `timeout`, raises ExecutionLogFull instead of waiting longer.
+        """
+        if not isinstance(execution, ToolExecution):
+            execution = ToolExecution.model_validate(execution)
+        self.write_line(execution.model_dump_json().encode(), timeout)
+
+    def write_line(self, line: bytes, timeout: Optional[float] = None) -> None:
+        """Add an already-encoded ToolExecution JSON line (without newline)"""
+        self._check()
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+            self._lines.append(line)
+            self._size += len(line) + 1
+            full = len(self._lines) >= self.max_block_records or self._size >= self.max_block_bytes
+            block = self._seal() if full else None
+        if block is not None:
+            self._enqueue(block, timeout)
+
+    def _seal(self) -> Optional[Tuple[bytes, int]]:
+        """Take the current buffer as a block (caller holds the lock)"""
+        if not self._lines:
+            return None
+        block = (b"\n".join(self._lines) + b"\n", len(self._lines))
+        self._lines, self._size, self._started = [], 0, None
+        return block
+
+    def _enqueue(self, block: Tuple[bytes, int], timeout: Optional[float]) -> None:
+        if not self._slots.acquire(blocking=False):
+            self.backpressure_waits += 1
+            if not self._slots.acquire(timeout=timeout):
+                raise ExecutionLogFull(
+                    f"Execution log writer is {self.max_pending_blocks} blocks behind"
+                )
+        self._queue.put((*block, True))
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Hand the current buffer to the writer and wait until everything is on disk"""
+        self._check()
+        with self._lock:
+            block = self._seal()
+        if block is not None:
+            self._enqueue(block, timeout)
+        self._queue.join()
+        self._check()
+
+    def close(self) -> None:
+        """Flush, stop the background thread and close the current file"""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "ExecutionLogWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Execution log writer failed") from self._error
+        if self._closed:
+            raise ValueError("Execution log writer is closed")
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                block = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_if_stale()
+                continue
+            try:
+                if block is None:
+                    return
+                data, records, holds_slot = block
+                if holds_slot:
+                    self._slots.release()
+                self._write_block(data, records)
+            except BaseException as exc:  # surfaced to producers by _check()
+                self._error = exc
+            finally:
+                self._queue.task_done()
+
+    def _flush_if_stale(self) -> None:
+        with self._lock:
+            stale = (
+                self._started is not None
+                and time.monotonic() - self._started >= self.flush_interval
+            )
+            block = self._seal() if stale else None
+        if block is not None:
+            # Queued (not written here) so that a concurrent flush() waits for it
+            self._queue.put((*block, False))
+
+    def _write_block(self, data: bytes, records: int) -> None:
+        compressed = gzip.compress(data, compresslevel=self.compresslevel, mtime=0)
+        if self._file is None or self._file_size >= self.max_file_bytes:
+            self._roll()
+        assert self._file is not None
+        self._file.write(compressed)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._file_size += len(compressed)
+        self.records_written += records
+        self.blocks_written += 1
+        self.raw_bytes += len(data)
+        self.compressed_bytes += len(compressed)
+
+    def _roll(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file_index += 1
+        path = self.directory / f"{self._file_prefix}-{self._file_index:05d}.ndjson.gz"
+        self._file = open(path, "ab")
+        self._file_size = 0
+
+
+# ============================================================================
+# Reader
+# ============================================================================
+
+
+def log_files(path: PathLike) -> List[Path]:
+    """Log files in a directory (oldest first), or the given file"""
+    path = Path(path)
+    return sorted(path.glob(FILE_PATTERN)) if path.is_dir() else [path]
+
+
+def iter_rows(path: PathLike) -> Iterator[Dict[str, Any]]:
+    """
+    Raw records (plain dicts, datetimes as ISO strings) from a file or directory
+
+    A truncated last block, e.g. from a crash during a write, is skipped.
+    """
+    for file in log_files(path):
+        with gzip.open(file, "rb") as fp:
+            try:
+                for line in fp:
+                    if line.strip():
+                        yield from_json(line)
+            except (EOFError, OSError, zlib.error, ValueError) as exc:
+                logger.warning("Skipping unreadable tail of %s: %s", file, exc)
+
+
+def iter_executions(path: PathLike) -> Iterator[ToolExecution]:
+    """Validated ToolExecution models from a file or directory"""
+    for row in iter_rows(path):
+        yield ToolExecution.model_validate(row)
+
+
+class ExecutionRollup(CarmModel):
+    """Aggregate of many tool executions"""
+    count: int = Field(0, description="Executions")
+    failed: int = Field(0, description="Failed executions")
+    unfinished: int = Field(0, description="Executions without completed_at")
+    durations: LatencyHistogram = Field(
+        default_factory=LatencyHistogram, description="Durations of finished executions"
+    )
+    first_started_at: Optional[datetime] = Field(None, description="Earliest started_at (UTC)")
+    last_started_at: Optional[datetime] = Field(None, description="Latest started_at (UTC)")
+
+    @property
+    def failure_rate(self) -> Optional[float]:
+        return self.failed / self.count if self.count else None
+
+    def merge(self, other: "ExecutionRollup") -> "ExecutionRollup":
+        """New rollup holding both (e.g. from several hosts)"""
+        starts = [v for v in map(_utc, (self.first_started_at, other.first_started_at)) if v]
+        ends = [v for v in map(_utc, (self.last_started_at, other.last_started_at)) if v]
+        return ExecutionRollup(
+            count=self.count + other.count,
+            failed=self.failed + other.failed,
+            unfinished=self.unfinished + other.unfinished,
+            durations=self.durations.merge(other.durations),
+            first_started_at=min(starts) if starts else None,
+            last_started_at=max(ends) if ends else None,
+        )
+
+
+def _utc(value: Union[str, datetime, None]) -> Optional[datetime]:
+    """Aware UTC datetime from an ISO string or datetime (naive means UTC)"""
+    parsed = _parse_datetime(value) if isinstance(value, str) else value
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+class _Accumulator:
+    """Plain-Python counters for one rollup key (no model overhead per row)"""
+    __slots__ = ("count", "failed", "unfinished", "buckets", "zero", "total", "low", "high",
+                 "first", "last")
+
+    def __init__(self) -> None:
+        self.count = self.failed = self.unfinished = self.zero = 0
+        self.buckets: Dict[int, int] = {}
+        self.total = 0.0
+        self.low: Optional[float] = None
+        self.high: Optional[float] = None
+        self.first: Optional[datetime] = None
+        self.last: Optional[datetime] = None
+
+    def add(self, row: Dict[str, Any]) -> None:
+        self.count += 1
+        status = row.get("status")
+        failed_status = isinstance(status, str) and status.lower() in FAILED_STATUSES
+        if failed_status or row.get("error_message"):
+            self.failed += 1
+        started = _utc(row.get("started_at"))
+        if started is not None:
+            if self.first is None or started < self.first:
+                self.first = started
+            if self.last is None or started > self.last:
+                self.last = started
+        completed = _utc(row.get("completed_at"))
+        if completed is None:
+            self.unfinished += 1
+            return
+        if started is None:
+            return
+        seconds = max((completed - started).total_seconds(), 0.0)
+        if seconds < MIN_VALUE:
+            self.zero += 1
+        else:
+            index = _bucket(seconds)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.total += seconds
+        self.low = seconds if self.low is None or seconds < self.low else self.low
+        self.high = seconds if self.high is None or seconds > self.high else self.high
+
+    def result(self) -> ExecutionRollup:
+        durations = LatencyHistogram(
+            counts=self.buckets,
+            zero_count=self.zero,
+            count=self.zero + sum(self.buckets.values()),
+            total=self.total,
+            min=self.low,
+            max=self.high,
+        )
+        return ExecutionRollup(
+            count=self.count,
+            failed=self.failed,
+            unfinished=self.unfinished,
+            durations=durations,
+            first_started_at=self.first,
+            last_started_at=self.last,
+        )
+
+
+def rollup(
+    path: PathLike,
+    by: RollupKey = "tool_id",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Dict[Any, ExecutionRollup]:
+    """
+    Per-key rollups of a log file or directory
+
+    Args:
+        path: Log file or directory written by ExecutionLogWriter
+        by: "tool_id", "user_id" or a sequence of fields, e.g.
+            ("tool_id", "user_id"); sequences give tuple keys
+        since / until: Only executions started in [since, until)
+            (naive datetimes are taken as UTC)
+    """
+    fields = (by,) if isinstance(by, str) else tuple(by)
+    single = fields[0] if len(fields) == 1 else None
+    since, until = _utc(since), _utc(until)
+    accumulators: Dict[Any, _Accumulator] = {}
+    for row in iter_rows(path):
+        if since is not None or until is not None:
+            started = _utc(row.get("started_at"))
+            if started is None or (since is not None and started < since) or (
+                until is not None and started >= until
+            ):
+                continue
+        key = row.get(single) if single is not None else tuple(row.get(f) for f in fields)
+        accumulator = accumulators.get(key)
+        if accumulator is None:
+            accumulator = accumulators[key] = _Accumulator()
+        accumulator.add(row)
+    return {key: accumulator.result() for key, accumulator in accumulators.items()}
@@ -0,0 +1,373 @@
+"""
+Request Fingerprints and Result Cache
+
+Stable content fingerprints for ResearchRequest, ScrapeRequest,
+DraftRequest and Company (or any model), and a result cache keyed by
+them, so identical research / scrape work against paid APIs runs once.
+
+PSEUDO CODE:
+------------
+1. canonical(model): dump to JSON-mode data without fields that hold
+   their default value, turn integral floats into ints, encode with
+   sorted keys and no whitespace
+   -> {"criteria": "x"} and {"criteria": "x", "max_results": 10} match,
+      as do filters with the same keys in a different order
+2. fingerprint(model) = SHA-256 of (format version, class name, canonical
+   bytes): the same across processes, machines and Python versions
+3. ResultCache maps fingerprint(request) -> the response's JSON, held by
+   a pluggable backend:
+   - MemoryBackend: LRU bounded by entry count and total bytes
+   - DiskBackend: one file per entry, bounded by total bytes, least
+     recently used files removed first; shareable between processes
+4. get_or_compute(request, ResponseType, compute) returns the cached
+   response or runs compute() and stores its result
+
+List order is kept (it can matter, e.g. the order of `sources`).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, Field, ValidationError
+
+from .common import ServiceMetrics
+from .metrics import record_cache_counters
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+# Bump when canonical() changes, so old cache entries stop matching
+FINGERPRINT_VERSION = 1
+
+
+# ============================================================================
+# Fingerprints
+# ============================================================================
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def canonical(model: BaseModel) -> bytes:
+    """
+    Canonical JSON encoding of a model's content
+
+    Insensitive to dict key order, to fields left at (or explicitly set to)
+    their default, and to 1 vs 1.0.
+    """
+    data = _normalize(model.model_dump(mode="json", exclude_defaults=True))
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def fingerprint(model: BaseModel) -> str:
+    """Hex SHA-256 of the model class name and its canonical content"""
+    digest = hashlib.sha256(f"{FINGERPRINT_VERSION}:{type(model).__name__}:".encode())
+    digest.update(canonical(model))
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class ResultBackend(Protocol):
+    """Bytes stored under fingerprint keys, as used by ResultCache"""
+
+    nbytes: int
+    evictions: int
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    """In-process LRU bounded by entry count and total value size"""
+
+    def __init__(self, max_entries: int = 10_000, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            self._entries[key] = value
+            self.nbytes += len(value)
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.nbytes -= len(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskBackend:
+    """
+    One file per entry under `directory`, bounded by total size
+
+    Files are written atomically and their mtime is bumped on every read,
+    so the least recently used ones are removed first. Several processes
+    may share a directory; each bounds the files it knows about (those
+    found at start-up plus those it has read or written since).
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.evictions = 0
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._scan()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _scan(self) -> None:
+        found = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._sizes[key] = size
+            self.nbytes += size
+        with self._lock:
+            self._evict()
+
+    def _track(self, key: str, size: int) -> None:
+        """Record a file's size as most recently used (caller holds the lock)"""
+        self.nbytes += size - self._sizes.pop(key, 0)
+        self._sizes[key] = size
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self.nbytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            value = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.nbytes -= self._sizes.pop(key, 0)
+            return None
+        with self._lock:
+            self._track(key, len(value))
+            self._evict()
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(value)
+        os.replace(tmp, path)
+        with self._lock:
+            self._track(key, len(value))
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.nbytes -= self._sizes.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = list(self._sizes)
+            self._sizes.clear()
+            self.nbytes = 0
+        for key in keys:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+
+# ============================================================================
+# Result cache
+# ============================================================================
+
+
+class ResultCacheStats(BaseModel):
+    """Counters of a ResultCache"""
+    hits: int = Field(0, description="Lookups answered from the cache")
+    misses: int = Field(0, description="Lookups with no (usable) entry")
+    stores: int = Field(0, description="Responses stored")
+    evictions: int = Field(0, description="Entries removed by the backend for space")
+    entries: int = Field(0, description="Entries currently held")
+    nbytes: int = Field(0, description="Total size of the held entries")
+
+
+class ResultCache:
+    """
+    Request fingerprint -> response, on a pluggable backend
+
+    Usage:
+        cache = ResultCache(DiskBackend("/var/cache/carm/research"))
+        response = cache.get_or_compute(request, ResearchResponse, run_research)
+
+    Entries that no longer validate against the response model (after a
+    model change) are dropped and treated as misses.
+    """
+
+    def __init__(self, backend: Optional[ResultBackend] = None) -> None:
+        self.backend: ResultBackend = backend if backend is not None else MemoryBackend()
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def get(self, request: BaseModel, response_type: Type[ResponseT]) -> Optional[ResponseT]:
+        """Cached response for a request, or None"""
+        key = fingerprint(request)
+        data = self.backend.get(key)
+        if data is not None:
+            try:
+                response = response_type.model_validate_json(data)
+            except ValidationError:
+                self.backend.delete(key)
+            else:
+                self._count(True)
+                return response
+        self._count(False)
+        return None
+
+    def put(self, request: BaseModel, response: BaseModel) -> str:
+        """Store a response; returns the request's fingerprint"""
+        key = fingerprint(request)
+        self.backend.set(key, response.model_dump_json().encode())
+        with self._lock:
+            self._stores += 1
+        return key
+
+    def invalidate(self, request: BaseModel) -> None:
+        self.backend.delete(fingerprint(request))
+
+    def get_or_compute(
+        self,
+        request: BaseModel,
+        response_type: Type[ResponseT],
+        compute: Callable[[Any], ResponseT],
+    ) -> ResponseT:
+        """Cached response, or compute(request) stored for next time"""
+        response = self.get(request, response_type)
+        if response is None:
+            response = compute(request)
+            self.put(request, response)
+        return response
+
+    async def aget_or_compute(
+        self,
+        request: BaseModel,
+        response_type: Type[ResponseT],
+        compute: Callable[[Any], Awaitable[ResponseT]],
+    ) -> ResponseT:
+        """get_or_compute() with an async compute function"""
+        response = self.get(request, response_type)
+        if response is None:
+            response = await compute(request)
+            self.put(request, response)
+        return response
+
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self.backend.evictions,
+                entries=len(self.backend),
+                nbytes=self.backend.nbytes,
+            )
+
+    def cache_counters(self) -> Tuple[int, int]:
+        """(hits, misses) so far"""
+        with self._lock:
+            return self._hits, self._misses
+
+    def record_metrics(self, metrics: ServiceMetrics, since: Tuple[int, int] = (0, 0)) -> None:
+        """Add the hits and misses since `since` (an earlier cache_counters())"""
+        record_cache_counters(metrics, self.cache_counters(), since)
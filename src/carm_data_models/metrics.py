@@ -0,0 +1,233 @@
+"""
+Metrics Aggregation Models
+
+Mergeable aggregates of ServiceMetrics and step durations, so worker shards
+can combine results and p50/p95/p99 can be computed across thousands of
+runs without keeping every sample.
+
+PSEUDO CODE:
+------------
+1. LatencyHistogram: log-spaced buckets (1% relative error), sparse counts
+2. Bucket layout is fixed, so merging two histograms = adding counts
+   (associative and commutative, any shard order gives the same result)
+3. MetricsAggregate: one histogram for run durations, one per step,
+   plus summed tokens / cost / requests / cache counters
+4. record_cache_counters(): adds a cache's (hits, misses) to a
+   ServiceMetrics; every cache exposes cache_counters() for it
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple, TypeVar
+
+from pydantic import Field
+
+from .common import CarmModel, ServiceMetrics
+
+# Bucket i covers (MIN_VALUE * GAMMA**(i-1), MIN_VALUE * GAMMA**i]
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+MIN_VALUE = 1e-6  # seconds; smaller values are counted in `zero_count`
+MAX_BUCKET = math.ceil(math.log(1e7 / MIN_VALUE, GAMMA))  # ~115 days, ~1.2k buckets max
+
+_LOG_GAMMA = math.log(GAMMA)
+
+
+def _bucket(value: float) -> int:
+    return min(max(math.ceil(math.log(value / MIN_VALUE) / _LOG_GAMMA), 1), MAX_BUCKET)
+
+
+def _bucket_value(index: int) -> float:
+    """Representative value of a bucket (within RELATIVE_ACCURACY of any member)"""
+    return MIN_VALUE * 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class LatencyHistogram(CarmModel):
+    """
+    Fixed-memory duration histogram
+
+    Quantiles are accurate to within 1% of the true value.
+    """
+    counts: Dict[int, int] = Field(default_factory=dict, description="Sample count per bucket")
+    zero_count: int = Field(0, description="Samples below the smallest bucket")
+    count: int = Field(0, description="Total samples")
+    total: float = Field(0.0, description="Sum of all samples")
+    min: Optional[float] = Field(None, description="Smallest sample")
+    max: Optional[float] = Field(None, description="Largest sample")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "counts": {"1379": 3, "1384": 1},
+                "zero_count": 0,
+                "count": 4,
+                "total": 4.2,
+                "min": 0.98,
+                "max": 1.07
+            }
+        }
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record `count` samples of `value` seconds"""
+        if value < 0:
+            raise ValueError("Durations cannot be negative")
+        if value < MIN_VALUE:
+            self.zero_count += count
+        else:
+            index = _bucket(value)
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """New histogram holding the samples of both"""
+        counts = dict(self.counts)
+        for index, n in other.counts.items():
+            counts[index] = counts.get(index, 0) + n
+        mins = [v for v in (self.min, other.min) if v is not None]
+        maxs = [v for v in (self.max, other.max) if v is not None]
+        return LatencyHistogram(
+            counts=counts,
+            zero_count=self.zero_count + other.zero_count,
+            count=self.count + other.count,
+            total=self.total + other.total,
+            min=min(mins) if mins else None,
+            max=max(maxs) if maxs else None,
+        )
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1); None when empty"""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen > rank:
+                # Clamp to the exact extremes we know
+                return min(max(_bucket_value(index), self.min or 0.0), self.max or 0.0)
+        return self.max
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """p50 / p95 / p99"""
+        return {"p50": self.quantile(0.5), "p95": self.quantile(0.95), "p99": self.quantile(0.99)}
+
+
+NumberT = TypeVar("NumberT", int, float)
+
+
+def _add_optional(a: Optional[NumberT], b: Optional[NumberT]) -> Optional[NumberT]:
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a + b
+
+
+def record_cache_counters(
+    metrics: ServiceMetrics,
+    counters: Tuple[int, int],
+    since: Tuple[int, int] = (0, 0),
+) -> None:
+    """
+    Add cache hits and misses to ServiceMetrics.cache_hits / cache_misses
+
+    Args:
+        metrics: Metrics of the current run (updated in place)
+        counters: (hits, misses) now, from a cache's cache_counters()
+        since: (hits, misses) taken at the start of the run, so only the
+            lookups made during the run are counted
+    """
+    metrics.cache_hits = (metrics.cache_hits or 0) + counters[0] - since[0]
+    metrics.cache_misses = (metrics.cache_misses or 0) + counters[1] - since[1]
+
+
+class MetricsAggregate(CarmModel):
+    """
+    Aggregate of many runs' ServiceMetrics and step durations
+
+    Usage:
+        shard = MetricsAggregate()
+        for response in responses:
+            shard.add_metrics(response.metrics)
+        total = MetricsAggregate.merge_all(shards)
+        total.duration.percentiles()
+    """
+    runs: int = Field(0, description="Number of ServiceMetrics ingested")
+    duration: LatencyHistogram = Field(default_factory=LatencyHistogram, description="Run durations")
+    steps: Dict[str, LatencyHistogram] = Field(
+        default_factory=dict,
+        description="Durations per workflow step (from step_durations)"
+    )
+    tokens_used: Optional[int] = Field(None, description="Total LLM tokens used")
+    estimated_cost: Optional[float] = Field(None, description="Total estimated cost in USD")
+    requests_made: Optional[int] = Field(None, description="Total API requests")
+    cache_hits: Optional[int] = Field(None, description="Total cache hits")
+    cache_misses: Optional[int] = Field(None, description="Total cache misses")
+
+    def add_metrics(self, metrics: ServiceMetrics) -> None:
+        """Ingest one ServiceMetrics"""
+        self.runs += 1
+        self.duration.add(metrics.duration_seconds)
+        self.tokens_used = _add_optional(self.tokens_used, metrics.tokens_used)
+        self.estimated_cost = _add_optional(self.estimated_cost, metrics.estimated_cost)
+        self.requests_made = _add_optional(self.requests_made, metrics.requests_made)
+        self.cache_hits = _add_optional(self.cache_hits, metrics.cache_hits)
+        self.cache_misses = _add_optional(self.cache_misses, metrics.cache_misses)
+
+    def add_step_durations(self, step_durations: Optional[Dict[str, float]]) -> None:
+        """Ingest OrchestrationResponse.step_durations"""
+        for step, seconds in (step_durations or {}).items():
+            self.steps.setdefault(step, LatencyHistogram()).add(seconds)
+
+    def merge(self, other: "MetricsAggregate") -> "MetricsAggregate":
+        """New aggregate combining both (associative and commutative)"""
+        steps = {step: h.model_copy(deep=True) for step, h in self.steps.items()}
+        for step, histogram in other.steps.items():
+            if step in steps:
+                steps[step] = steps[step].merge(histogram)
+            else:
+                steps[step] = histogram.model_copy(deep=True)
+        return MetricsAggregate(
+            runs=self.runs + other.runs,
+            duration=self.duration.merge(other.duration),
+            steps=steps,
+            tokens_used=_add_optional(self.tokens_used, other.tokens_used),
+            estimated_cost=_add_optional(self.estimated_cost, other.estimated_cost),
+            requests_made=_add_optional(self.requests_made, other.requests_made),
+            cache_hits=_add_optional(self.cache_hits, other.cache_hits),
+            cache_misses=_add_optional(self.cache_misses, other.cache_misses),
+        )
+
+    @classmethod
+    def merge_all(cls, aggregates: Iterable["MetricsAggregate"]) -> "MetricsAggregate":
+        """Combine any number of shard aggregates"""
+        result = cls()
+        for aggregate in aggregates:
+            result = result.merge(aggregate)
+        return result
+
+    @property
+    def cache_hit_rate(self) -> Optional[float]:
+        lookups = (self.cache_hits or 0) + (self.cache_misses or 0)
+        return (self.cache_hits or 0) / lookups if lookups else None
+
+    def to_service_metrics(self) -> ServiceMetrics:
+        """Totals as a single ServiceMetrics (duration = sum of run durations)"""
+        return ServiceMetrics(
+            duration_seconds=self.duration.total,
+            tokens_used=self.tokens_used,
+            estimated_cost=self.estimated_cost,
+            requests_made=self.requests_made,
+            cache_hits=self.cache_hits,
+            cache_misses=self.cache_misses,
+        )
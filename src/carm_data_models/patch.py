@@ -0,0 +1,241 @@
+"""
+Model Patches
+
+Compact deltas between two versions of a model (e.g. a CompanyProfile
+edited in the settings UI) and validated, incremental application.
+
+Delta format (JSON-Patch-like, RFC 6901 paths):
+-----------------------------------------------
+[
+    {"op": "replace", "path": "/company/industry", "value": "Retail"},
+    {"op": "add", "path": "/case_studies/-", "value": {...}},
+    {"op": "remove", "path": "/team_members/2"}
+]
+
+PSEUDO CODE:
+------------
+1. diff(old, new): walk both values field by field; emit an operation only
+   where they differ (lists element-wise, dicts key-wise)
+2. apply_patch(model, ops): follow each path down the model, then rebuild
+   only the objects on that path (model_copy / shallow list and dict copies)
+3. The new value is validated against the declared type of the touched
+   field (including its constraints); nothing else is re-validated
+4. Untouched sub-objects are shared with the original model
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Type, TypeVar, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from ._compat import Annotated, classify
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_MISSING = object()
+
+
+class PatchError(ValueError):
+    """Raised when a patch operation cannot be applied"""
+
+
+class PatchOperation(BaseModel):
+    """One change in a patch"""
+    op: Literal["add", "remove", "replace"] = Field(..., description="Operation")
+    path: str = Field(..., description="JSON pointer to the changed value, e.g. /company/name")
+    value: Any = Field(None, description="New value (JSON-compatible); unused for remove")
+
+    class Config:
+        json_schema_extra = {
+            "example": {"op": "replace", "path": "/company/industry", "value": "Retail"}
+        }
+
+
+PATCH_ADAPTER = TypeAdapter(List[PatchOperation])
+
+Patch = Iterable[Union[PatchOperation, Dict[str, Any]]]
+
+
+# ============================================================================
+# Paths
+# ============================================================================
+
+
+def _escape(token: Union[str, int]) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _parse_path(path: str) -> List[str]:
+    if path == "":
+        return []
+    if not path.startswith("/"):
+        raise PatchError(f"Invalid path {path!r}: must start with '/'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
+
+
+# ============================================================================
+# Diff
+# ============================================================================
+
+
+def _diff(old: Any, new: Any, path: str, ops: List[PatchOperation]) -> None:
+    if old == new and type(old) is type(new):
+        return
+    if isinstance(old, BaseModel) and type(old) is type(new):
+        for name in type(old).model_fields:
+            _diff(getattr(old, name), getattr(new, name), f"{path}/{_escape(name)}", ops)
+    elif isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(PatchOperation(op="remove", path=f"{path}/{_escape(key)}"))
+        for key, value in new.items():
+            key_path = f"{path}/{_escape(key)}"
+            if key in old:
+                _diff(old[key], value, key_path, ops)
+            else:
+                ops.append(PatchOperation(op="add", path=key_path, value=_to_json(value)))
+    elif isinstance(old, list) and isinstance(new, list):
+        for index in range(min(len(old), len(new))):
+            _diff(old[index], new[index], f"{path}/{index}", ops)
+        for value in new[len(old):]:
+            ops.append(PatchOperation(op="add", path=f"{path}/-", value=_to_json(value)))
+        for index in range(len(old) - 1, len(new) - 1, -1):
+            ops.append(PatchOperation(op="remove", path=f"{path}/{index}"))
+    else:
+        ops.append(PatchOperation(op="replace", path=path, value=_to_json(new)))
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return to_jsonable_python(value)
+
+
+def diff(old: ModelT, new: ModelT) -> List[PatchOperation]:
+    """
+    Operations that turn `old` into `new`
+
+    Both must be instances of the same model class. Unchanged fields produce
+    no operations, so the delta is proportional to the edit, not the model.
+    """
+    if type(old) is not type(new):
+        raise TypeError(f"Cannot diff {type(old).__name__} against {type(new).__name__}")
+    ops: List[PatchOperation] = []
+    _diff(old, new, "", ops)
+    return ops
+
+
+# ============================================================================
+# Apply
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+@lru_cache(maxsize=None)
+def _field_type(model_cls: Type[BaseModel], name: str) -> Any:
+    """Field annotation including its constraints (ge, min_length, ...)"""
+    field = model_cls.model_fields[name]
+    if field.metadata:
+        params = (field.annotation, *field.metadata)
+        return Annotated[params]
+    return field.annotation
+
+
+def _index(container: List[Any], token: str, op: str, last: bool) -> int:
+    if token == "-" and op == "add" and last:
+        return len(container)
+    if not token.isdigit():
+        raise PatchError(f"Invalid list index {token!r}")
+    index = int(token)
+    limit = len(container) + (1 if op == "add" and last else 0)
+    if index >= limit:
+        raise PatchError(f"List index {index} out of range")
+    return index
+
+
+def _apply(
+    value: Any, annotation: Any, tokens: List[str], op: str, new_value: Any, path: str
+) -> Any:
+    """Return a copy of `value` with the change applied at `tokens`"""
+    if not tokens:
+        return _adapter(annotation).validate_python(new_value)
+
+    token, rest, last = tokens[0], tokens[1:], len(tokens) == 1
+
+    if isinstance(value, BaseModel):
+        model_cls = type(value)
+        if token not in model_cls.model_fields:
+            raise PatchError(f"{model_cls.__name__} has no field {token!r} ({path})")
+        if last and op == "remove":
+            field = model_cls.model_fields[token]
+            if field.is_required():
+                raise PatchError(f"Cannot remove required field {token!r} ({path})")
+            child = field.get_default(call_default_factory=True)
+        else:
+            child = _apply(
+                getattr(value, token), _field_type(model_cls, token), rest, op, new_value, path
+            )
+        return value.model_copy(update={token: child})
+
+    kind, inner = classify(annotation)
+    if isinstance(value, list):
+        item_type = inner if kind == "list" else Any
+        items = list(value)
+        index = _index(items, token, op, last)
+        if last and op == "remove":
+            del items[index]
+        elif last and op == "add":
+            items.insert(index, _adapter(item_type).validate_python(new_value))
+        else:
+            items[index] = _apply(items[index], item_type, rest, op, new_value, path)
+        return items
+
+    if isinstance(value, dict):
+        value_type = inner if kind == "dict" else Any
+        mapping = dict(value)
+        if last and op == "remove":
+            if token not in mapping:
+                raise PatchError(f"Cannot remove missing key {token!r} ({path})")
+            del mapping[token]
+        elif last:
+            if op == "replace" and token not in mapping:
+                raise PatchError(f"Cannot replace missing key {token!r} ({path})")
+            mapping[token] = _adapter(value_type).validate_python(new_value)
+        else:
+            child = mapping.get(token, _MISSING)
+            if child is _MISSING:
+                raise PatchError(f"Path not found: {path}")
+            mapping[token] = _apply(child, value_type, rest, op, new_value, path)
+        return mapping
+
+    raise PatchError(f"Path not found: {path}")
+
+
+def apply_patch(model: ModelT, ops: Patch) -> ModelT:
+    """
+    Apply operations from diff() (or an equivalent JSON delta) to `model`
+
+    Returns a new model; `model` itself is not modified. Only the values
+    written by the patch are validated, against the declared types of their
+    fields. Objects not on a patched path are shared with `model`.
+
+    Raises:
+        PatchError: If a path does not exist in the model
+        pydantic.ValidationError: If a new value is invalid
+    """
+    operations = [op if isinstance(op, PatchOperation) else PatchOperation(**op) for op in ops]
+    result: BaseModel = model
+    for operation in operations:
+        tokens = _parse_path(operation.path)
+        if not tokens:
+            raise PatchError("Patching the whole model is not supported; use model_validate")
+        result = _apply(
+            result, type(result), tokens, operation.op, operation.value, operation.path
+        )
+    return result  # type: ignore[return-value]
+
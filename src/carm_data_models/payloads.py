@@ -0,0 +1,183 @@
+"""
+Typed Service Payloads
+
+Models for the data that used to travel between services as plain dicts:
+scraped records (ScrapeResponse / OrchestrationResponse) and the sender
+profile of a DraftRequest.
+
+PSEUDO CODE:
+------------
+1. One model per scrape source (WebsiteScrape, LinkedInScrape), told apart
+   by their "source" field
+2. ScrapedData = discriminated union of those models; pydantic-core picks
+   the model from "source" and validates the record in a single pass
+3. Old dicts without a known "source" (or without the "url" a typed record
+   needs) decode as GenericScrape; every model keeps unknown keys, so
+   existing producers keep working during the migration
+4. TargetCompany is a Company, or (old shape) a plain dict when the dict
+   has no "name" or carries keys that Company does not know
+5. SenderProfile accepts a CompanyProfile, or (old shape) a plain Company
+   dict that is wrapped as CompanyProfile(company=...)
+6. Anything the typed model rejects falls back to the old shape
+   (GenericScrape or the plain dict) instead of failing, so every payload
+   that decoded before the migration still decodes
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from pydantic import BeforeValidator, Discriminator, Field, Tag
+
+from ._compat import Annotated
+from .common import CarmModel
+from .company import Company, CompanyProfile
+from .validators import CachedHttpUrl
+
+# Tag for records whose "source" is missing or not one of the typed sources
+GENERIC_SOURCE = "generic"
+
+
+# ============================================================================
+# Scraped records
+# ============================================================================
+
+
+class WebsiteScrape(CarmModel):
+    """Data scraped from a company website"""
+    source: Literal["website"] = Field("website", description="Scrape source")
+    url: CachedHttpUrl = Field(..., description="Scraped page")
+    name: Optional[str] = Field(None, description="Company name found on the page")
+    title: Optional[str] = Field(None, description="Page title")
+    description: Optional[str] = Field(None, description="Meta description")
+    text: Optional[str] = Field(None, description="Visible page text")
+    emails: Optional[List[str]] = Field(default=None, description="Email addresses found")
+    phones: Optional[List[str]] = Field(default=None, description="Phone numbers found")
+    social_links: Optional[Dict[str, str]] = Field(
+        default=None, description="Social profile URLs by network"
+    )
+    technologies: Optional[List[str]] = Field(default=None, description="Detected technologies")
+    scraped_at: Optional[datetime] = Field(None, description="When the page was scraped")
+
+    class Config:
+        extra = "allow"
+        json_schema_extra = {
+            "example": {
+                "source": "website",
+                "url": "https://acme.com/",
+                "name": "Acme Plumbing",
+                "title": "Acme Plumbing | Austin, TX",
+                "emails": ["hello@acme.com"],
+            }
+        }
+
+
+class LinkedInScrape(CarmModel):
+    """Data scraped from a LinkedIn company page"""
+    source: Literal["linkedin"] = Field("linkedin", description="Scrape source")
+    url: CachedHttpUrl = Field(..., description="LinkedIn company page")
+    name: Optional[str] = Field(None, description="Company name")
+    industry: Optional[str] = Field(None, description="Industry")
+    description: Optional[str] = Field(None, description="About section")
+    employee_count: Optional[int] = Field(None, description="Employees on LinkedIn", ge=0)
+    headquarters: Optional[str] = Field(None, description="Headquarters location")
+    followers: Optional[int] = Field(None, description="Follower count", ge=0)
+    specialties: Optional[List[str]] = Field(default=None, description="Listed specialties")
+    scraped_at: Optional[datetime] = Field(None, description="When the page was scraped")
+
+    class Config:
+        extra = "allow"
+        json_schema_extra = {
+            "example": {
+                "source": "linkedin",
+                "url": "https://linkedin.com/company/acme",
+                "name": "Acme Plumbing",
+                "employee_count": 25,
+            }
+        }
+
+
+class GenericScrape(CarmModel):
+    """
+    Scraped record from any other source, or in the old untyped shape
+
+    Unknown keys are kept as-is.
+    """
+    source: Optional[str] = Field(None, description="Scrape source, if given")
+    name: Any = Field(None, description="Company name")
+    url: Any = Field(None, description="Scraped URL")
+
+    class Config:
+        extra = "allow"
+        json_schema_extra = {
+            "example": {"name": "Acme Plumbing", "url": "https://acme.com/", "rating": 4.8}
+        }
+
+
+SCRAPE_MODELS = {"website": WebsiteScrape, "linkedin": LinkedInScrape}
+
+# Union members are tried in order: the typed model, then the old shape it replaced
+_OR_LEGACY = Field(union_mode="left_to_right")
+
+
+def scrape_source(value: Any) -> str:
+    """Union tag for a scraped record (dict or model)"""
+    if isinstance(value, dict):
+        # Old records may carry a known source without the url a typed record needs
+        source = value.get("source") if value.get("url") is not None else None
+    else:
+        source = getattr(value, "source", None)
+    return source if source in SCRAPE_MODELS else GENERIC_SOURCE
+
+
+ScrapedData = Annotated[
+    Union[
+        Annotated[Union[WebsiteScrape, GenericScrape], _OR_LEGACY, Tag("website")],
+        Annotated[Union[LinkedInScrape, GenericScrape], _OR_LEGACY, Tag("linkedin")],
+        Annotated[GenericScrape, Tag(GENERIC_SOURCE)],
+    ],
+    Discriminator(scrape_source),
+]
+
+
+# ============================================================================
+# Companies
+# ============================================================================
+
+
+_COMPANY_FIELDS = frozenset(Company.model_fields)
+
+
+def company_kind(value: Any) -> str:
+    """Union tag for a target company: "company", or "dict" for old shapes Company would lose"""
+    if isinstance(value, dict) and ("name" not in value or not value.keys() <= _COMPANY_FIELDS):
+        return "dict"
+    return "company"
+
+
+TargetCompany = Annotated[
+    Union[
+        Annotated[Union[Company, Dict[str, Any]], _OR_LEGACY, Tag("company")],
+        Annotated[Dict[str, Any], Tag("dict")],
+    ],
+    Discriminator(company_kind),
+]
+
+
+# ============================================================================
+# Sender profile
+# ============================================================================
+
+
+def _wrap_company(value: Any) -> Any:
+    """Old DraftRequest.sender_company shape: a Company instead of a CompanyProfile"""
+    if isinstance(value, Company):
+        return {"company": value}
+    if isinstance(value, dict) and "company" not in value and "name" in value:
+        return {"company": value}
+    return value
+
+
+SenderProfile = Annotated[
+    Union[Annotated[CompanyProfile, BeforeValidator(_wrap_company)], Dict[str, Any]],
+    _OR_LEGACY,
+]
@@ -0,0 +1,355 @@
+"""
+Sender Profile Cache
+
+Per-tenant cache of validated CompanyProfile instances for the draft agent,
+so OrchestrationRequest.sender_company_id does not cost a load and a full
+re-validation on every request.
+
+PSEUDO CODE:
+------------
+1. get(tenant_id) / await aget(tenant_id): fresh entry -> return it (hit)
+2. Miss or expired -> load through the loader; concurrent misses for the
+   same tenant share one load (single-flight), in threads and tasks alike
+3. Loaded data is validated once and frozen: every model in the profile
+   rejects attribute assignment, so the shared instance cannot be changed
+   by one request under another
+4. Entries expire after `ttl` seconds; above `maxsize` the least recently
+   used entry is evicted
+5. Each entry keeps a content hash of the profile; invalidate() with the
+   hash of the current version drops only entries that differ from it
+6. Hit / miss / load counters feed ServiceMetrics.cache_hits / cache_misses
+
+Frozen profiles still hold ordinary lists and dicts (so they serialize
+exactly like CompanyProfile); use model_copy(deep=True) before editing one.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel, Field
+
+from .common import ServiceMetrics
+from .metrics import record_cache_counters
+from .company import CompanyProfile
+
+ProfileSource = Union[CompanyProfile, Dict[str, Any], str, bytes]
+Loader = Callable[[Hashable], ProfileSource]
+AsyncLoader = Callable[[Hashable], Awaitable[ProfileSource]]
+
+
+# ============================================================================
+# Frozen profiles
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def frozen_type(model_cls: Type[BaseModel]) -> Type[BaseModel]:
+    """Subclass of a model class whose instances reject attribute assignment"""
+    namespace = {
+        "__module__": __name__,
+        "__doc__": f"Read-only {model_cls.__name__}",
+        "model_config": {**model_cls.model_config, "frozen": True},
+    }
+    return type(f"Frozen{model_cls.__name__}", (model_cls,), namespace)
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return freeze(value)
+    if isinstance(value, list):
+        return [_freeze_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _freeze_value(v) for k, v in value.items()}
+    return value
+
+
+def freeze(model: BaseModel) -> BaseModel:
+    """
+    Read-only copy of a validated model (nested models included)
+
+    The copy is an instance of the original class (isinstance() still
+    holds) and is built without re-validation.
+    """
+    if type(model).model_config.get("frozen"):
+        return model
+    values = {name: _freeze_value(value) for name, value in model.__dict__.items()}
+    return frozen_type(type(model)).model_construct(_fields_set=model.model_fields_set, **values)
+
+
+def content_hash(profile: BaseModel) -> str:
+    """SHA-256 of the profile's JSON encoding (same data -> same hash)"""
+    return hashlib.sha256(profile.model_dump_json().encode()).hexdigest()
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+class ProfileCacheStats(BaseModel):
+    """Counters of a ProfileCache"""
+    hits: int = Field(0, description="Lookups answered from the cache")
+    misses: int = Field(0, description="Lookups that needed a load (or waited for one)")
+    loads: int = Field(0, description="Loader calls")
+    load_errors: int = Field(0, description="Loader calls that failed")
+    evictions: int = Field(0, description="Entries dropped for space")
+    expirations: int = Field(0, description="Entries dropped after their TTL")
+    invalidations: int = Field(0, description="Entries dropped by invalidate()")
+    size: int = Field(0, description="Entries currently cached")
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class _LoadAbandoned(Exception):
+    """Set on a shared load whose owner was cancelled; waiters retry the load"""
+
+
+class _Entry(NamedTuple):
+    profile: CompanyProfile
+    content_hash: str
+    expires_at: float
+
+
+class ProfileCache:
+    """
+    Tenant id -> frozen CompanyProfile, with TTL, LRU and single-flight loads
+
+    Usage:
+        cache = ProfileCache(loader=load_profile_from_db, ttl=300)
+        profile = cache.get(request.sender_company_id)
+        profile = await cache.aget(request.sender_company_id)
+
+    `loader` (and `async_loader`) return a CompanyProfile, a dict or JSON;
+    without an async loader, aget() runs `loader` in a worker thread.
+    Do not call the blocking get() from inside the event loop while an
+    aget() for the same tenant may be loading.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Loader] = None,
+        async_loader: Optional[AsyncLoader] = None,
+        ttl: float = 300.0,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if loader is None and async_loader is None:
+            raise ValueError("ProfileCache needs a loader or an async_loader")
+        self.loader = loader
+        self.async_loader = async_loader
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, "Future[CompanyProfile]"] = {}
+        self._lock = threading.Lock()
+        self._stats = ProfileCacheStats()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _lookup(self, tenant_id: Hashable) -> Tuple[Optional[CompanyProfile], Any, bool]:
+        """
+        Cached profile, or the load to wait for / start (caller holds no lock)
+
+        Returns (profile, future, owner): owner=True means the caller must
+        run the load and resolve the future.
+        """
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(tenant_id)
+                    self._stats.hits += 1
+                    return entry.profile, None, False
+                del self._entries[tenant_id]
+                self._stats.expirations += 1
+            self._stats.misses += 1
+            future = self._inflight.get(tenant_id)
+            if future is not None:
+                return None, future, False
+            future = self._inflight[tenant_id] = Future()
+            self._stats.loads += 1
+            return None, future, True
+
+    def get(self, tenant_id: Hashable) -> CompanyProfile:
+        """Profile for a tenant, loading it on a miss"""
+        while True:
+            profile, future, owner = self._lookup(tenant_id)
+            if profile is not None:
+                return profile
+            if owner:
+                break
+            try:
+                return cast(CompanyProfile, future.result())
+            except _LoadAbandoned:
+                continue
+        try:
+            if self.loader is None:
+                raise TypeError("ProfileCache has only an async_loader; use aget()")
+            result = self.loader(tenant_id)
+        except BaseException as exc:
+            self._fail(tenant_id, future, exc)
+            raise
+        return self._complete(tenant_id, future, result)
+
+    async def aget(self, tenant_id: Hashable) -> CompanyProfile:
+        """Async variant of get(); concurrent tasks and threads share one load"""
+        while True:
+            profile, future, owner = self._lookup(tenant_id)
+            if profile is not None:
+                return profile
+            if owner:
+                break
+            try:
+                # Shielded: a cancelled waiter must not cancel the shared load
+                return cast(
+                    CompanyProfile, await asyncio.shield(asyncio.wrap_future(future))
+                )
+            except _LoadAbandoned:
+                continue
+        try:
+            if self.async_loader is not None:
+                result = await self.async_loader(tenant_id)
+            else:
+                result = await asyncio.to_thread(self.loader, tenant_id)  # type: ignore[arg-type]
+        except BaseException as exc:
+            self._fail(tenant_id, future, exc)
+            raise
+        return self._complete(tenant_id, future, result)
+
+    def _complete(
+        self, tenant_id: Hashable, future: Future, result: ProfileSource
+    ) -> CompanyProfile:
+        try:
+            profile = self._prepare(result)
+        except BaseException as exc:
+            self._fail(tenant_id, future, exc)
+            raise
+        self._store(tenant_id, profile, content_hash(profile))
+        with self._lock:
+            self._inflight.pop(tenant_id, None)
+        future.set_result(profile)
+        return profile
+
+    def _fail(self, tenant_id: Hashable, future: Future, exc: BaseException) -> None:
+        """
+        Share a loader error with the waiters; a cancelled (or interrupted)
+        owner only makes them retry, since the error is not theirs
+        """
+        failed = isinstance(exc, Exception)
+        with self._lock:
+            self._inflight.pop(tenant_id, None)
+            if failed:
+                self._stats.load_errors += 1
+        future.set_exception(exc if failed else _LoadAbandoned())
+
+    @staticmethod
+    def _prepare(source: ProfileSource) -> CompanyProfile:
+        """Validate (unless already a CompanyProfile) and freeze"""
+        if isinstance(source, (str, bytes)):
+            source = CompanyProfile.model_validate_json(source)
+        elif not isinstance(source, CompanyProfile):
+            source = CompanyProfile.model_validate(source)
+        return freeze(source)  # type: ignore[return-value]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _store(self, tenant_id: Hashable, profile: CompanyProfile, digest: str) -> None:
+        with self._lock:
+            self._entries[tenant_id] = _Entry(profile, digest, self._clock() + self.ttl)
+            self._entries.move_to_end(tenant_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def put(self, tenant_id: Hashable, profile: ProfileSource) -> CompanyProfile:
+        """
+        Store a profile directly (e.g. right after the settings UI saved it)
+
+        If the content is unchanged, the cached instance is kept and only
+        its TTL is renewed.
+        """
+        prepared = self._prepare(profile)
+        digest = content_hash(prepared)
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+        if entry is not None and entry.content_hash == digest:
+            prepared = entry.profile
+        self._store(tenant_id, prepared, digest)
+        return prepared
+
+    def invalidate(self, tenant_id: Hashable, current_hash: Optional[str] = None) -> bool:
+        """
+        Drop a tenant's entry; returns True if one was dropped
+
+        With `current_hash` (the content hash of the profile as now stored),
+        the entry is kept if it already holds that version.
+        """
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is None or entry.content_hash == current_hash:
+                return False
+            del self._entries[tenant_id]
+            self._stats.invalidations += 1
+            return True
+
+    def content_hash(self, tenant_id: Hashable) -> Optional[str]:
+        """Content hash of the cached profile, if any"""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            return entry.content_hash if entry is not None else None
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, tenant_id: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            return entry is not None and entry.expires_at > self._clock()
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def stats(self) -> ProfileCacheStats:
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._entries)})
+
+    def cache_counters(self) -> Tuple[int, int]:
+        """(hits, misses) so far"""
+        with self._lock:
+            return self._stats.hits, self._stats.misses
+
+    def record_metrics(self, metrics: ServiceMetrics, since: Tuple[int, int] = (0, 0)) -> None:
+        """Add the hits and misses since `since` (an earlier cache_counters())"""
+        record_cache_counters(metrics, self.cache_counters(), since)
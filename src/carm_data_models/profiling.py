@@ -0,0 +1,200 @@
+"""
+Validation / Serialization Profiling
+
+Opt-in instrumentation of model_validate, model_validate_json and
+model_dump_json for every CarmModel subclass.
+
+PSEUDO CODE:
+------------
+1. enable(): replace the three methods on CarmModel with timing wrappers
+2. Each call records (model class, operation): calls, errors, cumulative
+   and max seconds, and payload bytes (JSON in or out)
+3. disable(): restore the original methods, so a disabled profiler costs
+   nothing at all
+4. Export per-operation stats as ServiceMetrics or a plain text report
+
+Only top-level calls are counted: a Company validated as part of a
+ResearchResponse is included in the ResearchResponse timing.
+"""
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .common import CarmModel, ServiceMetrics
+
+OPERATIONS = ("model_validate", "model_validate_json", "model_dump_json")
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, str], "OperationStats"] = {}
+_enabled = False
+
+
+class OperationStats(BaseModel):
+    """Timings of one operation on one model class"""
+    model: str = Field(..., description="Model class name")
+    operation: str = Field(..., description="Profiled method name")
+    calls: int = Field(0, description="Number of calls")
+    errors: int = Field(0, description="Calls that raised")
+    total_seconds: float = Field(0.0, description="Cumulative time")
+    max_seconds: float = Field(0.0, description="Slowest single call")
+    bytes: int = Field(0, description="JSON payload bytes read or written")
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+    def to_service_metrics(self) -> ServiceMetrics:
+        """Cumulative time as duration_seconds, calls as requests_made"""
+        return ServiceMetrics(duration_seconds=self.total_seconds, requests_made=self.calls)
+
+
+def _payload_size(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return 0
+
+
+def _record(model: str, operation: str, seconds: float, size: int, failed: bool) -> None:
+    key = (model, operation)
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = OperationStats(model=model, operation=operation)
+        stats.calls += 1
+        stats.errors += failed
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.bytes += size
+
+
+def _profiled(operation: str, original: Callable[..., Any], is_classmethod: bool) -> Any:
+    def wrapper(target: Any, *args: Any, **kwargs: Any) -> Any:
+        model = (target if is_classmethod else type(target)).__name__
+        start = perf_counter()
+        failed = True
+        result = None
+        try:
+            result = original(target, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            seconds = perf_counter() - start
+            if operation == "model_validate_json":
+                size = _payload_size(args[0] if args else kwargs.get("json_data"))
+            elif operation == "model_dump_json":
+                size = _payload_size(result)
+            else:
+                size = 0
+            _record(model, operation, seconds, size, failed)
+
+    wrapper.__name__ = operation
+    wrapper.__doc__ = original.__doc__
+    return classmethod(wrapper) if is_classmethod else wrapper
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def enable() -> None:
+    """Start profiling all CarmModel subclasses"""
+    global _enabled
+    with _lock:
+        if _enabled:
+            return
+        for operation in OPERATIONS:
+            attr = BaseModel.__dict__[operation]
+            if isinstance(attr, classmethod):
+                setattr(CarmModel, operation, _profiled(operation, attr.__func__, True))
+            else:
+                setattr(CarmModel, operation, _profiled(operation, attr, False))
+        _enabled = True
+
+
+def disable() -> None:
+    """Stop profiling and restore the original methods (collected stats are kept)"""
+    global _enabled
+    with _lock:
+        if not _enabled:
+            return
+        for operation in OPERATIONS:
+            delattr(CarmModel, operation)
+        _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Discard collected stats"""
+    with _lock:
+        _stats.clear()
+
+
+@contextmanager
+def profiling(reset_stats: bool = True) -> Iterator[None]:
+    """
+    Profile the enclosed block
+
+    Usage:
+        with profiling():
+            handle_request(payload)
+        print(report())
+    """
+    if reset_stats:
+        reset()
+    was_enabled = _enabled
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def stats(model: Optional[str] = None) -> List[OperationStats]:
+    """Snapshot of collected stats, slowest (cumulative) first"""
+    with _lock:
+        snapshot = [s.model_copy() for s in _stats.values() if model in (None, s.model)]
+    return sorted(snapshot, key=lambda s: s.total_seconds, reverse=True)
+
+
+def to_service_metrics(model: Optional[str] = None) -> ServiceMetrics:
+    """Totals (optionally for one model class) as a single ServiceMetrics"""
+    collected = stats(model)
+    return ServiceMetrics(
+        duration_seconds=sum(s.total_seconds for s in collected),
+        requests_made=sum(s.calls for s in collected),
+    )
+
+
+def to_dict() -> Dict[str, Dict[str, Any]]:
+    """ServiceMetrics-compatible dicts keyed by "<Model>.<operation>" """
+    return {
+        f"{s.model}.{s.operation}": s.to_service_metrics().model_dump(exclude_none=True)
+        for s in stats()
+    }
+
+
+def report() -> str:
+    """Plain text table of collected stats"""
+    header = (
+        f"{'model':<24} {'operation':<20} {'calls':>8} {'errors':>6} "
+        f"{'total ms':>10} {'mean ms':>9} {'max ms':>9} {'bytes':>12}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in stats():
+        lines.append(
+            f"{s.model:<24} {s.operation:<20} {s.calls:>8} {s.errors:>6} "
+            f"{s.total_seconds * 1000:>10.3f} {s.mean_seconds * 1000:>9.3f} "
+            f"{s.max_seconds * 1000:>9.3f} {s.bytes:>12}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,306 @@
+"""
+Prompt Serialization
+
+Compact, budgeted JSON for putting a CompanyProfile (the sender) or a
+target Company into an LLM prompt, instead of model_dump_json() with its
+nulls, long keys and every list item.
+
+PSEUDO CODE:
+------------
+1. Each model has a field list in priority order with short keys
+   (unique_selling_points -> "usp", services_detailed -> "services", ...);
+   the profile's company fields are inlined, azure_config and bookkeeping
+   fields (source, found_at, confidence_score, metadata) are left out
+2. Empty values (None, "", [], {}) are dropped, recursively
+3. List items keep their order, except case studies and portfolio
+   examples, which are ordered by relevance to the target company
+   (keywords shared with its industry, services, technologies, pain
+   points and description) when one is given
+4. With a budget, fields are added in priority order while they fit:
+   lists item by item, long strings cut with "…", anything else whole;
+   the rest is reported in `dropped` / `truncated`
+5. Same input, same budget -> same output
+
+Budgets are in characters of the JSON text; max_tokens converts with
+CHARS_PER_TOKEN, or with an exact `count_tokens` function if given.
+"""
+
+import json
+import math
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+from .company import Company, CompanyProfile
+
+CHARS_PER_TOKEN = 4
+MIN_TRUNCATED_CHARS = 24
+ELLIPSIS = "…"
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = frozenset(
+    "and for the with that this from your our are you has have into more than "
+    "their they was were will inc llc ltd company companies services".split()
+)
+
+# (field name, short key, getter); the name is used in reports and `priority`
+FieldSpec = Tuple[str, str, Callable[[Any], Any]]
+
+
+def _location(company: Company) -> Optional[str]:
+    address = company.address
+    if address is None:
+        return None
+    return ", ".join(part for part in (address.city, address.state, address.country) if part)
+
+
+COMPANY_FIELDS: List[FieldSpec] = [
+    ("name", "name", lambda c: c.name),
+    ("website", "web", lambda c: str(c.website) if c.website else None),
+    ("industry", "industry", lambda c: c.industry),
+    ("description", "desc", lambda c: c.description),
+    ("services", "services", lambda c: c.services),
+    ("pain_points", "pains", lambda c: c.pain_points),
+    ("technologies", "tech", lambda c: c.technologies),
+    ("employee_count", "employees", lambda c: c.employee_count),
+    ("address", "location", _location),
+    ("founded_year", "founded", lambda c: c.founded_year),
+    ("revenue", "revenue", lambda c: c.revenue),
+]
+
+PROFILE_FIELDS: List[FieldSpec] = [
+    ("company.name", "name", lambda p: p.company.name),
+    ("company.website", "web", lambda p: str(p.company.website) if p.company.website else None),
+    ("company.industry", "industry", lambda p: p.company.industry),
+    ("tagline", "tagline", lambda p: p.tagline),
+    ("unique_selling_points", "usp", lambda p: p.unique_selling_points),
+    ("services_detailed", "services", lambda p: p.services_detailed or p.company.services),
+    ("case_studies", "cases", lambda p: p.case_studies),
+    ("company.description", "desc", lambda p: p.company.description),
+    ("mission", "mission", lambda p: p.mission),
+    ("values", "values", lambda p: p.values),
+    ("client_testimonials", "quotes", lambda p: p.client_testimonials),
+    ("portfolio_examples", "work", lambda p: p.portfolio_examples),
+    ("certifications", "certs", lambda p: p.certifications),
+    ("awards", "awards", lambda p: p.awards),
+    ("team_members", "team", lambda p: p.team_members),
+    ("vision", "vision", lambda p: p.vision),
+]
+
+# Lists ordered by relevance to the target company
+RANKED_FIELDS = frozenset({"case_studies", "portfolio_examples"})
+
+
+class PromptPayload(BaseModel):
+    """Prompt JSON plus what had to go to fit the budget"""
+    text: str = Field(..., description="Compact JSON for the prompt")
+    chars: int = Field(..., description="Length of text")
+    tokens: int = Field(..., description="Token count (estimated unless count_tokens was given)")
+    dropped: List[str] = Field(
+        default_factory=list,
+        description="Fields or list items left out, e.g. 'awards', 'case_studies[3]'",
+    )
+    truncated: List[str] = Field(default_factory=list, description="Fields cut short")
+
+    @property
+    def complete(self) -> bool:
+        return not self.dropped and not self.truncated
+
+
+# ============================================================================
+# Building blocks
+# ============================================================================
+
+
+def _compact(value: Any) -> Any:
+    """Drop None / "" / [] / {} recursively (None if nothing is left)"""
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    if isinstance(value, dict):
+        items = ((k, _compact(v)) for k, v in value.items())
+        value = {k: v for k, v in items if v is not None}
+    elif isinstance(value, (list, tuple)):
+        value = [v for v in map(_compact, value) if v is not None]
+    elif isinstance(value, str):
+        value = value.strip()
+    return value if value not in (None, "", [], {}) else None
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def keywords(company: Company) -> FrozenSet[str]:
+    """Words describing a target company, used to rank case studies"""
+    parts = [company.industry, company.description]
+    for items in (company.services, company.technologies, company.pain_points):
+        parts.extend(items or ())
+    words = _WORD.findall(" ".join(p for p in parts if p).lower())
+    return frozenset(w for w in words if len(w) > 2 and w not in _STOPWORDS)
+
+
+def _rank(items: List[Any], terms: FrozenSet[str]) -> List[Tuple[int, Any]]:
+    """(original index, item), most relevant first; ties keep the original order"""
+    indexed = list(enumerate(items))
+    if not terms:
+        return indexed
+
+    def score(entry: Tuple[int, Any]) -> Tuple[int, int]:
+        found = terms.intersection(_WORD.findall(_dumps(entry[1]).lower()))
+        return -len(found), entry[0]
+
+    return sorted(indexed, key=score)
+
+
+def _specs(model: BaseModel) -> List[FieldSpec]:
+    if isinstance(model, CompanyProfile):
+        return PROFILE_FIELDS
+    if isinstance(model, Company):
+        return COMPANY_FIELDS
+    raise TypeError(f"No prompt fields defined for {type(model).__name__}")
+
+
+def _ordered(specs: List[FieldSpec], priority: Optional[Sequence[str]]) -> List[FieldSpec]:
+    if not priority:
+        return specs
+    rank = {name: i for i, name in enumerate(priority)}
+    return sorted(specs, key=lambda spec: rank.get(spec[0], len(rank)))
+
+
+def prompt_data(
+    model: Union[Company, CompanyProfile],
+    relevant_to: Optional[Company] = None,
+    priority: Optional[Sequence[str]] = None,
+) -> List[Tuple[str, str, Any]]:
+    """
+    (field name, short key, compacted value) in priority order, empty
+    fields left out and ranked lists already ordered
+
+    List values are lists of (original index, item).
+    """
+    terms = keywords(relevant_to) if relevant_to is not None else frozenset()
+    entries = []
+    for name, key, getter in _ordered(_specs(model), priority):
+        value = _compact(getter(model))
+        if value is None:
+            continue
+        if isinstance(value, list):
+            value = _rank(value, terms) if name in RANKED_FIELDS else list(enumerate(value))
+        entries.append((name, key, value))
+    return entries
+
+
+# ============================================================================
+# Budgeted serialization
+# ============================================================================
+
+
+def _truncate(text: str, room: int) -> Optional[str]:
+    """Longest prefix of text + ELLIPSIS whose JSON form fits in `room` chars"""
+    cut = room - 3
+    while cut >= MIN_TRUNCATED_CHARS:
+        candidate = text[:cut].rstrip() + ELLIPSIS
+        excess = len(_dumps(candidate)) - room
+        if excess <= 0:
+            return candidate
+        cut -= excess
+    return None
+
+
+def _fit(entries: List[Tuple[str, str, Any]], budget: Optional[int]) -> Tuple[Dict, List, List]:
+    out: Dict[str, Any] = {}
+    dropped: List[str] = []
+    truncated: List[str] = []
+    size = 2  # "{}"
+    for name, key, value in entries:
+        head = len(_dumps(key)) + 1 + (1 if out else 0)
+        if isinstance(value, list):
+            kept: List[Any] = []
+            skipped: List[str] = []
+            cost = size + head + 2  # "[]"
+            for index, item in value:
+                item_cost = len(_dumps(item)) + (1 if kept else 0)
+                if budget is None or cost + item_cost <= budget:
+                    kept.append(item)
+                    cost += item_cost
+                else:
+                    skipped.append(f"{name}[{index}]")
+            if kept:
+                out[key] = kept
+                size = cost
+                dropped.extend(skipped)
+            else:
+                dropped.append(name)
+            continue
+        cost = size + head + len(_dumps(value))
+        if budget is None or cost <= budget:
+            out[key] = value
+            size = cost
+            continue
+        short = _truncate(value, budget - size - head) if isinstance(value, str) else None
+        if short is None:
+            dropped.append(name)
+        else:
+            out[key] = short
+            size += head + len(_dumps(short))
+            truncated.append(name)
+    return out, dropped, truncated
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (CHARS_PER_TOKEN characters per token)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def to_prompt(
+    model: Union[Company, CompanyProfile],
+    max_chars: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    relevant_to: Optional[Company] = None,
+    priority: Optional[Sequence[str]] = None,
+    count_tokens: Optional[Callable[[str], int]] = None,
+) -> PromptPayload:
+    """
+    Compact prompt JSON for a Company or CompanyProfile
+
+    Args:
+        max_chars: Character budget for the JSON text
+        max_tokens: Token budget (may be combined with max_chars)
+        relevant_to: Target company; most relevant case studies go first
+        priority: Field names to place first, e.g. ["awards", "case_studies"]
+        count_tokens: Exact tokenizer for max_tokens (default: estimate)
+
+    Example:
+        sender = to_prompt(profile, max_tokens=300, relevant_to=target)
+        prompt = f"About us: {sender.text}"
+        sender.dropped  # ['awards', 'case_studies[4]']
+    """
+    count = count_tokens or estimate_tokens
+    entries = prompt_data(model, relevant_to=relevant_to, priority=priority)
+    budget = max_chars
+    if max_tokens is not None:
+        token_chars = max_tokens * CHARS_PER_TOKEN
+        budget = token_chars if budget is None else min(budget, token_chars)
+
+    out, dropped, truncated = _fit(entries, budget)
+    text = _dumps(out)
+    if max_tokens is not None and count_tokens is not None:
+        # Shrink the character budget until the real tokenizer agrees
+        while count(text) > max_tokens and len(text) > 2:
+            budget = min(len(text) - 1, len(text) * max_tokens // count(text))
+            out, dropped, truncated = _fit(entries, budget)
+            text = _dumps(out)
+    return PromptPayload(
+        text=text, chars=len(text), tokens=count(text), dropped=dropped, truncated=truncated
+    )
@@ -0,0 +1,320 @@
+"""
+Compact Read-Only Records
+
+Frozen, __slots__-based counterparts of the pydantic models for holding
+very large datasets (e.g. a million companies during deduplication and
+scoring) in memory.
+
+PSEUDO CODE:
+------------
+1. record_type(Company) generates a "CompanyRecord" class from
+   Company.model_fields: one slot per field, no __dict__
+2. Conversion freezes values: nested models -> nested records,
+   lists -> tuples, dicts -> read-only mappings, URLs -> plain strings
+3. Repeated strings (industry, source, country, ...) are interned, so a
+   million records share one copy of each distinct value
+4. Records are immutable, hashable and compare by value
+5. record.to_model() rebuilds the pydantic model without re-validation
+6. Models that allow extra fields keep their extra values in a read-only
+   mapping (record.extra)
+"""
+
+import sys
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from inspect import isclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ._compat import Annotated, UnionType, classify
+from .trusted import _parse_datetime, construct_trusted
+
+# Fields whose string values (or list items) repeat heavily across records
+INTERNED_FIELDS: FrozenSet[str] = frozenset({
+    "industry", "source", "revenue", "city", "state", "country",
+    "services", "technologies", "pain_points", "tone", "template_name", "status",
+})
+
+# Values kept as-is when freezing (immutable already)
+_IMMUTABLE = (str, int, float, bool, bytes, datetime, date, time, Enum, Decimal, UUID)
+
+Converter = Callable[[Any], Any]
+
+
+def _freeze(value: Any) -> Any:
+    """Immutable form of a field value whose type is not known in advance"""
+    if value is None or isinstance(value, _IMMUTABLE):
+        return value
+    if isinstance(value, BaseModel):
+        return record_type(type(value)).from_model(value)
+    if isinstance(value, Record):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    # URLs and other pydantic value types
+    return str(value)
+
+
+def _thaw(value: Any) -> Any:
+    """Plain Python (JSON-like) form of a frozen value"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+def _intern(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, tuple):
+        return tuple(sys.intern(v) if isinstance(v, str) else v for v in value)
+    return value
+
+
+def _is_datetime(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _is_datetime(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return len(options) == 1 and _is_datetime(options[0])
+    return isclass(annotation) and issubclass(annotation, datetime)
+
+
+def _converter(annotation: Any, interned: bool) -> Converter:
+    """Freezing function for one field"""
+    if _is_datetime(annotation):
+        # ISO strings from from_dict() become datetimes, like in the model
+        return _parse_datetime
+    kind, inner = classify(annotation)
+    if kind == "model":
+        return lambda value: record_type(inner).coerce(value)
+    if kind in ("list", "dict"):
+        item_kind, item_model = classify(inner)
+        if item_kind == "model":
+            def item(value: Any) -> Any:
+                return None if value is None else record_type(item_model).coerce(value)
+
+            if kind == "list":
+                return lambda values: tuple(item(v) for v in values)
+            return lambda mapping: MappingProxyType({k: item(v) for k, v in mapping.items()})
+    if interned:
+        return lambda value: _intern(_freeze(value))
+    return _freeze
+
+
+class Record:
+    """
+    Base class of the generated record types
+
+    Construct records with Record.from_model() / record_type(...).from_dict();
+    keyword construction is also possible (missing fields are None).
+    """
+    __slots__ = ("_hash",)
+
+    _hash: Optional[int]
+    model: ClassVar[Type[BaseModel]]
+    fields: ClassVar[Tuple[str, ...]]
+    allows_extra: ClassVar[bool] = False
+    _plan: ClassVar[Tuple[Tuple[str, Converter], ...]]
+
+    def __init__(self, **values: Any) -> None:
+        unknown = {name: values[name] for name in values if name not in self.fields}
+        if unknown and not self.allows_extra:
+            raise TypeError(f"Unknown fields for {type(self).__name__}: {sorted(unknown)}")
+        self._fill(values.get, unknown)
+
+    def _fill(self, get: Callable[[str], Any], extra: Optional[Mapping[str, Any]] = None) -> None:
+        setter = object.__setattr__
+        for name, convert in self._plan:
+            value = get(name)
+            setter(self, name, None if value is None else convert(value))
+        setter(self, "_hash", None)
+        if self.allows_extra:
+            frozen = {k: _freeze(v) for k, v in (extra or {}).items()}
+            setter(self, "_extra", MappingProxyType(frozen))
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        """Values of undeclared fields (models with extra="allow" only)"""
+        return self._extra if self.allows_extra else MappingProxyType({})  # type: ignore
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "Record":
+        """Frozen copy of a model instance"""
+        record = cls.__new__(cls)
+        record._fill(model.__dict__.get, model.__pydantic_extra__)
+        return record
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Record":
+        """Frozen record from JSON-like data (not validated)"""
+        record = cls.__new__(cls)
+        extra = None
+        if cls.allows_extra:
+            extra = {k: v for k, v in data.items() if k not in cls.fields}
+        record._fill(data.get, extra)
+        return record
+
+    @classmethod
+    def coerce(cls, value: Any) -> "Record":
+        """Record from a record, model instance or dict"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, BaseModel):
+            return cls.from_model(value)
+        return cls.from_dict(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict (lists and dicts instead of tuples and read-only mappings)"""
+        data = {name: _thaw(getattr(self, name)) for name in self.fields}
+        if self.allows_extra:
+            data.update((k, _thaw(v)) for k, v in self._extra.items())  # type: ignore
+        return data
+
+    def to_model(self) -> BaseModel:
+        """Rebuild the pydantic model without re-validation"""
+        return construct_trusted(self.model, self.to_dict())
+
+    def replace(self, **changes: Any) -> "Record":
+        """New record with some fields changed"""
+        values = {name: getattr(self, name) for name in self.fields}
+        values.update(self.extra)
+        values.update(changes)
+        return type(self)(**values)
+
+    # ------------------------------------------------------------------
+    # Immutability, equality, hashing
+    # ------------------------------------------------------------------
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _values(self) -> Tuple[Any, ...]:
+        values = tuple(getattr(self, name) for name in self.fields)
+        if self.allows_extra:
+            values += (self._extra,)  # type: ignore
+        return values
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        cached = self._hash
+        if cached is None:
+            cached = hash((type(self).__name__, _hashable(self._values())))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def __repr__(self) -> str:
+        parts = [
+            f"{name}={getattr(self, name)!r}"
+            for name in self.fields
+            if getattr(self, name) is not None
+        ]
+        parts.extend(f"{name}={value!r}" for name, value in self.extra.items())
+        return f"{type(self).__name__}({', '.join(parts)})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_rebuild, (self.model, self.to_dict()))
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, MappingProxyType):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
+
+
+def _rebuild(model_cls: Type[BaseModel], data: Dict[str, Any]) -> Record:
+    return record_type(model_cls).from_dict(data)
+
+
+@lru_cache(maxsize=None)
+def record_type(model_cls: Type[BaseModel]) -> Type[Record]:
+    """
+    Record class for a pydantic model class (generated once per class)
+
+    Usage:
+        CompanyRecord = record_type(Company)
+        record = CompanyRecord.from_model(company)
+    """
+    fields = tuple(model_cls.model_fields)
+    allows_extra = model_cls.model_config.get("extra") == "allow"
+    namespace: Dict[str, Any] = {
+        "__slots__": fields + (("_extra",) if allows_extra else ()),
+        "__module__": __name__,
+        "__doc__": f"Read-only record of {model_cls.__name__}",
+        "model": model_cls,
+        "fields": fields,
+        "allows_extra": allows_extra,
+    }
+    cls = type(f"{model_cls.__name__}Record", (Record,), namespace)
+    # Converters may refer back to record_type(model_cls), so build them last
+    cls._plan = tuple(  # type: ignore[attr-defined]
+        (name, _converter(field.annotation, name in INTERNED_FIELDS))
+        for name, field in model_cls.model_fields.items()
+    )
+    return cls
+
+
+# ============================================================================
+# Bulk helpers
+# ============================================================================
+
+
+def to_record(model: BaseModel) -> Record:
+    """Record for one model instance"""
+    return record_type(type(model)).from_model(model)
+
+
+def to_records(models: Iterable[BaseModel]) -> List[Record]:
+    """Records for many model instances (of any CarmModel classes)"""
+    return [to_record(model) for model in models]
+
+
+def iter_models(records: Iterable[Record]) -> Iterator[BaseModel]:
+    """Pydantic models back from records, lazily"""
+    for record in records:
+        yield record.to_model()
+
+
+def from_records(records: Iterable[Record]) -> List[BaseModel]:
+    """Pydantic models back from records"""
+    return list(iter_models(records))
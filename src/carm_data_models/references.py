@@ -0,0 +1,159 @@
+"""
+Reference-Deduplicated Serialization
+
+DraftResponse and OrchestrationResponse repeat the same Company payload in
+`research_results` and in every EmailDraft for that company. This codec
+sends each distinct company once and replaces embedded copies with
+references.
+
+Payload layout:
+---------------
+{
+    "companies": [{...company...}, ...],     # shared table
+    "data": {... "company": {"$ref": 0} ...} # model with references
+}
+
+Decoding validates each shared company once and puts the *same* Company
+instance at every place that referenced it.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ._compat import classify
+from .company import Company
+from .trusted import construct_trusted
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+REF_KEY = "$ref"
+
+
+class _SharedCompanies:
+    """Company table built while dumping; equal companies share one entry"""
+
+    def __init__(self) -> None:
+        self.entries: List[Dict[str, Any]] = []
+        self._by_id: Dict[int, int] = {}
+        self._by_content: Dict[str, int] = {}
+
+    def ref(self, company: Company) -> Dict[str, int]:
+        index = self._by_id.get(id(company))
+        if index is None:
+            content = company.model_dump_json()
+            index = self._by_content.get(content)
+            if index is None:
+                index = len(self.entries)
+                self.entries.append(json.loads(content))
+                self._by_content[content] = index
+            self._by_id[id(company)] = index
+        return {REF_KEY: index}
+
+
+# Walks a field value: (value, state) -> JSON-mode value
+Walker = Callable[[Any, Any], Any]
+
+
+def _walker(annotation: Any, dumping: bool) -> Optional[Walker]:
+    """Walker for fields that (transitively) contain a Company, else None"""
+    kind, inner = classify(annotation)
+    if kind == "model":
+        if issubclass(inner, Company):
+            if dumping:
+                return lambda company, table: table.ref(company)
+            # Inline company dicts (no reference) are left for validation
+            return lambda ref, companies: companies[ref[REF_KEY]] if REF_KEY in ref else ref
+        if not _plan(inner, dumping):
+            return None
+        if dumping:
+            return lambda model, table: _dump(model, table)
+        return lambda data, companies: _resolve(inner, data, companies)
+    if kind in ("list", "dict"):
+        walk = _walker(inner, dumping)
+        if walk is None:
+            return None
+        if kind == "list":
+            return lambda items, state: [None if v is None else walk(v, state) for v in items]
+        return lambda mapping, state: {
+            k: None if v is None else walk(v, state) for k, v in mapping.items()
+        }
+    return None
+
+
+@lru_cache(maxsize=None)
+def _plan(model_cls: Type[BaseModel], dumping: bool) -> Tuple[Tuple[str, Walker], ...]:
+    """Fields of `model_cls` that contain companies, with their walkers"""
+    plan = []
+    for name, field in model_cls.model_fields.items():
+        walk = _walker(field.annotation, dumping)
+        if walk is not None:
+            plan.append((name, walk))
+    return tuple(plan)
+
+
+def _dump(model: BaseModel, table: _SharedCompanies) -> Dict[str, Any]:
+    plan = _plan(type(model), True)
+    data = model.model_dump(mode="json", exclude={name for name, _ in plan})
+    for name, walk in plan:
+        value = getattr(model, name)
+        data[name] = None if value is None else walk(value, table)
+    return data
+
+
+def _resolve(
+    model_cls: Type[BaseModel], data: Dict[str, Any], companies: List[Company]
+) -> Dict[str, Any]:
+    resolved = dict(data)
+    for name, walk in _plan(model_cls, False):
+        value = data.get(name)
+        if value is not None:
+            resolved[name] = walk(value, companies)
+    return resolved
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+
+def dump_with_refs(model: BaseModel) -> Dict[str, Any]:
+    """Dump a model with every embedded Company replaced by a reference"""
+    if isinstance(model, Company):
+        raise TypeError("A single Company has nothing to deduplicate")
+    table = _SharedCompanies()
+    data = _dump(model, table)
+    return {"companies": table.entries, "data": data}
+
+
+def dumps_with_refs(model: BaseModel) -> str:
+    """JSON string variant of dump_with_refs()"""
+    return json.dumps(dump_with_refs(model), separators=(",", ":"))
+
+
+def load_with_refs(
+    model_cls: Type[ModelT], payload: Dict[str, Any], trusted: bool = False
+) -> ModelT:
+    """
+    Rebuild a model from dump_with_refs() output
+
+    Each shared company is validated once (or constructed without
+    validation when `trusted`, see carm_data_models.trusted); all references
+    to it point at the same Company instance.
+    """
+    if trusted:
+        companies = [construct_trusted(Company, c) for c in payload["companies"]]
+    else:
+        companies = [Company.model_validate(c) for c in payload["companies"]]
+    data = _resolve(model_cls, payload["data"], companies)
+    if trusted:
+        return construct_trusted(model_cls, data)
+    # Company instances are passed through as-is by validation
+    return model_cls.model_validate(data)
+
+
+def loads_with_refs(model_cls: Type[ModelT], text: str, trusted: bool = False) -> ModelT:
+    """JSON string variant of load_with_refs()"""
+    return load_with_refs(model_cls, json.loads(text), trusted=trusted)
@@ -0,0 +1,290 @@
+"""
+Company Entity Resolution
+
+Deduplicate companies returned by the research and scrape stages.
+
+PSEUDO CODE:
+------------
+1. Normalize keys: website domain (no scheme/www/path), company email
+   domain (ignoring free mail providers), and company name (no legal suffix
+   or punctuation)
+2. Records sharing a domain or normalized name are joined immediately
+   through hash indexes (union-find)
+3. For fuzzy name matches, records are grouped in small, capped blocks
+   (name prefix and suffix) and only compared within a block, so the total
+   work stays near-linear in the number of records
+4. Two clusters with different known domains are never joined
+5. Each cluster is merged field by field; the record with the highest
+   confidence_score (then most recent found_at) wins conflicts
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .company import Address, Company, ContactInfo
+
+FREE_EMAIL_DOMAINS = frozenset({
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com", "live.com",
+    "icloud.com", "me.com", "aol.com", "proton.me", "protonmail.com", "gmx.com", "mail.com",
+})
+
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "plc", "gmbh", "ag", "sa", "srl", "bv", "pty", "lp", "llp",
+})
+
+_SCHEME = re.compile(r"^[a-z][a-z0-9+.-]*://")
+_NON_WORD = re.compile(r"[^\w\s]")
+_SPACES = re.compile(r"\s+")
+
+# List fields merged as an ordered union instead of picking a winner
+_LIST_FIELDS = ("services", "technologies", "pain_points")
+
+
+def normalize_domain(value: Optional[Any]) -> Optional[str]:
+    """
+    Reduce a URL or host to a bare domain
+
+    "https://www.Acme.com/about/" -> "acme.com"
+    """
+    if value is None:
+        return None
+    host = _SCHEME.sub("", str(value).strip().lower())
+    host = host.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+    host = host.rsplit("@", 1)[-1].split(":", 1)[0].rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def email_domain(email: Optional[str]) -> Optional[str]:
+    """Company domain of an email address (None for free mail providers)"""
+    if not email or "@" not in email:
+        return None
+    domain = normalize_domain(email.rsplit("@", 1)[1])
+    return None if domain in FREE_EMAIL_DOMAINS else domain
+
+
+def normalize_name(name: str) -> str:
+    """
+    Canonical company name for matching
+
+    "Acme, Inc." -> "acme"; "Smith & Sons Ltd" -> "smith and sons"
+    """
+    text = _NON_WORD.sub(" ", name.casefold().replace("&", " and "))
+    words = _SPACES.sub(" ", text).strip().split(" ")
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def _trigrams(name: str) -> FrozenSet[str]:
+    padded = f"  {name} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def company_domains(company: Company) -> Set[str]:
+    """All known domains of a company (website, contact website, contact email)"""
+    domains = set()
+    for value in (
+        normalize_domain(company.website),
+        normalize_domain(company.contact_info.website) if company.contact_info else None,
+        email_domain(company.contact_info.email) if company.contact_info else None,
+    ):
+        if value:
+            domains.add(value)
+    return domains
+
+
+def _rank(company: Company) -> Tuple[float, datetime]:
+    found_at = company.found_at or datetime.min
+    offset = found_at.utcoffset()
+    if offset is not None:
+        found_at = found_at.replace(tzinfo=None) - offset
+    return (company.confidence_score or 0.0, found_at)
+
+
+def _merge_fields(models: List[Any]) -> Dict[str, Any]:
+    """First non-null value of each field, in winner order"""
+    values: Dict[str, Any] = {}
+    for model in models:
+        for name in type(model).model_fields:
+            if values.get(name) is None:
+                value = getattr(model, name)
+                if value is not None:
+                    values[name] = value
+    return values
+
+
+def merge_companies(companies: List[Company]) -> Company:
+    """
+    Merge duplicate records of one company into a single Company
+
+    Scalars come from the best-ranked record that has them; list fields are
+    combined (best record first, duplicates removed); metadata dicts are
+    merged with the best record's keys winning. All inputs are validated
+    models, so the result is built without re-validation.
+    """
+    if len(companies) == 1:
+        return companies[0]
+    ranked = sorted(companies, key=_rank, reverse=True)
+    values = _merge_fields(ranked)
+
+    for name in _LIST_FIELDS:
+        seen: Set[str] = set()
+        merged: List[str] = []
+        for company in ranked:
+            for item in getattr(company, name) or ():
+                if item.casefold() not in seen:
+                    seen.add(item.casefold())
+                    merged.append(item)
+        if merged:
+            values[name] = merged
+
+    metadata: Dict[str, Any] = {}
+    for company in reversed(ranked):
+        metadata.update(company.metadata or {})
+    if metadata:
+        values["metadata"] = metadata
+
+    for name, model_cls in (("contact_info", ContactInfo), ("address", Address)):
+        parts = [getattr(c, name) for c in ranked if getattr(c, name) is not None]
+        if len(parts) > 1:
+            values[name] = model_cls.model_construct(**_merge_fields(parts))
+
+    scores = [c.confidence_score for c in ranked if c.confidence_score is not None]
+    if scores:
+        values["confidence_score"] = max(scores)
+    return Company.model_construct(**values)
+
+
+class CompanyIndex:
+    """
+    Incremental duplicate index for Company records
+
+    Usage:
+        index = CompanyIndex()
+        index.extend(research_response.companies)
+        index.extend(companies_from_scraper)
+        unique = index.resolve()
+
+    Args:
+        fuzzy_threshold: Minimum name similarity (Dice coefficient of
+            character trigrams, 0-1) for a fuzzy match
+        max_block_size: Records compared per blocking key; bounds the work
+            per record so indexing stays near-linear
+    """
+
+    def __init__(self, fuzzy_threshold: float = 0.8, max_block_size: int = 32) -> None:
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_block_size = max_block_size
+        self.records: List[Company] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._parent: List[int] = []
+        self._domains: Dict[int, Set[str]] = {}  # cluster root -> known domains
+        self._by_key: Dict[str, int] = {}
+        self._blocks: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ------------------------------------------------------------------
+    # Union-find
+    # ------------------------------------------------------------------
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, a: int, b: int) -> bool:
+        """Join two clusters unless they have conflicting domains"""
+        ra, rb = self._find(a), self._find(b)
+        if ra == rb:
+            return True
+        da, db = self._domains.get(ra), self._domains.get(rb)
+        if da and db and da.isdisjoint(db):
+            return False
+        if len(da or ()) < len(db or ()):
+            ra, rb, da, db = rb, ra, db, da
+        self._parent[rb] = ra
+        if db:
+            self._domains.setdefault(ra, set()).update(db)
+            self._domains.pop(rb, None)
+        return True
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def add(self, company: Company) -> int:
+        """Index one record; returns its record id"""
+        rid = len(self.records)
+        name = normalize_name(company.name)
+        domains = company_domains(company)
+        self.records.append(company)
+        self._parent.append(rid)
+        if domains:
+            self._domains[rid] = set(domains)
+
+        # Exact keys (names made only of punctuation normalize to "" and match nothing)
+        keys = [f"d:{d}" for d in sorted(domains)]
+        if name:
+            keys.append(f"n:{name}")
+        for key in keys:
+            other = self._by_key.setdefault(key, rid)
+            if other != rid:
+                self._union(other, rid)
+
+        # Fuzzy name matching within blocks (name prefix and suffix, so a
+        # typo at either end still lands in a shared block)
+        grams = _trigrams(name)
+        self._grams.append(grams)
+        squashed = name.replace(" ", "")
+        if squashed:
+            for block_key in (f"p:{squashed[:6]}", f"s:{squashed[-6:]}"):
+                block = self._blocks.setdefault(block_key, [])
+                root = self._find(rid)
+                for other in block:
+                    if self._find(other) != root and self._similar(grams, other):
+                        self._union(other, rid)
+                        root = self._find(rid)
+                if len(block) < self.max_block_size:
+                    block.append(rid)
+        return rid
+
+    def _similar(self, grams: FrozenSet[str], other: int) -> bool:
+        """Dice similarity of name trigrams, with a cheap size bound first"""
+        other_grams = self._grams[other]
+        total = len(grams) + len(other_grams)
+        if not total or 2 * min(len(grams), len(other_grams)) < self.fuzzy_threshold * total:
+            return False
+        return 2 * len(grams & other_grams) >= self.fuzzy_threshold * total
+
+    def extend(self, companies: Iterable[Company]) -> None:
+        """Index many records"""
+        for company in companies:
+            self.add(company)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def clusters(self) -> List[List[int]]:
+        """Record ids grouped by resolved entity, in first-seen order"""
+        groups: Dict[int, List[int]] = {}
+        for rid in range(len(self.records)):
+            groups.setdefault(self._find(rid), []).append(rid)
+        return list(groups.values())
+
+    def duplicates_of(self, rid: int) -> List[int]:
+        """Other record ids resolved to the same entity as `rid`"""
+        root = self._find(rid)
+        return [i for i in range(len(self.records)) if i != rid and self._find(i) == root]
+
+    def resolve(self) -> List[Company]:
+        """One merged Company per resolved entity"""
+        return [merge_companies([self.records[i] for i in group]) for group in self.clusters()]
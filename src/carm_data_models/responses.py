@@ -2,14 +2,15 @@
 Service Response Models
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from pydantic import Field
 from .company import Company
 from .email import EmailDraft
-from .common import ServiceMetrics
+from .common import CarmModel, ServiceMetrics
+from .payloads import ScrapedData
 
 
-class ResearchResponse(BaseModel):
+class ResearchResponse(CarmModel):
     """Response from research agent"""
     companies: List[Company] = Field(..., description="Found companies")
     total_found: int = Field(..., description="Total companies found")
@@ -18,16 +19,16 @@ class ResearchResponse(BaseModel):
     metrics: Optional[ServiceMetrics] = Field(None, description="Service metrics")
 
 
-class ScrapeResponse(BaseModel):
+class ScrapeResponse(CarmModel):
     """Response from scraper service"""
-    scraped_data: List[Dict[str, Any]] = Field(..., description="Scraped company data")
+    scraped_data: List[ScrapedData] = Field(..., description="Scraped company data")
     successful_scrapes: int = Field(..., description="Number of successful scrapes")
     failed_scrapes: int = Field(..., description="Number of failed scrapes")
     duration_seconds: float = Field(..., description="How long scraping took")
     metrics: Optional[ServiceMetrics] = Field(None, description="Service metrics")
 
 
-class DraftResponse(BaseModel):
+class DraftResponse(CarmModel):
     """Response from draft agent"""
     drafts: List[EmailDraft] = Field(..., description="Generated email drafts")
     total_generated: int = Field(..., description="Total drafts generated")
@@ -36,12 +37,12 @@ class DraftResponse(BaseModel):
     metrics: Optional[ServiceMetrics] = Field(None, description="Service metrics")
 
 
-class OrchestrationResponse(BaseModel):
+class OrchestrationResponse(CarmModel):
     """Response from orchestrator"""
     task_id: str = Field(..., description="Unique task ID")
     status: str = Field(..., description="Task status")
     research_results: Optional[List[Company]] = Field(None, description="Research results")
-    scraped_data: Optional[List[Dict[str, Any]]] = Field(None, description="Scraped data")
+    scraped_data: Optional[List[ScrapedData]] = Field(None, description="Scraped data")
     drafts: Optional[List[EmailDraft]] = Field(None, description="Email drafts")
     total_duration_seconds: float = Field(..., description="Total workflow duration")
     step_durations: Optional[Dict[str, float]] = Field(None, description="Duration per step")
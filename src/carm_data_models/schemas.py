@@ -0,0 +1,501 @@
+"""
+Cached JSON Schemas
+
+JSON schemas generated once per package version, plus a structural
+compatibility check between two versions of a model.
+
+PSEUDO CODE:
+------------
+1. json_schema(Company) generates the schema on first use and keeps the
+   JSON in memory; later calls only parse the cached JSON
+2. precompute(directory) writes every public model's schemas to one bundle
+   file named after the package version and a hash of the model sources
+   (and the pydantic version), e.g. schemas-0.1.0-3f2a9c1e0b7d4a55.json
+3. With a cache directory configured (configure() or CARM_SCHEMA_CACHE_DIR)
+   a matching bundle is loaded instead of generating schemas at startup;
+   a stale bundle simply has a different name and is never read
+4. check_compatibility(producer, consumer) walks both schemas together and
+   lists every place where data written by the producer could be rejected
+   by the consumer (missing required field, narrower type, stricter
+   constraint, unknown enum value, ...)
+
+Producers are assumed to dump every field (the model_dump() default), so
+a field the consumer requires only has to exist in the producer's schema.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+
+import pydantic
+from pydantic import BaseModel, Field
+
+CACHE_DIR_ENV_VAR = "CARM_SCHEMA_CACHE_DIR"
+
+Mode = Literal["validation", "serialization"]
+MODES: Tuple[Mode, ...] = ("validation", "serialization")
+
+# Schema keys that document a model but do not change its shape
+_NON_STRUCTURAL_KEYS = frozenset({"description", "example", "examples", "title"})
+
+_PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+def strip_docs(node: Any) -> Any:
+    """Schema without descriptions, titles and examples"""
+    if isinstance(node, dict):
+        return {k: strip_docs(v) for k, v in node.items() if k not in _NON_STRUCTURAL_KEYS}
+    if isinstance(node, list):
+        return [strip_docs(v) for v in node]
+    return node
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+_lock = threading.Lock()
+_memory: Dict[Tuple[Type[BaseModel], str], bytes] = {}
+_directory: Optional[Path] = (
+    Path(os.environ[CACHE_DIR_ENV_VAR]) if os.environ.get(CACHE_DIR_ENV_VAR) else None
+)
+_bundle: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+@lru_cache(maxsize=None)
+def cache_key() -> str:
+    """Package version plus a hash of the model sources and the pydantic version"""
+    from . import __version__
+
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return f"{__version__}-{digest.hexdigest()[:16]}"
+
+
+def bundle_path(directory: Union[str, Path]) -> Path:
+    """File holding the precomputed schemas of this package version"""
+    return Path(directory) / f"schemas-{cache_key()}.json"
+
+
+def configure(directory: Union[str, Path, None]) -> None:
+    """Set (or with None, unset) the directory searched for a precomputed bundle"""
+    global _directory, _bundle
+    with _lock:
+        _directory = Path(directory) if directory is not None else None
+        _bundle = None
+
+
+def clear() -> None:
+    """Drop every cached schema (the bundle file is re-read on next use)"""
+    global _bundle
+    with _lock:
+        _memory.clear()
+        _bundle = None
+    from .trusted import schema_fingerprint
+
+    schema_fingerprint.cache_clear()
+
+
+def _from_bundle(model_cls: Type[BaseModel], mode: str) -> Optional[Dict[str, Any]]:
+    """Schema from the bundle on disk, if one matches this package version"""
+    global _bundle
+    if _directory is None or not model_cls.__module__.startswith(_PACKAGE):
+        return None
+    if _bundle is None:
+        try:
+            _bundle = load_bundle(bundle_path(_directory))["schemas"]
+        except (OSError, ValueError, KeyError):
+            _bundle = {}
+    return _bundle.get(model_cls.__name__, {}).get(mode)
+
+
+def json_schema_bytes(model_cls: Type[BaseModel], mode: Mode = "validation") -> bytes:
+    """Cached JSON encoding of model_json_schema(mode=mode), e.g. for OpenAPI responses"""
+    key = (model_cls, mode)
+    cached = _memory.get(key)
+    if cached is None:
+        schema = _from_bundle(model_cls, mode)
+        if schema is None:
+            schema = model_cls.model_json_schema(mode=mode)
+        cached = json.dumps(schema, separators=(",", ":")).encode()
+        with _lock:
+            cached = _memory.setdefault(key, cached)
+    return cached
+
+
+def json_schema(model_cls: Type[BaseModel], mode: Mode = "validation") -> Dict[str, Any]:
+    """
+    Same as model_cls.model_json_schema(mode=mode), generated only once
+
+    Returns a fresh copy, so callers may modify it.
+    """
+    return cast(Dict[str, Any], json.loads(json_schema_bytes(model_cls, mode)))
+
+
+# ============================================================================
+# Bundles
+# ============================================================================
+
+
+def public_models() -> List[Type[BaseModel]]:
+    """Every model exported by the package"""
+    import carm_data_models
+
+    models = (getattr(carm_data_models, name) for name in carm_data_models.__all__)
+    return [
+        model for model in models
+        if isinstance(model, type) and issubclass(model, BaseModel) and model.model_fields
+    ]
+
+
+def build_bundle(models: Optional[Iterable[Type[BaseModel]]] = None) -> Dict[str, Any]:
+    """Schemas of `models` (default: every public model) in both modes"""
+    from . import __version__
+
+    return {
+        "version": __version__,
+        "key": cache_key(),
+        "schemas": {
+            model.__name__: {mode: json_schema(model, mode) for mode in MODES}
+            for model in (public_models() if models is None else models)
+        },
+    }
+
+
+def precompute(
+    directory: Union[str, Path, None] = None,
+    models: Optional[Iterable[Type[BaseModel]]] = None,
+) -> Path:
+    """
+    Write the schema bundle for this package version (e.g. during an image build)
+
+    Defaults to the configured cache directory. The file is replaced
+    atomically, so concurrently starting services never read a partial bundle.
+    """
+    target = Path(directory) if directory is not None else _directory
+    if target is None:
+        raise ValueError(f"No schema cache directory given (set {CACHE_DIR_ENV_VAR})")
+    target.mkdir(parents=True, exist_ok=True)
+    path = bundle_path(target)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(build_bundle(models), separators=(",", ":")))
+    os.replace(tmp, path)
+    return path
+
+
+def load_bundle(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a bundle written by precompute() (any package version)"""
+    bundle = json.loads(Path(path).read_text())
+    if not isinstance(bundle, dict) or not isinstance(bundle.get("schemas"), dict):
+        raise ValueError(f"{path} is not a schema bundle")
+    return bundle
+
+
+# ============================================================================
+# Compatibility
+# ============================================================================
+
+_LOWER_BOUNDS = ("minimum", "exclusiveMinimum", "minLength", "minItems", "minProperties")
+_UPPER_BOUNDS = ("maximum", "exclusiveMaximum", "maxLength", "maxItems", "maxProperties")
+
+Issues = List[Tuple[str, str]]
+
+
+class SchemaIssue(BaseModel):
+    """One place where producer data may be rejected by the consumer"""
+    path: str = Field(..., description="Location in the data, e.g. /companies/*/website")
+    message: str = Field(..., description="What differs")
+
+
+class CompatibilityReport(BaseModel):
+    """Result of check_compatibility()"""
+    producer: str = Field(..., description="Producer model or schema title")
+    consumer: str = Field(..., description="Consumer model or schema title")
+    issues: List[SchemaIssue] = Field(default_factory=list, description="Incompatibilities")
+
+    @property
+    def compatible(self) -> bool:
+        return not self.issues
+
+
+def _types(node: Dict[str, Any]) -> Optional[set]:
+    """JSON types a (non-union) schema allows; None means any"""
+    declared = node.get("type")
+    if declared is not None:
+        return set(declared) if isinstance(declared, list) else {declared}
+    values = _enum(node)
+    if values is not None:
+        return {_json_type(v) for v in values}
+    if "properties" in node:
+        return {"object"}
+    return None
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return "array" if isinstance(value, list) else "object"
+
+
+def _enum(node: Dict[str, Any]) -> Optional[List[Any]]:
+    if "const" in node:
+        return [node["const"]]
+    return node.get("enum")
+
+
+def _accepts_type(consumer: set, produced: str) -> bool:
+    return produced in consumer or (produced == "integer" and "number" in consumer)
+
+
+class _Checker:
+    """Walks a producer and a consumer schema side by side"""
+
+    def __init__(self, producer: Dict[str, Any], consumer: Dict[str, Any]) -> None:
+        self.producer_defs = producer.get("$defs", {})
+        self.consumer_defs = consumer.get("$defs", {})
+        # (producer ref, consumer ref) -> issues relative to that pair
+        self._memo: Dict[Tuple[str, str], Issues] = {}
+
+    @staticmethod
+    def _resolve(node: Dict[str, Any], defs: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        ref = node.get("$ref")
+        if ref is None:
+            return node, ""
+        name = ref.rsplit("/", 1)[-1]
+        target = dict(defs[name])
+        # Keys next to $ref (e.g. a default) apply as well
+        target.update({k: v for k, v in node.items() if k != "$ref"})
+        return target, name
+
+    def check(self, producer: Dict[str, Any], consumer: Dict[str, Any]) -> Issues:
+        producer, producer_ref = self._resolve(producer, self.producer_defs)
+        consumer, consumer_ref = self._resolve(consumer, self.consumer_defs)
+        if not (producer_ref and consumer_ref):
+            return self._check(producer, consumer)
+        key = (producer_ref, consumer_ref)
+        if key not in self._memo:
+            self._memo[key] = []  # recursive models: assume compatible while visiting
+            self._memo[key] = self._check(producer, consumer)
+        return self._memo[key]
+
+    @staticmethod
+    def _options(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        for key in ("anyOf", "oneOf"):
+            if key in node:
+                return cast(List[Dict[str, Any]], node[key])
+        return [node]
+
+    def _check(self, producer: Dict[str, Any], consumer: Dict[str, Any]) -> Issues:
+        consumer_options = self._options(consumer)
+        producer_options = self._options(producer)
+        if len(consumer_options) == 1 and len(producer_options) == 1:
+            return self._check_one(producer, consumer)
+
+        issues: Issues = []
+        for option in producer_options:
+            option, _ = self._resolve(option, self.producer_defs)
+            produced = _types(option)
+            candidates = []
+            for candidate in consumer_options:
+                resolved, _ = self._resolve(candidate, self.consumer_defs)
+                accepted = _types(resolved)
+                if accepted is None or (
+                    produced is not None and all(_accepts_type(accepted, t) for t in produced)
+                ):
+                    candidates.append(candidate)
+            if not candidates:
+                issues.append(("", f"{_describe(option)} is not accepted by the consumer"))
+                continue
+            results = [self.check(option, candidate) for candidate in candidates]
+            if all(results):
+                issues.extend(results[0])
+        return issues
+
+    def _check_one(self, producer: Dict[str, Any], consumer: Dict[str, Any]) -> Issues:
+        issues: Issues = []
+        accepted = _types(consumer)
+        produced = _types(producer)
+        if accepted is not None:
+            if produced is None:
+                issues.append(("", f"consumer expects {_describe(consumer)}, any value produced"))
+                return issues
+            rejected = sorted(t for t in produced if not _accepts_type(accepted, t))
+            if rejected:
+                issues.append(("", f"type {'/'.join(rejected)} is not accepted "
+                                   f"(consumer expects {_describe(consumer)})"))
+                return issues
+
+        allowed = _enum(consumer)
+        if allowed is not None:
+            values = _enum(producer)
+            if values is None:
+                issues.append(("", f"consumer only accepts {allowed}"))
+            else:
+                unknown = [v for v in values if v not in allowed]
+                if unknown:
+                    issues.append(("", f"values {unknown} are not accepted"))
+
+        if "format" in consumer and producer.get("format") != consumer["format"]:
+            issues.append(("", f"consumer requires format {consumer['format']!r}"))
+
+        for key in _LOWER_BOUNDS:
+            if key in consumer and producer.get(key, float("-inf")) < consumer[key]:
+                issues.append(("", f"consumer requires {key} {consumer[key]}"))
+        for key in _UPPER_BOUNDS:
+            if key in consumer and producer.get(key, float("inf")) > consumer[key]:
+                issues.append(("", f"consumer requires {key} {consumer[key]}"))
+
+        kinds = produced or set()
+        if "object" in kinds:
+            issues.extend(self._check_object(producer, consumer))
+        if "array" in kinds and "items" in consumer:
+            for path, message in self.check(producer.get("items", {}), consumer["items"]):
+                issues.append((f"/*{path}", message))
+        return issues
+
+    def _check_object(self, producer: Dict[str, Any], consumer: Dict[str, Any]) -> Issues:
+        issues: Issues = []
+        produced = producer.get("properties", {})
+        expected = consumer.get("properties", {})
+        extra_schema = consumer.get("additionalProperties", True)
+
+        for name in consumer.get("required", ()):
+            if name not in produced:
+                issues.append((f"/{name}", "required by the consumer but not produced"))
+
+        for name, schema in produced.items():
+            if name in expected:
+                target = expected[name]
+            elif extra_schema is False:
+                issues.append((f"/{name}", "produced but not allowed by the consumer"))
+                continue
+            elif isinstance(extra_schema, dict):
+                target = extra_schema
+            else:
+                continue
+            for path, message in self.check(schema, target):
+                issues.append((f"/{name}{path}", message))
+
+        produced_extra = producer.get("additionalProperties")
+        if isinstance(produced_extra, dict) and isinstance(extra_schema, dict):
+            for path, message in self.check(produced_extra, extra_schema):
+                issues.append((f"/*{path}", message))
+        return issues
+
+
+def _describe(node: Dict[str, Any]) -> str:
+    types = _types(node)
+    if types is None:
+        return "any value"
+    described = "/".join(sorted(types))
+    if "format" in node:
+        described += f" ({node['format']})"
+    return described
+
+
+SchemaSource = Union[Type[BaseModel], Dict[str, Any]]
+
+
+def _schema(source: SchemaSource, mode: Mode) -> Tuple[Dict[str, Any], str]:
+    if isinstance(source, dict):
+        return source, str(source.get("title", "schema"))
+    return json_schema(source, mode), source.__name__
+
+
+def check_compatibility(producer: SchemaSource, consumer: SchemaSource) -> CompatibilityReport:
+    """
+    Can data written by `producer` be read by `consumer`?
+
+    Each side is a model class or a JSON schema dict (e.g. from an older
+    bundle). Model classes are compared with the producer's serialization
+    schema and the consumer's validation schema.
+    """
+    producer_schema, producer_name = _schema(producer, "serialization")
+    consumer_schema, consumer_name = _schema(consumer, "validation")
+    report = CompatibilityReport(producer=producer_name, consumer=consumer_name)
+    if strip_docs(producer_schema) == strip_docs(consumer_schema):
+        return report
+    issues = _Checker(producer_schema, consumer_schema).check(producer_schema, consumer_schema)
+    report.issues = [
+        SchemaIssue(path=path or "/", message=message) for path, message in dict.fromkeys(issues)
+    ]
+    return report
+
+
+def check_bundles(
+    producer: Dict[str, Any], consumer: Dict[str, Any]
+) -> Dict[str, CompatibilityReport]:
+    """Compatibility of every model present in both bundles"""
+    producer_schemas, consumer_schemas = producer["schemas"], consumer["schemas"]
+    return {
+        name: check_compatibility(
+            producer_schemas[name]["serialization"], consumer_schemas[name]["validation"]
+        )
+        for name in sorted(set(producer_schemas) & set(consumer_schemas))
+    }
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Precompute and compare model JSON schemas")
+    commands = parser.add_subparsers(dest="command", required=True)
+    write = commands.add_parser("precompute", help="Write the schema bundle of this version")
+    write.add_argument("directory", type=Path)
+    check = commands.add_parser(
+        "check", help="Exit with status 1 if the producer's data may be rejected by the consumer"
+    )
+    check.add_argument("producer", help="Bundle file, or 'current' for the installed models")
+    check.add_argument("consumer", help="Bundle file, or 'current' for the installed models")
+    args = parser.parse_args(argv)
+
+    if args.command == "precompute":
+        print(precompute(args.directory))
+        return 0
+
+    def bundle(source: str) -> Dict[str, Any]:
+        return build_bundle() if source == "current" else load_bundle(source)
+
+    reports = check_bundles(bundle(args.producer), bundle(args.consumer))
+    failed = False
+    for name, report in reports.items():
+        print(f"{name}: {'ok' if report.compatible else 'INCOMPATIBLE'}")
+        for issue in report.issues:
+            print(f"    {issue.path}: {issue.message}")
+        failed = failed or not report.compatible
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,516 @@
+"""
+Append-Only Record Store
+
+File-backed store for Company / EmailDraft records that replaces "dump
+everything to one JSON file and reload it to find three companies".
+
+Layout of a store directory:
+----------------------------
+MANIFEST                  {"generation": 3, "segments": ["seg-0003-00000.log", ...]}
+LOCK                      flock()ed by the single writer
+seg-<gen>-<n>.log         append-only segments of framed records
+
+Record frame:
+-------------
+[u32 size][u32 crc32][u16 key length][u8 flags][key][JSON payload]
+(size and crc cover key + payload; flags=1 marks a deletion)
+
+PSEUDO CODE:
+------------
+1. Opening scans the segment headers (not the payloads) through mmap and
+   builds an in-memory index: key -> (segment, offset, size)
+2. get()/scan() slice the mmap and decode only the requested records
+3. One writer appends whole frames with a single write(); readers call
+   refresh() to index frames appended since they last looked and ignore a
+   partially written tail
+4. compact() copies the live frames (raw bytes, no decoding) into a new
+   generation of segments, swaps MANIFEST atomically and deletes the old
+   files; readers notice the new generation on refresh()
+
+Locking uses fcntl and is skipped on platforms without it.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .company import Company
+from .email import EmailDraft
+from .resolution import email_domain, normalize_domain, normalize_name
+from .trusted import construct_trusted
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+KeyFunc = Callable[[Any], str]
+
+FRAME = struct.Struct(">IIHB")
+FLAG_DELETED = 1
+MANIFEST = "MANIFEST"
+LOCK = "LOCK"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# key -> (segment index, frame offset, frame size)
+Location = Tuple[int, int, int]
+
+
+class StoreError(RuntimeError):
+    """Raised for invalid store operations (read-only store, lock held, corruption)"""
+
+
+# ============================================================================
+# Default keys
+# ============================================================================
+
+
+def company_key(company: Company) -> str:
+    """Website domain, else company email domain, else normalized name"""
+    domain = normalize_domain(company.website)
+    if not domain and company.contact_info:
+        domain = normalize_domain(company.contact_info.website) or email_domain(
+            company.contact_info.email
+        )
+    return domain or f"name:{normalize_name(company.name)}"
+
+
+def draft_key(draft: EmailDraft) -> str:
+    """
+    Recipient, creation time, then a hash of subject and body
+
+    scan(prefix=recipient + "/") lists a recipient's drafts. Two different
+    drafts created at the same moment get different keys, while status
+    changes (approved, sent) keep the key and replace the record.
+    """
+    created = draft.created_at.isoformat() if draft.created_at else ""
+    digest = hashlib.sha256(f"{draft.subject}\0{draft.body}".encode()).hexdigest()[:12]
+    return f"{draft.recipient_email.lower()}/{created}/{digest}"
+
+
+DEFAULT_KEYS: Dict[Type[BaseModel], KeyFunc] = {Company: company_key, EmailDraft: draft_key}
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+
+class _Segment:
+    """One segment file and its (re)mappable read view"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.scanned = 0  # bytes already indexed
+        self._file = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+
+    def view(self, end: int) -> mmap.mmap:
+        """Read-only mapping covering at least `end` bytes"""
+        if self._map is None or len(self._map) < end:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def size(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class RecordStore(Generic[ModelT]):
+    """
+    Append-only, memory-mapped store of one model type
+
+    Usage:
+        with RecordStore("data/companies", Company, writable=True) as store:
+            store.put_many(research_response.companies)
+
+        store = RecordStore("data/companies", Company)    # reader
+        acme = store.get("acme.com")
+        for company in store.scan(prefix="a"):             # lazy, key order
+            ...
+
+    Args:
+        path: Store directory (created by a writer if missing)
+        model: Model class of the records
+        key: Function model -> key (defaults: company_key / draft_key)
+        writable: Open as the single writer (takes an exclusive lock)
+        max_segment_bytes: Start a new segment after this size
+        trusted: Decode records without validation (see carm_data_models.trusted)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model: Type[ModelT] = Company,  # type: ignore[assignment]
+        key: Optional[KeyFunc] = None,
+        writable: bool = False,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        trusted: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.model = model
+        self.key = key or DEFAULT_KEYS.get(model)  # type: ignore[arg-type]
+        self.writable = writable
+        self.max_segment_bytes = max_segment_bytes
+        self.trusted = trusted
+        self.generation = 0
+        self._names: List[str] = []
+        self._segments: List[_Segment] = []
+        self._index: Dict[str, Location] = {}
+        self._keys: List[str] = []  # live keys, kept sorted for scan()
+        self._dead_bytes = 0
+        self._lock_file: Optional[IO[str]] = None
+        self._writer: Optional[IO[bytes]] = None
+
+        if writable:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._lock()
+            if not (self.path / MANIFEST).exists():
+                first = self._segment_name(0, 0)
+                (self.path / first).touch()
+                self._write_manifest(0, [first])
+        elif not (self.path / MANIFEST).exists():
+            raise StoreError(f"No record store at {self.path}")
+        self._load()
+        if writable:
+            self._repair_tail()
+            self._open_writer()
+
+    # ------------------------------------------------------------------
+    # Manifest / segments
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _segment_name(generation: int, number: int) -> str:
+        return f"seg-{generation:04d}-{number:05d}.log"
+
+    def _write_manifest(self, generation: int, names: List[str]) -> None:
+        tmp = self.path / f"{MANIFEST}.tmp"
+        tmp.write_text(json.dumps({"generation": generation, "segments": names}))
+        os.replace(tmp, self.path / MANIFEST)
+        self.generation, self._names = generation, list(names)
+
+    def _read_manifest(self) -> Tuple[int, List[str]]:
+        data = json.loads((self.path / MANIFEST).read_text())
+        return data["generation"], data["segments"]
+
+    def _load(self) -> None:
+        """(Re)open every segment and rebuild the index"""
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+        for attempt in range(3):
+            self.generation, self._names = self._read_manifest()
+            try:
+                for name in self._names:
+                    self._segments.append(_Segment(self.path / name))
+                break
+            except FileNotFoundError:
+                # A compaction replaced the segments while we were opening them
+                for segment in self._segments:
+                    segment.close()
+                self._segments = []
+                if attempt == 2:
+                    raise
+        self._index = {}
+        self._keys = []
+        self._dead_bytes = 0
+        for number in range(len(self._segments)):
+            self._scan_segment(number)
+
+    def _scan_segment(self, number: int) -> None:
+        """Index frames appended to a segment since the last scan"""
+        segment = self._segments[number]
+        end = segment.size()
+        if end <= segment.scanned:
+            return
+        view = segment.view(end)
+        offset = segment.scanned
+        touched = set()
+        while offset + FRAME.size <= end:
+            size, _, key_len, flags = FRAME.unpack_from(view, offset)
+            frame_size = FRAME.size + size
+            if offset + frame_size > end:
+                break  # partially written tail
+            key = bytes(view[offset + FRAME.size:offset + FRAME.size + key_len]).decode()
+            touched.add(key)
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self._dead_bytes += previous[2]
+            if flags & FLAG_DELETED:
+                self._dead_bytes += frame_size
+            else:
+                self._index[key] = (number, offset, frame_size)
+            offset += frame_size
+        segment.scanned = offset
+        self._update_keys(touched)
+
+    def _update_keys(self, touched: Iterable[str]) -> None:
+        """Bring the sorted key list in line with the index for the given keys"""
+        touched = list(touched)
+        if len(touched) > len(self._keys) // 4:
+            self._keys = sorted(self._index)
+            return
+        keys = self._keys
+        for key in touched:
+            position = bisect_left(keys, key)
+            listed = position < len(keys) and keys[position] == key
+            if key in self._index and not listed:
+                insort(keys, key, lo=position)
+            elif listed and key not in self._index:
+                del keys[position]
+
+    def refresh(self) -> None:
+        """Pick up records written (or a compaction done) by the writer"""
+        generation, names = self._read_manifest()
+        if generation != self.generation:
+            self._load()
+            return
+        for name in names[len(self._segments):]:
+            self._segments.append(_Segment(self.path / name))
+            self._names.append(name)
+        for number in range(len(self._segments)):
+            self._scan_segment(number)
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    def _lock(self) -> None:
+        lock_file = self._lock_file = open(self.path / LOCK, "a")
+        if fcntl is None:
+            return
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            self._lock_file = None
+            raise StoreError(f"{self.path} is already open for writing") from None
+
+    def _repair_tail(self) -> None:
+        """Drop a partially written frame left by a crashed writer"""
+        last = self._segments[-1]
+        if last.size() > last.scanned:
+            with open(last.path, "r+b") as fp:
+                fp.truncate(last.scanned)
+
+    def _open_writer(self) -> None:
+        self._writer = open(self._segments[-1].path, "ab")
+
+    def _require_writer(self) -> None:
+        if self._writer is None:
+            raise StoreError("Store is open read-only")
+
+    def _append(self, records: List[Tuple[str, bytes, int]]) -> None:
+        """Write (key, payload, flags) frames with a single write() call"""
+        self._require_writer()
+        assert self._writer is not None
+        if self._segments[-1].scanned >= self.max_segment_bytes:
+            self._writer.close()
+            name = self._segment_name(self.generation, len(self._segments))
+            (self.path / name).touch()
+            self._segments.append(_Segment(self.path / name))
+            self._write_manifest(self.generation, self._names + [name])
+            self._open_writer()
+        frames = []
+        for key, payload, flags in records:
+            key_bytes = key.encode()
+            body = key_bytes + payload
+            frames.append(FRAME.pack(len(body), zlib.crc32(body), len(key_bytes), flags))
+            frames.append(body)
+        self._writer.write(b"".join(frames))
+        self._writer.flush()
+        self._scan_segment(len(self._segments) - 1)
+
+    def _record(self, model: ModelT) -> Tuple[str, bytes, int]:
+        if self.key is None:
+            raise StoreError(f"No key function for {self.model.__name__}; pass key=")
+        return self.key(model), model.model_dump_json().encode(), 0
+
+    def put(self, model: ModelT) -> str:
+        """Append a record (replacing any record with the same key); returns its key"""
+        record = self._record(model)
+        self._append([record])
+        return record[0]
+
+    def put_many(self, models: Iterable[ModelT], batch_size: int = 1000) -> int:
+        """Append many records, `batch_size` frames per write; returns how many were written"""
+        count = 0
+        batch: List[Tuple[str, bytes, int]] = []
+        for model in models:
+            batch.append(self._record(model))
+            if len(batch) >= batch_size:
+                self._append(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._append(batch)
+            count += len(batch)
+        return count
+
+    def delete(self, key: str) -> bool:
+        """Remove a record; returns False if the key was not present"""
+        if key not in self._index:
+            return False
+        self._append([(key, b"", FLAG_DELETED)])
+        return True
+
+    def flush(self, fsync: bool = False) -> None:
+        """Flush appended records (and fsync them to disk if requested)"""
+        if self._writer is not None:
+            self._writer.flush()
+            if fsync:
+                os.fsync(self._writer.fileno())
+
+    def compact(self) -> int:
+        """
+        Rewrite live records into a new generation of segments
+
+        Frames are copied as raw bytes. Returns the number of bytes reclaimed.
+        """
+        self._require_writer()
+        assert self._writer is not None
+        before = sum(segment.size() for segment in self._segments)
+        generation = self.generation + 1
+        names: List[str] = []
+        out = None
+        written = 0
+        for key, (number, offset, size) in self._index.items():
+            if out is None or written >= self.max_segment_bytes:
+                if out is not None:
+                    out.close()
+                names.append(self._segment_name(generation, len(names)))
+                out = open(self.path / names[-1], "wb")
+                written = 0
+            segment = self._segments[number]
+            out.write(segment.view(offset + size)[offset:offset + size])
+            written += size
+        if out is None:
+            names.append(self._segment_name(generation, 0))
+            out = open(self.path / names[-1], "wb")
+        out.flush()
+        os.fsync(out.fileno())
+        out.close()
+
+        self._writer.close()
+        old = [segment.path for segment in self._segments]
+        self._write_manifest(generation, names)
+        self._load()
+        for path in old:
+            path.unlink()
+        self._open_writer()
+        return before - sum(segment.size() for segment in self._segments)
+
+    @property
+    def dead_bytes(self) -> int:
+        """Bytes held by overwritten or deleted records (reclaimed by compact())"""
+        return self._dead_bytes
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _decode(self, location: Location) -> ModelT:
+        number, offset, size = location
+        view = self._segments[number].view(offset + size)
+        body_size, crc, key_len, _ = FRAME.unpack_from(view, offset)
+        body = view[offset + FRAME.size:offset + FRAME.size + body_size]
+        if zlib.crc32(body) != crc:
+            raise StoreError(f"Corrupt record in {self._names[number]} at offset {offset}")
+        payload = body[key_len:]
+        if self.trusted:
+            return construct_trusted(self.model, json.loads(payload))
+        return self.model.model_validate_json(payload)
+
+    def get(self, key: str) -> Optional[ModelT]:
+        """Decode one record, or None if the key is not present"""
+        location = self._index.get(key)
+        return None if location is None else self._decode(location)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, ModelT]:
+        """Records for the keys that are present"""
+        return {key: self._decode(self._index[key]) for key in keys if key in self._index}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> List[str]:
+        """Live keys, sorted"""
+        return list(self._keys)
+
+    def scan(
+        self, start: Optional[str] = None, stop: Optional[str] = None, prefix: Optional[str] = None
+    ) -> Iterator[ModelT]:
+        """
+        Records with start <= key < stop (or keys starting with `prefix`), in
+        key order, decoded lazily
+        """
+        keys = self._keys
+        low = 0 if start is None else bisect_left(keys, start)
+        high = len(keys) if stop is None else bisect_left(keys, stop)
+        if prefix is not None:
+            low = max(low, bisect_left(keys, prefix))
+            high = min(high, bisect_left(keys, prefix + "\U0010ffff"))
+        for key in keys[low:high]:
+            location = self._index.get(key)
+            if location is not None:
+                yield self._decode(location)
+
+    def __iter__(self) -> Iterator[ModelT]:
+        """Records in storage order, decoded lazily"""
+        for location in sorted(self._index.values()):
+            yield self._decode(location)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+        if self._lock_file is not None:
+            self._lock_file.close()  # releases the flock
+            self._lock_file = None
+
+    def __enter__(self) -> "RecordStore[ModelT]":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,488 @@
+"""
+Streaming Codec
+
+Newline-delimited JSON (NDJSON) encoding for the list-heavy service responses.
+
+Wire layout:
+------------
+1. One header line: {"stream": {"model": ..., "items": ...}, "data": {...}}
+   where "data" holds every response field except the item list
+2. One line per item (Company, EmailDraft or scraped record)
+
+Readers validate and yield items one at a time, so a consumer can start
+working on the first company before the last one has arrived. Reading the
+whole stream back with read_ndjson() gives exactly the same response as
+model_validate_json() on the regular JSON body.
+
+Services that still send the regular JSON body can be consumed the same
+way with JSONReader: an incremental parser that finds the item list inside
+the body, yields each item as soon as its closing brace arrives and
+collects the remaining fields (total_found, duration_seconds, metrics, ...)
+wherever they appear.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    get_args,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from .responses import DraftResponse, ResearchResponse, ScrapeResponse
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+# Response model -> name of the list field that is streamed item by item
+STREAM_FIELDS: Dict[Type[BaseModel], str] = {
+    ResearchResponse: "companies",
+    ScrapeResponse: "scraped_data",
+    DraftResponse: "drafts",
+}
+
+
+def stream_field(response_type: Type[BaseModel]) -> str:
+    """Return the streamed list field for a response model"""
+    try:
+        return STREAM_FIELDS[response_type]
+    except KeyError:
+        raise TypeError(f"{response_type.__name__} does not support streaming") from None
+
+
+@lru_cache(maxsize=None)
+def item_adapter(response_type: Type[BaseModel]) -> TypeAdapter:
+    """Cached TypeAdapter for a single item of the streamed list field"""
+    annotation = response_type.model_fields[stream_field(response_type)].annotation
+    (item_type,) = get_args(annotation)
+    return TypeAdapter(item_type)
+
+
+def _split_lines(pending: bytes, chunk: bytes) -> Tuple[List[bytes], bytes]:
+    """Split buffered bytes into complete lines plus the unfinished tail"""
+    lines = (pending + chunk).split(b"\n")
+    return lines[:-1], lines[-1]
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+
+def iter_ndjson(response: BaseModel) -> Iterator[bytes]:
+    """
+    Encode a response as NDJSON lines (each ending with a newline)
+
+    The header comes first, followed by one line per item.
+    """
+    response_type = type(response)
+    field = stream_field(response_type)
+    adapter = item_adapter(response_type)
+
+    meta = json.dumps({"model": response_type.__name__, "items": field}).encode()
+    data = response.model_dump_json(exclude={field}).encode()
+    yield b'{"stream":' + meta + b',"data":' + data + b"}\n"
+
+    for item in getattr(response, field):
+        yield adapter.dump_json(item) + b"\n"
+
+
+def write_ndjson(response: BaseModel, fp: BinaryIO) -> int:
+    """Write a response as NDJSON to a binary file; returns bytes written"""
+    written = 0
+    for line in iter_ndjson(response):
+        written += fp.write(line)
+    return written
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+
+class NDJSONReader:
+    """
+    Incremental NDJSON reader for one response type
+
+    Usage:
+        reader = NDJSONReader(ResearchResponse)
+        for company in reader.iter_items(chunks):
+            ...
+        response = reader.build_response(companies)
+
+    `chunks` may be any iterable of bytes (file object, HTTP body chunks).
+    Only the current line is held in memory. `header` holds the raw
+    non-item response fields once the first line has been read.
+    """
+
+    def __init__(self, response_type: Type[BaseModel]) -> None:
+        self.response_type = response_type
+        self.field = stream_field(response_type)
+        self.header: Optional[Dict[str, Any]] = None
+        self._adapter = item_adapter(response_type)
+
+    def _read_header(self, line: bytes) -> None:
+        try:
+            envelope = json.loads(line)
+            meta, data = envelope["stream"], envelope["data"]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise ValueError("Invalid NDJSON stream header") from exc
+        if meta.get("model") != self.response_type.__name__ or meta.get("items") != self.field:
+            raise ValueError(
+                f"Stream contains {meta.get('model')!r}, expected {self.response_type.__name__!r}"
+            )
+        self.header = data
+
+    def _handle_line(self, line: bytes) -> Optional[Any]:
+        """Consume one line; returns a validated item or None for the header"""
+        if self.header is None:
+            self._read_header(line)
+            return None
+        return self._adapter.validate_json(line)
+
+    def iter_items(self, chunks: Iterable[bytes]) -> Iterator[Any]:
+        """Yield validated items from a synchronous byte stream"""
+        self.header = None
+        pending = b""
+        for chunk in chunks:
+            lines, pending = _split_lines(pending, chunk)
+            for line in lines:
+                if line.strip():
+                    item = self._handle_line(line)
+                    if item is not None:
+                        yield item
+        if pending.strip():
+            item = self._handle_line(pending)
+            if item is not None:
+                yield item
+        if self.header is None:
+            raise ValueError("Empty NDJSON stream")
+
+    async def aiter_items(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+        """Yield validated items from an asynchronous byte stream"""
+        self.header = None
+        pending = b""
+        async for chunk in chunks:
+            lines, pending = _split_lines(pending, chunk)
+            for line in lines:
+                if line.strip():
+                    item = self._handle_line(line)
+                    if item is not None:
+                        yield item
+        if pending.strip():
+            item = self._handle_line(pending)
+            if item is not None:
+                yield item
+        if self.header is None:
+            raise ValueError("Empty NDJSON stream")
+
+    def build_response(self, items: List[Any]) -> BaseModel:
+        """
+        Assemble the full response from the header and already-validated items
+
+        Items are attached as-is and not validated a second time.
+        """
+        if self.header is None:
+            raise ValueError("Stream header has not been read yet")
+        return _build_response(self.response_type, self.field, self.header, items)
+
+
+def _build_response(
+    response_type: Type[BaseModel], field: str, header: Dict[str, Any], items: List[Any]
+) -> BaseModel:
+    response = response_type.model_validate({**header, field: []})
+    setattr(response, field, items)
+    return response
+
+
+def read_ndjson(chunks: Iterable[bytes], response_type: Type[ResponseT]) -> ResponseT:
+    """Read a complete NDJSON stream back into a response model"""
+    reader = NDJSONReader(response_type)
+    items = list(reader.iter_items(chunks))
+    return reader.build_response(items)  # type: ignore[return-value]
+
+
+async def aread_ndjson(chunks: AsyncIterable[bytes], response_type: Type[ResponseT]) -> ResponseT:
+    """Async variant of read_ndjson()"""
+    reader = NDJSONReader(response_type)
+    items = [item async for item in reader.aiter_items(chunks)]
+    return reader.build_response(items)  # type: ignore[return-value]
+
+
+# ============================================================================
+# Incremental parsing of the regular JSON body
+# ============================================================================
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_STRING_END = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]} \t\r\n]")
+
+# Consumed bytes are dropped from the buffer once this many have accumulated
+_COMPACT_AT = 64 * 1024
+
+
+class _ValueScanner:
+    """
+    Finds the end of one JSON value in a growing buffer
+
+    Resumable: when the value is incomplete, scanning continues where it
+    stopped once more bytes arrive, so every byte is looked at once.
+    """
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.pos = start
+        self.depth = 0
+        self.in_string = False
+
+    def shift(self, offset: int) -> None:
+        self.start -= offset
+        self.pos -= offset
+
+    def _skip_string(self, buf: bytearray) -> bool:
+        """Advance past the closing quote; False if the buffer ends first"""
+        while True:
+            match = _STRING_END.search(buf, self.pos)
+            if match is None:
+                self.pos = len(buf)
+                return False
+            if match.group() == b"\\":
+                if match.end() >= len(buf):
+                    self.pos = match.start()
+                    return False
+                self.pos = match.end() + 1
+                continue
+            self.pos = match.end()
+            self.in_string = False
+            return True
+
+    def scan(self, buf: bytearray) -> Optional[int]:
+        """End offset (exclusive) of the value, or None if it is incomplete"""
+        first = buf[self.start:self.start + 1]
+        if first == b'"':
+            if self.pos == self.start:
+                self.pos += 1
+                self.in_string = True
+            return self.pos if self._skip_string(buf) else None
+        if first not in (b"{", b"["):
+            match = _SCALAR_END.search(buf, self.pos)
+            if match is None:
+                self.pos = len(buf)
+                return None
+            return match.start()
+        while True:
+            if self.in_string and not self._skip_string(buf):
+                return None
+            match = _STRUCTURAL.search(buf, self.pos)
+            if match is None:
+                self.pos = len(buf)
+                return None
+            self.pos = match.end()
+            char = match.group()
+            if char == b'"':
+                self.in_string = True
+            elif char in (b"{", b"["):
+                self.depth += 1
+            else:
+                self.depth -= 1
+                if self.depth == 0:
+                    return self.pos
+
+
+class JSONReader:
+    """
+    Incremental parser for a response's regular JSON body
+
+    Same interface as NDJSONReader:
+        reader = JSONReader(ScrapeResponse)
+        async for record in reader.aiter_items(response_body_chunks):
+            ...                                   # each item as soon as it is complete
+        response = reader.build_response(records)  # uses the remaining fields
+
+    Items of the streamed list are validated and yielded one by one. Every
+    other top-level field is collected into `header`, whether it comes
+    before or after the list. Memory use is bounded by the largest single
+    item, not the whole body.
+    """
+
+    def __init__(self, response_type: Type[BaseModel]) -> None:
+        self.response_type = response_type
+        self.field = stream_field(response_type)
+        self.header: Optional[Dict[str, Any]] = None
+        self._adapter = item_adapter(response_type)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0
+        self._state = "start"
+        self._key: Optional[str] = None
+        self._scanner: Optional[_ValueScanner] = None
+        self._fields: Dict[str, Any] = {}
+        self.header = None
+
+    @property
+    def done(self) -> bool:
+        """True once the closing brace of the body has been read"""
+        return self._state == "done"
+
+    def _skip_ws(self) -> bool:
+        """Skip whitespace; False if the buffer is exhausted"""
+        self._pos = _WHITESPACE.match(self._buf, self._pos).end()  # type: ignore[union-attr]
+        return self._pos < len(self._buf)
+
+    def _expect(self, allowed: bytes) -> bytes:
+        char = self._buf[self._pos:self._pos + 1]
+        if char not in [allowed[i:i + 1] for i in range(len(allowed))]:
+            raise ValueError(
+                f"Invalid {self.response_type.__name__} JSON: expected one of "
+                f"{allowed.decode()!r} at byte {self._pos}, got {char.decode(errors='replace')!r}"
+            )
+        self._pos += 1
+        return bytes(char)
+
+    def _value(self) -> Optional[bytes]:
+        """Raw bytes of the next complete value, or None if more data is needed"""
+        if self._scanner is None:
+            self._scanner = _ValueScanner(self._pos)
+        end = self._scanner.scan(self._buf)
+        if end is None:
+            return None
+        raw = bytes(self._buf[self._scanner.start:end])
+        self._pos, self._scanner = end, None
+        return raw
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk; returns the items completed by it (validated)"""
+        if self._state == "done":
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON body")
+            return []
+        self._buf += chunk
+        items: List[Any] = []
+        while self._step(items):
+            pass
+        if self._state == "done" and self._buf[self._pos:].strip():
+            raise ValueError("Unexpected data after the end of the JSON body")
+        if self._pos >= _COMPACT_AT:
+            del self._buf[:self._pos]
+            if self._scanner is not None:
+                self._scanner.shift(self._pos)
+            self._pos = 0
+        return items
+
+    def _step(self, items: List[Any]) -> bool:
+        """Advance the state machine by one token; False when more data is needed"""
+        state = self._state
+        if state == "done" or (self._scanner is None and not self._skip_ws()):
+            return False
+        if state == "start":
+            self._expect(b"{")
+            self._state = "key"
+        elif state == "key":
+            if self._buf[self._pos:self._pos + 1] == b"}" and not self._fields:
+                self._pos += 1
+                self._finish()
+                return False
+            raw = self._value()
+            if raw is None:
+                return False
+            if not raw.startswith(b'"'):
+                raise ValueError(f"Invalid {self.response_type.__name__} JSON: expected a key")
+            self._key = json.loads(raw)
+            self._state = "colon"
+        elif state == "colon":
+            self._expect(b":")
+            self._state = "items_start" if self._key == self.field else "value"
+        elif state == "items_start":
+            if self._buf[self._pos:self._pos + 1] == b"[":
+                self._pos += 1
+                self._fields[self.field] = None
+                self._state = "item"
+            else:
+                self._state = "value"  # e.g. null: validated with the other fields
+        elif state == "value":
+            raw = self._value()
+            if raw is None:
+                return False
+            self._fields[self._key] = json.loads(raw)  # type: ignore[index]
+            self._state = "after_value"
+        elif state == "after_value":
+            if self._expect(b",}") == b",":
+                self._state = "key"
+            else:
+                self._finish()
+                return False
+        elif state == "item":
+            if self._scanner is None and self._buf[self._pos:self._pos + 1] == b"]":
+                self._pos += 1
+                self._state = "after_value"
+                return True
+            raw = self._value()
+            if raw is None:
+                return False
+            items.append(self._adapter.validate_json(raw))
+            self._state = "after_item"
+        elif state == "after_item":
+            self._state = "item" if self._expect(b",]") == b"," else "after_value"
+        return True
+
+    def _finish(self) -> None:
+        self._state = "done"
+        self.header = {k: v for k, v in self._fields.items() if k != self.field}
+
+    def _close(self) -> None:
+        if self._state != "done":
+            raise ValueError(f"Truncated {self.response_type.__name__} JSON body")
+
+    def iter_items(self, chunks: Iterable[bytes]) -> Iterator[Any]:
+        """Yield validated items from a synchronous byte stream"""
+        self._reset()
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        self._close()
+
+    async def aiter_items(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+        """Yield validated items from an asynchronous byte stream"""
+        self._reset()
+        async for chunk in chunks:
+            for item in self.feed(chunk):
+                yield item
+        self._close()
+
+    def build_response(self, items: List[Any]) -> BaseModel:
+        """
+        Assemble the full response from the collected fields and the items
+
+        Items are attached as-is and not validated a second time.
+        """
+        if self.header is None:
+            raise ValueError("The JSON body has not been read completely")
+        return _build_response(self.response_type, self.field, self.header, items)
+
+
+def read_json(chunks: Iterable[bytes], response_type: Type[ResponseT]) -> ResponseT:
+    """Read a regular JSON body incrementally into a response model"""
+    reader = JSONReader(response_type)
+    items = list(reader.iter_items(chunks))
+    return reader.build_response(items)  # type: ignore[return-value]
+
+
+async def aread_json(chunks: AsyncIterable[bytes], response_type: Type[ResponseT]) -> ResponseT:
+    """Async variant of read_json()"""
+    reader = JSONReader(response_type)
+    items = [item async for item in reader.aiter_items(chunks)]
+    return reader.build_response(items)  # type: ignore[return-value]
@@ -0,0 +1,616 @@
+"""
+Synthetic Test Data
+
+Deterministic generator of valid payloads for every public model, used by
+the benchmark suite (benchmarks/bench_models.py) and for load testing.
+
+PSEUDO CODE:
+------------
+1. One seeded random.Random per generator: the same seed always gives the
+   same payloads (timestamps are offsets from a fixed epoch, never "now")
+2. Each model has a generator that returns a raw dict in the model's
+   JSON shape (valid emails, URLs, year ranges and confidence bounds)
+3. Container models take a `size`: companies, drafts or scraped records
+4. SyntheticConfig shapes the data: optional-field fill rate, list lengths
+   and text sizes (to mimic production payloads)
+5. Raw dicts are the fast path; build()/iter_models() validate when model
+   instances are needed
+6. write_ndjson()/write_json() stream millions of records to disk in
+   constant memory
+
+Command line:
+    python -m carm_data_models.synthetic Company 1000000 companies.ndjson --fill-rate 0.7
+"""
+
+import argparse
+import json
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import BaseModel, Field
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+EPOCH = datetime(2024, 1, 1)
+
+INDUSTRIES = (
+    "Technology", "Retail", "Finance", "Healthcare", "Manufacturing",
+    "Education", "Hospitality", "Real Estate", "Logistics", "Marketing",
+)
+SERVICES = (
+    "Web Design", "SEO", "Consulting", "Cloud Hosting", "Mobile Apps",
+    "Branding", "Data Analytics", "IT Support", "E-commerce", "Copywriting",
+)
+TECHNOLOGIES = (
+    "React", "Python", "WordPress", "Shopify", "AWS", "Azure", "Django",
+    "Node.js", "PostgreSQL", "Kubernetes",
+)
+PAIN_POINTS = (
+    "Outdated website", "Slow page loads", "No mobile site", "Low search ranking",
+    "Manual invoicing", "No online booking", "Poor reviews", "High churn",
+)
+CITIES = (
+    ("Austin", "TX", "USA"), ("Denver", "CO", "USA"), ("Toronto", "ON", "Canada"),
+    ("London", None, "UK"), ("Berlin", None, "Germany"), ("Sydney", "NSW", "Australia"),
+)
+NAME_PARTS = (
+    "Acme", "Blue", "River", "Summit", "Pioneer", "Bright", "Nova", "Cedar",
+    "Atlas", "Harbor", "Vertex", "Maple", "Iron", "Golden", "Swift", "Crest",
+)
+NAME_KINDS = ("Labs", "Studio", "Partners", "Group", "Works", "Digital", "Solutions", "Co")
+WORDS = (
+    "growth", "customers", "platform", "quality", "local", "team", "service",
+    "online", "results", "trusted", "modern", "design", "support", "value",
+)
+SOURCES = ("research-agent", "linkedin", "website", "google-maps")
+TOOL_STATUSES = ("pending", "in_progress", "completed", "failed")
+
+# Records per write() call when streaming to disk
+WRITE_BATCH = 1000
+
+_COMPACT = (",", ":")
+
+
+class SyntheticConfig(BaseModel):
+    """Shape of the generated data"""
+    fill_rate: float = Field(
+        1.0, ge=0, le=1, description="Probability that each optional field is filled"
+    )
+    list_length: Optional[Tuple[int, int]] = Field(
+        None, description="(min, max) items for list fields; None = per-field defaults"
+    )
+    text_scale: float = Field(1.0, gt=0, description="Multiplier on generated text lengths")
+
+    class Config:
+        json_schema_extra = {
+            "example": {"fill_rate": 0.7, "list_length": [0, 8], "text_scale": 2.0}
+        }
+
+
+class SyntheticData:
+    """
+    Seeded generator of model payloads
+
+    Usage:
+        data = SyntheticData(seed=42)
+        company = data.company()                      # raw dict
+        response = data.build(ResearchResponse, 100)  # validated model
+
+        sparse = SyntheticData(seed=1, config=SyntheticConfig(fill_rate=0.6))
+        sparse.write_ndjson("companies.ndjson", Company, 1_000_000)
+    """
+
+    def __init__(self, seed: int = 0, config: Optional[SyntheticConfig] = None) -> None:
+        self.seed = seed
+        self.config = config or SyntheticConfig()
+        self.random = random.Random(seed)
+        self._counter = 0
+
+    # ------------------------------------------------------------------
+    # Primitives
+    # ------------------------------------------------------------------
+
+    # random.randint/choice are comparatively slow; these are the hot path
+    def _int(self, low: int, high: int) -> int:
+        return low + int(self.random.random() * (high - low + 1))
+
+    def _choice(self, values: Sequence[Any]) -> Any:
+        return values[int(self.random.random() * len(values))]
+
+    def _next_id(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def _timestamp(self) -> str:
+        return (EPOCH + timedelta(seconds=self._int(0, 365 * 86400 - 1))).isoformat()
+
+    def _text(self, words: int) -> str:
+        words = max(1, round(words * self.config.text_scale))
+        return " ".join(self.random.choices(WORDS, k=words)).capitalize() + "."
+
+    def _sample(self, values: Sequence[str], low: int, high: int) -> List[str]:
+        if self.config.list_length is not None:
+            low, high = self.config.list_length
+        k = self._int(low, high)
+        if k > len(values):
+            return self.random.choices(values, k=k)
+        start = self._int(0, len(values) - 1)
+        return [values[(start + i) % len(values)] for i in range(k)]
+
+    def _fill(self, data: Dict[str, Any], keep: Sequence[str] = ()) -> Dict[str, Any]:
+        """Drop optional fields (all but `keep`) according to the fill rate"""
+        fill_rate = self.config.fill_rate
+        if fill_rate >= 1:
+            return data
+        rand = self.random.random
+        return {k: v for k, v in data.items() if k in keep or rand() < fill_rate}
+
+    def _company_name(self, uid: int) -> str:
+        parts = self._choice(NAME_PARTS), self._choice(NAME_KINDS)
+        return f"{parts[0]} {parts[1]} {uid}"
+
+    # ------------------------------------------------------------------
+    # Entity models
+    # ------------------------------------------------------------------
+
+    def address(self) -> Dict[str, Any]:
+        city, state, country = self._choice(CITIES)
+        return self._fill({
+            "street": f"{self._int(1, 9999)} Main St",
+            "city": city,
+            "state": state,
+            "country": country,
+            "postal_code": f"{self._int(10000, 99999)}",
+        })
+
+    def contact_info(self, domain: Optional[str] = None) -> Dict[str, Any]:
+        domain = domain or f"company{self._next_id()}.example.com"
+        slug = domain.split(".", 1)[0]
+        return self._fill({
+            "email": f"info@{domain}",
+            "phone": f"+1-555-{self._int(0, 9999):04d}",
+            "website": f"https://{domain}/",
+            "linkedin": f"https://www.linkedin.com/company/{slug}/",
+        })
+
+    def company(self) -> Dict[str, Any]:
+        uid = self._next_id()
+        domain = f"company{uid}.example.com"
+        return self._fill({
+            "name": self._company_name(uid),
+            "website": f"https://{domain}/",
+            "industry": self._choice(INDUSTRIES),
+            "description": self._text(20),
+            "employee_count": self._int(1, 5000),
+            "revenue": self._choice(("<$1M", "$1M-$5M", "$5M-$20M", "$20M+")),
+            "founded_year": self._int(1950, 2023),
+            "contact_info": self.contact_info(domain),
+            "address": self.address(),
+            "services": self._sample(SERVICES, 1, 4),
+            "technologies": self._sample(TECHNOLOGIES, 0, 4),
+            "pain_points": self._sample(PAIN_POINTS, 0, 3),
+            "source": self._choice(SOURCES),
+            "found_at": self._timestamp(),
+            "confidence_score": round(self.random.random(), 3),
+            "metadata": {"rank": uid},
+        }, keep=("name",))
+
+    def company_profile(self) -> Dict[str, Any]:
+        return self._fill({
+            "company": self.company(),
+            "tagline": self._text(6),
+            "mission": self._text(15),
+            "values": self._sample(WORDS, 2, 4),
+            "services_detailed": [
+                {"name": name, "description": self._text(10)}
+                for name in self._sample(SERVICES, 1, 3)
+            ],
+            "unique_selling_points": [self._text(8) for _ in range(2)],
+            "team_members": [{"name": "Jordan Lee", "role": "Founder"}],
+            "client_testimonials": [{"client": "Acme", "quote": self._text(12)}],
+        }, keep=("company",))
+
+    def email_draft(self, company: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        company = company or self.company()
+        recipient = (company.get("contact_info") or {}).get("email")
+        return self._fill({
+            "subject": f"Quick idea for {company['name']}",
+            "body": "\n\n".join(self._text(30) for _ in range(3)),
+            "preview_text": self._text(8),
+            "recipient_email": recipient or f"hello@company{self._next_id()}.example.com",
+            "recipient_name": "Alex",
+            "company": company,
+            "personalization_data": {"company_name": company["name"]},
+            "template_name": "cold_outreach",
+            "tone": "professional",
+            "created_at": self._timestamp(),
+            "created_by": "draft-agent",
+        }, keep=("subject", "body", "recipient_email", "company", "created_at"))
+
+    def email_template(self) -> Dict[str, Any]:
+        return self._fill({
+            "name": f"template_{self._next_id()}",
+            "category": "outreach",
+            "subject_template": "Helping {company_name} with {pain_point}",
+            "body_template": "Hi {recipient_name},\n\n" + self._text(40),
+            "required_variables": ["company_name", "pain_point"],
+            "optional_variables": ["recipient_name"],
+            "created_at": self._timestamp(),
+            "updated_at": self._timestamp(),
+        }, keep=(
+            "name", "subject_template", "body_template", "required_variables",
+            "optional_variables", "created_at", "updated_at",
+        ))
+
+    def message(self) -> Dict[str, Any]:
+        return self._fill({
+            "content": self._text(25),
+            "sender": "draft-agent",
+            "recipient": "orchestrator",
+            "timestamp": self._timestamp(),
+            "message_type": "notification",
+        }, keep=("content", "timestamp"))
+
+    def user(self) -> Dict[str, Any]:
+        uid = self._next_id()
+        return self._fill({
+            "id": uid,
+            "username": f"user{uid}",
+            "email": f"user{uid}@example.com",
+            "full_name": f"User {uid}",
+            "created_at": self._timestamp(),
+        }, keep=("id", "username", "email", "created_at"))
+
+    def user_profile(self) -> Dict[str, Any]:
+        return self._fill({
+            "user": self.user(),
+            "company_id": self._int(1, 1000),
+            "role": self._choice(("owner", "admin", "member")),
+            "permissions": ["read", "write"],
+            "preferences": {"tone": "casual"},
+        }, keep=("user",))
+
+    def tool(self) -> Dict[str, Any]:
+        uid = self._next_id()
+        return {
+            "id": uid,
+            "name": f"Tool {uid}",
+            "slug": f"tool-{uid}",
+            "description": self._text(10),
+        }
+
+    def tool_settings(self) -> Dict[str, Any]:
+        return {
+            "tool_id": self._int(1, 50),
+            "user_id": self._int(1, 1000),
+            "settings": {"max_results": self._int(1, 100), "tone": "professional"},
+        }
+
+    def tool_execution(self) -> Dict[str, Any]:
+        return self._fill({
+            "tool_id": self._int(1, 50),
+            "user_id": self._int(1, 1000),
+            "started_at": self._timestamp(),
+            "completed_at": self._timestamp(),
+            "status": self._choice(TOOL_STATUSES),
+            "input_data": {"criteria": self._text(6)},
+            "output_data": {"found": self._int(0, 100)},
+        }, keep=("tool_id", "user_id", "started_at", "status"))
+
+    def service_metrics(self) -> Dict[str, Any]:
+        return self._fill({
+            "duration_seconds": round(self.random.uniform(0.1, 60), 3),
+            "tokens_used": self._int(100, 10000),
+            "estimated_cost": round(self.random.uniform(0, 0.5), 4),
+            "requests_made": self._int(1, 20),
+            "cache_hits": self._int(0, 10),
+            "cache_misses": self._int(0, 10),
+        }, keep=("duration_seconds",))
+
+    def error_response(self) -> Dict[str, Any]:
+        return self._fill({
+            "error": self._text(6),
+            "error_code": "UPSTREAM_TIMEOUT",
+            "details": {"service": "research-agent"},
+            "timestamp": self._timestamp(),
+        }, keep=("error", "timestamp"))
+
+    def scraped_record(self) -> Dict[str, Any]:
+        uid = self._next_id()
+        return self._fill({
+            "source": "website",
+            "name": self._company_name(uid),
+            "url": f"https://company{uid}.example.com/",
+            "title": self._text(5),
+            "text": self._text(60),
+            "emails": [f"hello@company{uid}.example.com"],
+        }, keep=("source", "name", "url"))
+
+    def linkedin_record(self) -> Dict[str, Any]:
+        uid = self._next_id()
+        return self._fill({
+            "source": "linkedin",
+            "name": self._company_name(uid),
+            "url": f"https://linkedin.com/company/company{uid}",
+            "industry": self._choice(INDUSTRIES),
+            "employee_count": self._int(1, 5000),
+            "followers": self._int(0, 50000),
+            "specialties": self._sample(SERVICES, 0, 3),
+        }, keep=("source", "url"))
+
+    def generic_record(self) -> Dict[str, Any]:
+        """Old untyped shape: no known source, arbitrary extra keys"""
+        uid = self._next_id()
+        return self._fill({
+            "name": self._company_name(uid),
+            "url": f"https://company{uid}.example.com/",
+            "rating": round(self.random.uniform(1, 5), 1),
+            "review_count": self._int(0, 500),
+        }, keep=("name",))
+
+    # ------------------------------------------------------------------
+    # Requests / responses (`size` = number of list items)
+    # ------------------------------------------------------------------
+
+    def research_request(self, size: int = 10) -> Dict[str, Any]:
+        return {
+            "criteria": "Small businesses in Austin without a modern website",
+            "max_results": max(1, min(size, 100)),
+            "sources": ["google-maps", "linkedin"],
+            "filters": {"employee_count": {"gte": 10}},
+        }
+
+    def scrape_request(self, size: int = 10) -> Dict[str, Any]:
+        companies = []
+        for _ in range(size):
+            uid = self._next_id()
+            companies.append({
+                "name": self._company_name(uid),
+                "website": f"https://company{uid}.example.com/",
+            })
+        return {"companies": companies, "sources": ["website", "linkedin"]}
+
+    def draft_request(self, size: int = 10) -> Dict[str, Any]:
+        return {"companies": self._companies(size), "sender_company": self.company()}
+
+    def orchestration_request(self, size: int = 10) -> Dict[str, Any]:
+        return {
+            "task_type": "research_and_draft",
+            "criteria": "Dentists in Denver",
+            "max_companies": max(1, min(size, 100)),
+            "sender_company_id": 1,
+            "user_id": 1,
+        }
+
+    def research_response(self, size: int = 10) -> Dict[str, Any]:
+        return {
+            "companies": self._companies(size),
+            "total_found": size,
+            "sources_used": ["google-maps"],
+            "duration_seconds": round(self.random.uniform(1, 30), 3),
+            "metrics": self.service_metrics(),
+        }
+
+    def scrape_response(self, size: int = 10) -> Dict[str, Any]:
+        return {
+            "scraped_data": [self.scraped_record() for _ in range(size)],
+            "successful_scrapes": size,
+            "failed_scrapes": 0,
+            "duration_seconds": round(self.random.uniform(1, 30), 3),
+            "metrics": self.service_metrics(),
+        }
+
+    def draft_response(self, size: int = 10) -> Dict[str, Any]:
+        return {
+            "drafts": [self.email_draft() for _ in range(size)],
+            "total_generated": size,
+            "template_used": "cold_outreach",
+            "duration_seconds": round(self.random.uniform(1, 30), 3),
+            "metrics": self.service_metrics(),
+        }
+
+    def orchestration_response(self, size: int = 10) -> Dict[str, Any]:
+        companies = self._companies(size)
+        return {
+            "task_id": f"task-{self._next_id()}",
+            "status": "completed",
+            "research_results": companies,
+            "scraped_data": [self.scraped_record() for _ in range(size)],
+            "drafts": [self.email_draft(company) for company in companies],
+            "total_duration_seconds": round(self.random.uniform(10, 120), 3),
+            "step_durations": {"research": 4.0, "scrape": 6.5, "draft": 8.5},
+        }
+
+    def _companies(self, size: int) -> List[Dict[str, Any]]:
+        return [self.company() for _ in range(size)]
+
+    # ------------------------------------------------------------------
+    # Generic access
+    # ------------------------------------------------------------------
+
+    def payload(self, model_cls: Type[BaseModel], size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Raw dict for `model_cls`
+
+        `size` is the number of list items for request/response models and is
+        ignored for entity models.
+        """
+        try:
+            generator = getattr(self, GENERATORS[model_cls.__name__])
+        except KeyError:
+            raise ValueError(f"No synthetic generator for {model_cls.__name__}") from None
+        if model_cls.__name__ in SIZED_MODELS and size is not None:
+            return cast(Dict[str, Any], generator(size))
+        return cast(Dict[str, Any], generator())
+
+    def build(self, model_cls: Type[ModelT], size: Optional[int] = None) -> ModelT:
+        """Validated instance of `model_cls`"""
+        return model_cls.model_validate(self.payload(model_cls, size))
+
+    def iter_payloads(
+        self, model_cls: Type[BaseModel], count: int, size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """`count` raw dicts, generated lazily (no validation)"""
+        for _ in range(count):
+            yield self.payload(model_cls, size)
+
+    def iter_models(
+        self, model_cls: Type[ModelT], count: int, size: Optional[int] = None
+    ) -> Iterator[ModelT]:
+        """`count` validated instances, generated lazily"""
+        for payload in self.iter_payloads(model_cls, count, size):
+            yield model_cls.model_validate(payload)
+
+    # ------------------------------------------------------------------
+    # Streaming to disk
+    # ------------------------------------------------------------------
+
+    def _lines(
+        self, model_cls: Type[BaseModel], count: int, size: Optional[int], validate: bool
+    ) -> Iterator[str]:
+        if validate:
+            for model in self.iter_models(model_cls, count, size):
+                yield model.model_dump_json()
+        else:
+            dumps = json.JSONEncoder(separators=_COMPACT).encode
+            for payload in self.iter_payloads(model_cls, count, size):
+                yield dumps(payload)
+
+    def write_ndjson(
+        self,
+        target: Union[str, Path, IO[str]],
+        model_cls: Type[BaseModel],
+        count: int,
+        size: Optional[int] = None,
+        validate: bool = False,
+    ) -> int:
+        """
+        Write `count` records as newline-delimited JSON; returns the record count
+
+        Raw dicts are written unless `validate`, which round-trips every
+        record through the model first (slower, but proves validity).
+        """
+        with _open(target) as fp:
+            batch: List[str] = []
+            for line in self._lines(model_cls, count, size, validate):
+                batch.append(line)
+                if len(batch) >= WRITE_BATCH:
+                    fp.write("\n".join(batch) + "\n")
+                    batch.clear()
+            if batch:
+                fp.write("\n".join(batch) + "\n")
+        return count
+
+    def write_json(
+        self,
+        target: Union[str, Path, IO[str]],
+        model_cls: Type[BaseModel],
+        count: int,
+        size: Optional[int] = None,
+        validate: bool = False,
+    ) -> int:
+        """Write `count` records as one JSON array (streamed); returns the record count"""
+        with _open(target) as fp:
+            fp.write("[")
+            batch: List[str] = []
+            first = True
+            for line in self._lines(model_cls, count, size, validate):
+                batch.append(line)
+                if len(batch) >= WRITE_BATCH:
+                    fp.write(("" if first else ",") + ",".join(batch))
+                    first = False
+                    batch.clear()
+            if batch:
+                fp.write(("" if first else ",") + ",".join(batch))
+            fp.write("]")
+        return count
+
+
+@contextmanager
+def _open(target: Union[str, Path, IO[str]]) -> Iterator[IO[str]]:
+    """Open a path for writing, or pass through an already open text stream"""
+    if isinstance(target, (str, Path)):
+        with open(target, "w", encoding="utf-8") as fp:
+            yield fp
+    else:
+        yield target
+
+
+# Model class name -> SyntheticData method
+GENERATORS: Dict[str, str] = {
+    "Address": "address",
+    "ContactInfo": "contact_info",
+    "Company": "company",
+    "CompanyProfile": "company_profile",
+    "EmailDraft": "email_draft",
+    "EmailTemplate": "email_template",
+    "Message": "message",
+    "User": "user",
+    "UserProfile": "user_profile",
+    "Tool": "tool",
+    "ToolSettings": "tool_settings",
+    "ToolExecution": "tool_execution",
+    "ResearchRequest": "research_request",
+    "ScrapeRequest": "scrape_request",
+    "DraftRequest": "draft_request",
+    "OrchestrationRequest": "orchestration_request",
+    "ResearchResponse": "research_response",
+    "ScrapeResponse": "scrape_response",
+    "DraftResponse": "draft_response",
+    "OrchestrationResponse": "orchestration_response",
+    "ServiceMetrics": "service_metrics",
+    "ErrorResponse": "error_response",
+    "WebsiteScrape": "scraped_record",
+    "LinkedInScrape": "linkedin_record",
+    "GenericScrape": "generic_record",
+}
+
+# Models whose generator takes a `size`
+SIZED_MODELS = frozenset({
+    "ResearchRequest", "ScrapeRequest", "DraftRequest", "OrchestrationRequest",
+    "ResearchResponse", "ScrapeResponse", "DraftResponse", "OrchestrationResponse",
+})
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    import carm_data_models
+
+    parser = argparse.ArgumentParser(description="Write synthetic model payloads to disk")
+    parser.add_argument("model", choices=sorted(GENERATORS))
+    parser.add_argument("count", type=int)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--format", choices=("ndjson", "json"), default="ndjson")
+    parser.add_argument("--size", type=int, default=None, help="List items per response")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fill-rate", type=float, default=1.0)
+    parser.add_argument("--list-length", type=int, nargs=2, default=None, metavar=("MIN", "MAX"))
+    parser.add_argument("--text-scale", type=float, default=1.0)
+    parser.add_argument("--validate", action="store_true", help="Validate every record")
+    args = parser.parse_args(argv)
+
+    config = SyntheticConfig(
+        fill_rate=args.fill_rate, list_length=args.list_length, text_scale=args.text_scale
+    )
+    data = SyntheticData(seed=args.seed, config=config)
+    write = data.write_json if args.format == "json" else data.write_ndjson
+    write(args.output, getattr(carm_data_models, args.model), args.count, args.size, args.validate)
+
+
+if __name__ == "__main__":
+    main()
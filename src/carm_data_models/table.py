@@ -0,0 +1,387 @@
+"""
+Columnar Company Table
+
+Struct-of-arrays view over a list of Company models for fast filtering,
+sorting and ranking of research results.
+
+PSEUDO CODE:
+------------
+1. Numeric fields (employee_count, founded_year, confidence_score) become
+   NumPy arrays with a boolean "present" mask for nulls
+2. Category fields (industry, source) are dictionary-encoded:
+   an int32 code per row (-1 = null) plus a list of distinct values
+3. Every operation works on whole columns and returns a new table
+4. The original Company objects are kept, so converting back is free
+
+Requires NumPy: pip install "carm-data-models[table]"
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from .company import Company
+from .responses import ResearchResponse
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "employee_count": "int64",
+    "founded_year": "int64",
+    "confidence_score": "float64",
+}
+CATEGORY_COLUMNS = ("industry", "source")
+
+# Filter operators accepted in ResearchRequest.filters, e.g. {"employee_count": {"gte": 10}}
+FILTER_OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in")
+
+Predicate = Callable[["CompanyTable"], Any]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "CompanyTable requires numpy. Install with: pip install 'carm-data-models[table]'"
+        )
+
+
+class CompanyTable:
+    """
+    Columnar table of companies
+
+    Usage:
+        table = CompanyTable.from_response(research_response)
+        best = table.apply_filters(request.filters).top_k("confidence_score", 10)
+        companies = best.to_companies()
+    """
+
+    def __init__(
+        self,
+        rows: Any,
+        values: Dict[str, Any],
+        present: Dict[str, Any],
+        codes: Dict[str, Any],
+        categories: Dict[str, List[str]],
+    ) -> None:
+        self._rows = rows
+        self._values = values
+        self._present = present
+        self._codes = codes
+        self._categories = categories
+
+    # ------------------------------------------------------------------
+    # Construction / conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_companies(cls, companies: Iterable[Company]) -> "CompanyTable":
+        """Build a table from Company models"""
+        _require_numpy()
+        companies = list(companies)
+        rows = np.empty(len(companies), dtype=object)
+        rows[:] = companies
+
+        values: Dict[str, Any] = {}
+        present: Dict[str, Any] = {}
+        for name, dtype in NUMERIC_COLUMNS.items():
+            raw = [getattr(company, name) for company in companies]
+            present[name] = np.fromiter((v is not None for v in raw), dtype=bool, count=len(raw))
+            values[name] = np.fromiter(
+                (0 if v is None else v for v in raw), dtype=dtype, count=len(raw)
+            )
+
+        codes: Dict[str, Any] = {}
+        categories: Dict[str, List[str]] = {}
+        for name in CATEGORY_COLUMNS:
+            lookup: Dict[str, int] = {}
+            column_codes = np.empty(len(companies), dtype=np.int32)
+            for i, company in enumerate(companies):
+                value = getattr(company, name)
+                column_codes[i] = -1 if value is None else lookup.setdefault(value, len(lookup))
+            codes[name] = column_codes
+            categories[name] = list(lookup)
+
+        return cls(rows, values, present, codes, categories)
+
+    @classmethod
+    def from_response(cls, response: ResearchResponse) -> "CompanyTable":
+        """Build a table from a research agent response"""
+        return cls.from_companies(response.companies)
+
+    def to_companies(self) -> List[Company]:
+        """Return the Company models in table order"""
+        return list(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"CompanyTable(rows={len(self)})"
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    def values(self, column: str) -> Any:
+        """Raw values of a numeric column (nulls hold 0; see present())"""
+        return self._values[self._numeric(column)]
+
+    def present(self, column: str) -> Any:
+        """Boolean mask: True where a numeric or category value is not null"""
+        if column in self._codes:
+            return self._codes[column] >= 0
+        return self._present[self._numeric(column)]
+
+    def labels(self, column: str) -> List[Optional[str]]:
+        """Decoded values of a category column"""
+        categories = self._categories[self._category(column)]
+        return [categories[code] if code >= 0 else None for code in self._codes[column]]
+
+    def _numeric(self, column: str) -> str:
+        if column not in self._values:
+            raise ValueError(f"Unknown numeric column: {column!r}")
+        return column
+
+    def _category(self, column: str) -> str:
+        if column not in self._codes:
+            raise ValueError(f"Unknown category column: {column!r}")
+        return column
+
+    # ------------------------------------------------------------------
+    # Row selection
+    # ------------------------------------------------------------------
+
+    def take(self, indices: Any) -> "CompanyTable":
+        """New table with the given row indices (or boolean mask), in that order"""
+        return CompanyTable(
+            self._rows[indices],
+            {name: col[indices] for name, col in self._values.items()},
+            {name: col[indices] for name, col in self._present.items()},
+            {name: col[indices] for name, col in self._codes.items()},
+            self._categories,
+        )
+
+    def filter(self, mask: Any) -> "CompanyTable":
+        """New table with the rows where `mask` is True"""
+        return self.take(np.asarray(mask, dtype=bool))
+
+    def apply_filters(
+        self, filters: Optional[Dict[str, Any]], strict: bool = False
+    ) -> "CompanyTable":
+        """Filter rows with a ResearchRequest.filters dict (see compile_filters)"""
+        if not filters:
+            return self
+        return self.filter(compile_filters(filters, strict=strict)(self))
+
+    def _sort_key(self, column: str, descending: bool) -> Any:
+        if column in self._codes:
+            categories = self._categories[column]
+            codes = self._codes[column]
+            if not categories:
+                return np.zeros(len(codes), dtype=np.int64)
+            # Rank of each code in alphabetical order of the category values
+            order = np.argsort(np.array(categories, dtype=object), kind="stable")
+            rank = np.empty(len(categories), dtype=np.int64)
+            rank[order] = np.arange(len(categories))
+            key = np.where(codes >= 0, rank[np.maximum(codes, 0)], 0)
+        else:
+            key = self._values[self._numeric(column)]
+        return -key if descending else key
+
+    def argsort(self, by: Union[str, Sequence[str]], descending: bool = False) -> Any:
+        """Stable row order by one or more columns; nulls always sort last"""
+        columns = [by] if isinstance(by, str) else list(by)
+        keys = []
+        # np.lexsort uses the last key as the primary one
+        for column in reversed(columns):
+            keys.append(self._sort_key(column, descending))
+            keys.append(~self.present(column))
+        return np.lexsort(keys)
+
+    def sort(self, by: Union[str, Sequence[str]], descending: bool = False) -> "CompanyTable":
+        """New table sorted by one or more columns (nulls last)"""
+        return self.take(self.argsort(by, descending))
+
+    def top_k(self, by: str, k: int, descending: bool = True) -> "CompanyTable":
+        """
+        The k best rows by a numeric column, ignoring nulls
+
+        Uses a partial sort, so cost is O(n + k log k) rather than O(n log n).
+        """
+        candidates = np.flatnonzero(self.present(by))
+        if k <= 0 or not len(candidates):
+            return self.take(candidates[:0])
+        key = self._sort_key(by, descending)[candidates]
+        if k < len(candidates):
+            part = np.argpartition(key, k - 1)[:k]
+            candidates, key = candidates[part], key[part]
+        return self.take(candidates[np.argsort(key, kind="stable")])
+
+    # ------------------------------------------------------------------
+    # Grouping
+    # ------------------------------------------------------------------
+
+    def group_by(self, column: str) -> Dict[Optional[str], "CompanyTable"]:
+        """Split into one table per category value (None for nulls)"""
+        codes = self._codes[self._category(column)]
+        categories = self._categories[column]
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        groups: Dict[Optional[str], CompanyTable] = {}
+        for chunk in np.split(order, bounds):
+            if len(chunk):
+                code = int(codes[chunk[0]])
+                groups[categories[code] if code >= 0 else None] = self.take(chunk)
+        return groups
+
+    def group_counts(self, column: str) -> Dict[Optional[str], int]:
+        """Row count per category value"""
+        codes = self._codes[self._category(column)]
+        categories = self._categories[column]
+        counts = np.bincount(codes + 1, minlength=len(categories) + 1)
+        result: Dict[Optional[str], int] = {
+            categories[i]: int(n) for i, n in enumerate(counts[1:]) if n
+        }
+        if counts[0]:
+            result[None] = int(counts[0])
+        return result
+
+    def group_mean(self, column: str, value_column: str) -> Dict[Optional[str], Optional[float]]:
+        """Mean of a numeric column per category value (nulls ignored)"""
+        codes = self._codes[self._category(column)] + 1
+        mask = self.present(value_column)
+        size = len(self._categories[column]) + 1
+        totals = np.bincount(codes[mask], weights=self.values(value_column)[mask], minlength=size)
+        counts = np.bincount(codes[mask], minlength=size)
+        present_groups = np.bincount(codes, minlength=size)
+        labels: List[Optional[str]] = [None, *self._categories[column]]
+        return {
+            labels[i]: (float(totals[i] / counts[i]) if counts[i] else None)
+            for i in range(size)
+            if present_groups[i]
+        }
+
+
+# ============================================================================
+# Filters
+# ============================================================================
+
+
+def _members(column: str, operand: Any) -> List[Any]:
+    """Operand of an "in" filter, which must be a list"""
+    if not isinstance(operand, (list, tuple, set, frozenset)):
+        raise ValueError(
+            f"Operator 'in' for {column!r} needs a list, got {type(operand).__name__}"
+        )
+    return list(operand)
+
+
+def _number(column: str, value: Any) -> Any:
+    # bool is an int subclass, but {"employee_count": true} is a mistake
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Filter on {column!r} needs a number, got {value!r}")
+    return value
+
+
+def _numeric_predicate(column: str, op: str, operand: Any) -> Predicate:
+    if op == "in":
+        operand = [_number(column, v) for v in _members(column, operand)]
+    else:
+        operand = _number(column, operand)
+
+    def predicate(table: CompanyTable) -> Any:
+        values = table.values(column)
+        if op == "eq":
+            result = values == operand
+        elif op == "ne":
+            result = values != operand
+        elif op == "gt":
+            result = values > operand
+        elif op == "gte":
+            result = values >= operand
+        elif op == "lt":
+            result = values < operand
+        elif op == "lte":
+            result = values <= operand
+        else:
+            result = np.isin(values, operand)
+        return result & table.present(column)
+
+    return predicate
+
+
+def _category_predicate(column: str, op: str, operand: Any) -> Predicate:
+    if op not in ("eq", "ne", "in"):
+        raise ValueError(f"Operator {op!r} is not supported for category column {column!r}")
+    values = _members(column, operand) if op == "in" else [operand]
+    # None stands for a null, and nulls never match
+    wanted = {str(v).casefold() for v in values if v is not None}
+
+    def predicate(table: CompanyTable) -> Any:
+        categories = table._categories[column]
+        matching = [code for code, value in enumerate(categories) if value.casefold() in wanted]
+        hit = np.isin(table._codes[column], matching)
+        return hit if op != "ne" else ~hit & table.present(column)
+
+    return predicate
+
+
+def _column_predicates(column: str, spec: Any, strict: bool) -> List[Predicate]:
+    if column in NUMERIC_COLUMNS:
+        make = _numeric_predicate
+    elif column in CATEGORY_COLUMNS:
+        make = _category_predicate
+    elif strict:
+        raise ValueError(f"Unknown filter field: {column!r}")
+    else:
+        return []
+
+    if isinstance(spec, dict):
+        unknown = set(spec) - set(FILTER_OPERATORS)
+        if unknown:
+            raise ValueError(f"Unknown filter operators for {column!r}: {sorted(unknown)}")
+        return [make(column, op, operand) for op, operand in spec.items()]
+    if isinstance(spec, (list, tuple, set)):
+        return [make(column, "in", spec)]
+    return [make(column, "eq", spec)]
+
+
+def compile_filters(filters: Dict[str, Any], strict: bool = False) -> Predicate:
+    """
+    Compile a ResearchRequest.filters dict into a vectorized predicate
+
+    Supported forms (all conditions are AND-ed, nulls never match):
+        {"industry": "Technology"}                  equality (case-insensitive)
+        {"source": ["linkedin", "web_search"]}      membership
+        {"employee_count": {"gte": 10, "lt": 500}}  operators: eq ne gt gte lt lte in
+        {"min_founded_year": 2010}                  shorthand for {"gte": 2010}
+        {"max_employee_count": 200}                 shorthand for {"lte": 200}
+
+    Keys that are not table columns (e.g. "location") are left to other
+    filtering steps and ignored here, unless `strict` is set.
+
+    Returns a callable taking a CompanyTable and returning a boolean mask.
+
+    Raises:
+        ValueError: On unknown operators, a non-numeric operand for a
+            numeric column, an "in" operand that is not a list, or (with
+            strict=True) unknown fields; checked at compile time
+    """
+    predicates: List[Predicate] = []
+    for key, spec in filters.items():
+        if key.startswith("min_") and key[4:] in NUMERIC_COLUMNS:
+            predicates.append(_numeric_predicate(key[4:], "gte", spec))
+        elif key.startswith("max_") and key[4:] in NUMERIC_COLUMNS:
+            predicates.append(_numeric_predicate(key[4:], "lte", spec))
+        else:
+            predicates.extend(_column_predicates(key, spec, strict))
+
+    def predicate(table: CompanyTable) -> Any:
+        mask = np.ones(len(table), dtype=bool)
+        for check in predicates:
+            mask &= check(table)
+        return mask
+
+    return predicate
@@ -0,0 +1,346 @@
+"""
+Email Template Engine
+
+Compiled form of EmailTemplate for rendering drafts in bulk.
+
+PSEUDO CODE:
+------------
+1. Parse {placeholders} in subject/body/preview once
+2. Check every placeholder is declared in required/optional variables
+3. Precompute which company/sender variables the template actually uses
+4. For each company: look up only those variables, join the segments,
+   and build an EmailDraft without re-validating the company
+5. Collect missing required variables per record instead of raising
+
+Variables available to templates:
+---------------------------------
+Company:  company_name, company_website, industry, company_description,
+          employee_count, founded_year, revenue, services, technologies,
+          pain_point, pain_points, city, country, contact_email, contact_phone
+Sender:   sender_company, sender_website, sender_industry, sender_tagline,
+          sender_services, unique_selling_point, sender_name, sender_role
+Anything else (e.g. recipient_name) must come from `overrides`.
+"""
+
+from string import Formatter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from .company import Company, CompanyProfile
+from .email import EmailDraft
+from .validators import CachedEmailStr
+
+if TYPE_CHECKING:
+    from .email import EmailTemplate
+
+# Overrides: one mapping for every record, or one mapping per company
+Overrides = Union[Mapping[str, Any], Sequence[Optional[Mapping[str, Any]]], None]
+
+# A compiled text: literal segments interleaved with variable slots
+_Segment = Tuple[str, Optional[str], str, Optional[str]]  # literal, field, format_spec, conversion
+
+_EMAIL_ADAPTER = TypeAdapter(CachedEmailStr)
+_MISSING = object()
+
+
+def _join(values: Optional[List[str]]) -> Optional[str]:
+    return ", ".join(values) if values else None
+
+
+def _first(values: Optional[List[str]]) -> Optional[str]:
+    return values[0] if values else None
+
+
+COMPANY_VARIABLES: Dict[str, Callable[[Company], Any]] = {
+    "company_name": lambda c: c.name,
+    "company_website": lambda c: str(c.website) if c.website else None,
+    "industry": lambda c: c.industry,
+    "company_description": lambda c: c.description,
+    "employee_count": lambda c: c.employee_count,
+    "founded_year": lambda c: c.founded_year,
+    "revenue": lambda c: c.revenue,
+    "services": lambda c: _join(c.services),
+    "technologies": lambda c: _join(c.technologies),
+    "pain_point": lambda c: _first(c.pain_points),
+    "pain_points": lambda c: _join(c.pain_points),
+    "city": lambda c: c.address.city if c.address else None,
+    "country": lambda c: c.address.country if c.address else None,
+    "contact_email": lambda c: c.contact_info.email if c.contact_info else None,
+    "contact_phone": lambda c: c.contact_info.phone if c.contact_info else None,
+}
+
+SENDER_VARIABLES: Dict[str, Callable[[CompanyProfile], Any]] = {
+    "sender_company": lambda p: p.company.name,
+    "sender_website": lambda p: str(p.company.website) if p.company.website else None,
+    "sender_industry": lambda p: p.company.industry,
+    "sender_tagline": lambda p: p.tagline,
+    "sender_services": lambda p: _join(p.company.services),
+    "unique_selling_point": lambda p: _first(p.unique_selling_points),
+    "sender_name": lambda p: p.team_members[0].get("name") if p.team_members else None,
+    "sender_role": lambda p: p.team_members[0].get("role") if p.team_members else None,
+}
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be compiled, or a value does not fit its format spec"""
+
+
+class RenderBatchResult(BaseModel):
+    """
+    Result of render_batch()
+
+    `drafts` is aligned with the input companies: position i holds the
+    draft, or None when record i could not be rendered (see `missing[i]`
+    and `errors[i]`).
+    """
+    drafts: List[Optional[EmailDraft]] = Field(default_factory=list, description="Rendered drafts")
+    missing: Dict[int, List[str]] = Field(
+        default_factory=dict,
+        description="Missing required variables (or an empty subject/body) per company index",
+    )
+    errors: Dict[int, str] = Field(
+        default_factory=dict,
+        description="Values that do not fit their placeholder's format spec, per company index",
+    )
+
+    @property
+    def rendered(self) -> List[EmailDraft]:
+        """Only the successfully rendered drafts, in input order"""
+        return [draft for draft in self.drafts if draft is not None]
+
+
+def _parse(text: Optional[str]) -> Tuple[_Segment, ...]:
+    if text is None:
+        return ()
+    segments = []
+    for literal, field, spec, conversion in Formatter().parse(text):
+        if field is not None and not field.isidentifier():
+            raise TemplateError(f"Unsupported placeholder {{{field}}}: use plain variable names")
+        segments.append((literal, field, spec or "", conversion))
+    return tuple(segments)
+
+
+def _render(segments: Tuple[_Segment, ...], values: Mapping[str, Any]) -> str:
+    parts = []
+    for literal, field, spec, conversion in segments:
+        parts.append(literal)
+        if field is not None:
+            value = values[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            try:
+                parts.append(format(value, spec))
+            except (ValueError, TypeError) as exc:
+                raise TemplateError(f"{{{field}:{spec}}} cannot format {value!r}: {exc}") from exc
+    return "".join(parts)
+
+
+class CompiledTemplate:
+    """
+    Parsed, verified form of an EmailTemplate
+
+    Obtain one with EmailTemplate.compile(); it is cached on the template.
+    """
+
+    def __init__(self, template: "EmailTemplate") -> None:
+        self.name = template.name
+        self.tone = template.tone
+        self.key = compile_key(template)
+        self.subject = _parse(template.subject_template)
+        self.body = _parse(template.body_template)
+        preview = template.preview_text_template
+        self.preview = _parse(preview) if preview else None
+
+        self.required: FrozenSet[str] = frozenset(template.required_variables)
+        self.optional: FrozenSet[str] = frozenset(template.optional_variables or ())
+        used = {
+            field
+            for segments in (self.subject, self.body, self.preview or ())
+            for _, field, _, _ in segments
+            if field is not None
+        }
+        undeclared = used - self.required - self.optional
+        if undeclared:
+            raise TemplateError(
+                f"Template {self.name!r} uses undeclared variables: {sorted(undeclared)}"
+            )
+        self.variables: FrozenSet[str] = frozenset(used)
+        # Required variables are checked even when the texts do not use them;
+        # "recipient_name" is also copied onto the draft when available
+        self._lookup = tuple(sorted(used | self.required | {"recipient_name"}))
+
+    def render(self, variables: Mapping[str, Any]) -> Tuple[Optional[Dict[str, str]], List[str]]:
+        """
+        Render subject/body/preview_text from a mapping of variables
+
+        Returns (texts, missing): texts is None when required variables are
+        missing, or when the subject or body renders empty ("subject" / "body"
+        is then reported). Optional variables that are missing render as
+        empty strings.
+
+        Raises:
+            TemplateError: If a value does not fit its placeholder's format spec
+        """
+        values, missing = self._resolve(variables.get)
+        if missing:
+            return None, missing
+        texts = {"subject": _render(self.subject, values), "body": _render(self.body, values)}
+        empty = [name for name, text in texts.items() if not text]
+        if empty:
+            return None, empty
+        if self.preview is not None:
+            texts["preview_text"] = _render(self.preview, values)
+        return texts, []
+
+    def _resolve(self, get: Callable[[str], Any]) -> Tuple[Dict[str, Any], List[str]]:
+        values: Dict[str, Any] = {}
+        missing: List[str] = []
+        for name in self._lookup:
+            value = get(name)
+            if value is None or value == "":
+                if name in self.required:
+                    missing.append(name)
+                elif name in self.variables:
+                    values[name] = ""
+            else:
+                values[name] = value
+        return values, missing
+
+    def render_batch(
+        self,
+        companies: Iterable[Company],
+        sender_profile: Optional[CompanyProfile] = None,
+        overrides: Overrides = None,
+    ) -> RenderBatchResult:
+        """
+        Render one EmailDraft per company
+
+        Args:
+            companies: Target companies (already validated models)
+            sender_profile: Sender CompanyProfile for sender_* variables
+            overrides: Extra variables, either one mapping for all records or a
+                sequence with one mapping (or None) per company. Overrides win
+                over company and sender variables. "recipient_email" here
+                replaces the company's contact email.
+
+        Records missing required variables (or a recipient email), or whose
+        subject or body renders empty, are reported in `missing` and skipped;
+        records with a value that does not fit its format spec (e.g. text for
+        {employee_count:>5d}) are reported in `errors`. The batch never stops
+        at the first failure.
+        """
+        companies = list(companies)
+        shared: Mapping[str, Any] = {}
+        per_record: Optional[Sequence[Optional[Mapping[str, Any]]]] = None
+        if isinstance(overrides, Mapping):
+            shared = overrides
+        elif isinstance(overrides, (str, bytes)):
+            raise TypeError("overrides must be a mapping or a sequence of mappings, not a string")
+        elif overrides is not None:
+            per_record = overrides
+            if len(per_record) != len(companies):
+                raise ValueError("Per-company overrides must match the number of companies")
+
+        # Sender values and the company getters are resolved once per batch
+        sender_values: Dict[str, Any] = {}
+        if sender_profile is not None:
+            sender_values = {
+                name: getter(sender_profile)
+                for name, getter in SENDER_VARIABLES.items()
+                if name in self._lookup
+            }
+        company_getters = {
+            name: getter for name, getter in COMPANY_VARIABLES.items() if name in self._lookup
+        }
+
+        result = RenderBatchResult()
+        for index, company in enumerate(companies):
+            record = per_record[index] if per_record is not None else None
+            record = record or {}
+
+            def get(
+                name: str, company: Company = company, record: Mapping[str, Any] = record
+            ) -> Any:
+                value = record.get(name, _MISSING)
+                if value is _MISSING:
+                    value = shared.get(name, _MISSING)
+                if value is _MISSING:
+                    getter = company_getters.get(name)
+                    value = getter(company) if getter else sender_values.get(name)
+                return value
+
+            values, missing = self._resolve(get)
+            recipient: Optional[str] = None
+            given = record.get("recipient_email") or shared.get("recipient_email")
+            if given:
+                try:
+                    recipient = str(_EMAIL_ADAPTER.validate_python(given))
+                except ValidationError:
+                    pass
+            elif company.contact_info and company.contact_info.email:
+                # Already validated as part of the company
+                recipient = company.contact_info.email
+            if recipient is None:
+                missing.append("recipient_email")
+
+            subject = body = ""
+            preview: Optional[str] = None
+            if not missing:
+                try:
+                    subject, body = _render(self.subject, values), _render(self.body, values)
+                    preview = _render(self.preview, values) if self.preview else None
+                except TemplateError as exc:
+                    result.drafts.append(None)
+                    result.errors[index] = str(exc)
+                    continue
+                # model_construct() skips min_length, so empty texts are caught here
+                missing.extend(name for name, text in (("subject", subject), ("body", body))
+                               if not text)
+            if missing or recipient is None:
+                result.drafts.append(None)
+                result.missing[index] = missing
+                continue
+
+            result.drafts.append(
+                EmailDraft.model_construct(
+                    subject=subject,
+                    body=body,
+                    preview_text=preview,
+                    recipient_email=recipient,
+                    recipient_name=values.get("recipient_name"),
+                    company=company,
+                    personalization_data={k: v for k, v in values.items() if k in self.variables},
+                    template_name=self.name,
+                    tone=self.tone,
+                )
+            )
+        return result
+
+
+def compile_key(template: "EmailTemplate") -> Tuple[Any, ...]:
+    """Everything a compiled template depends on (to detect stale caches)"""
+    return (
+        template.name,
+        template.tone,
+        template.subject_template,
+        template.body_template,
+        template.preview_text_template,
+        tuple(template.required_variables),
+        tuple(template.optional_variables or ()),
+    )
@@ -3,11 +3,12 @@ Tool Data Models
 """
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import Field
 from datetime import datetime
+from .common import CarmModel
 
 
-class Tool(BaseModel):
+class Tool(CarmModel):
     """Tool model"""
     id: int = Field(..., description="Tool ID")
     name: str = Field(..., description="Tool name")
@@ -16,7 +17,7 @@ class Tool(BaseModel):
     is_active: bool = Field(True, description="Is tool active")
 
 
-class ToolSettings(BaseModel):
+class ToolSettings(CarmModel):
     """Tool-specific settings for a user"""
     tool_id: int = Field(..., description="Tool ID")
     user_id: int = Field(..., description="User ID")
@@ -24,7 +25,7 @@ class ToolSettings(BaseModel):
     is_enabled: bool = Field(True, description="Is tool enabled for this user")
 
 
-class ToolExecution(BaseModel):
+class ToolExecution(CarmModel):
     """Record of a tool execution"""
     tool_id: int = Field(..., description="Tool ID")
     user_id: int = Field(..., description="User ID")
@@ -0,0 +1,296 @@
+"""
+Trusted Payloads
+
+Opt-in fast path for passing already-validated models between internal
+services without re-validating them on every hop.
+
+PSEUDO CODE:
+------------
+1. Sender wraps the model: {"model", "fingerprint", "data"}
+   (fingerprint = hash of the model's JSON schema)
+2. Receiver checks the fingerprint against its own copy of the model
+3. Match + trusted source -> build the model (and every nested model/list)
+   with model_construct(), skipping validation
+4. Anything else -> normal model_validate()
+5. Debug mode always validates and logs any difference from the fast path
+
+Only use trusted=True for payloads produced by our own services.
+In trusted mode email fields are taken as-is (they were validated by the
+sender); datetimes, enums and URLs are still rebuilt as proper objects.
+
+The gain is the skipped email / URL checks: on payloads with addresses this
+process has not validated yet, trusted construction is several times faster
+than model_validate(); when those are already in the validation caches both
+take about as long (see benchmarks/bench_trusted.py).
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from inspect import isclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    cast,
+    get_origin,
+)
+
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
+
+from ._compat import Annotated, UnionType
+from .schemas import json_schema, strip_docs
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+Builder = Callable[[Any], Any]
+
+DEBUG_ENV_VAR = "CARM_TRUSTED_DEBUG"
+
+# Converted URL (and other leaf) strings remembered per field type
+LEAF_CACHE_SIZE = 4096
+
+_debug = os.environ.get(DEBUG_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def set_debug(enabled: bool) -> None:
+    """
+    Toggle debug mode
+
+    When enabled, trusted payloads are fully validated anyway and any
+    difference from the fast path is logged as a warning.
+    Defaults to the CARM_TRUSTED_DEBUG environment variable.
+    """
+    global _debug
+    _debug = enabled
+
+
+def is_debug() -> bool:
+    """Whether debug mode is enabled"""
+    return _debug
+
+
+class TrustedPayload(BaseModel):
+    """Envelope for a model passed between internal services"""
+    model: str = Field(..., description="Model class name")
+    fingerprint: str = Field(..., description="Schema fingerprint of the sender's model")
+    data: Dict[str, Any] = Field(..., description="Model data (JSON mode dump)")
+
+
+# ============================================================================
+# Fingerprints
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model_cls: Type[BaseModel]) -> str:
+    """
+    Stable hash of a model's JSON schema
+
+    Descriptions, titles and examples are ignored, so only changes to the
+    data shape (fields, types, constraints) produce a new fingerprint.
+    """
+    schema = strip_docs(json_schema(model_cls))
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# ============================================================================
+# Non-validating construction
+# ============================================================================
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    return value
+
+
+# Leaf types whose JSON value is used as-is; email addresses were validated by
+# the sender (a CachedEmailStr field's annotation is EmailStr, its cache wrapper
+# is kept in the field metadata)
+_AS_IS_TYPES = frozenset({str, int, float, bool, dict, list, EmailStr})
+
+
+def _builder_for(annotation: Any) -> Optional[Builder]:
+    """
+    Return a function converting JSON data to `annotation`, or None when the
+    JSON value can be used unchanged
+    """
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        return _builder_for(get_args(annotation)[0])
+
+    if origin is Union or origin is UnionType:
+        options = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(options) == 1:
+            return _builder_for(options[0])
+        # Ambiguous union: let pydantic pick the member
+        adapter = TypeAdapter(annotation)
+        return adapter.validate_python if any(map(_builder_for, options)) else None
+
+    if origin in (list, List):
+        (item_type,) = get_args(annotation) or (Any,)
+        item_builder = _builder_for(item_type)
+        if item_builder is None:
+            return None
+        return lambda items: [None if v is None else item_builder(v) for v in items]
+
+    if origin in (dict, Dict):
+        args = get_args(annotation)
+        value_builder = _builder_for(args[1]) if len(args) == 2 else None
+        if value_builder is None:
+            return None
+        return lambda mapping: {
+            k: None if v is None else value_builder(v) for k, v in mapping.items()
+        }
+
+    if annotation is Any or annotation in _AS_IS_TYPES:
+        return None
+    if isclass(annotation):
+        if issubclass(annotation, BaseModel):
+            construct = _constructor(annotation)
+            return lambda data: data if isinstance(data, annotation) else construct(data)
+        if issubclass(annotation, datetime):
+            return _parse_datetime
+        if issubclass(annotation, Enum):
+            return annotation
+    # Anything else (URLs, ...) goes through pydantic-core and keeps real types;
+    # the same strings recur across records, and the results are immutable
+    validate = TypeAdapter(annotation).validator.validate_python
+    remembered = lru_cache(maxsize=LEAF_CACHE_SIZE)(validate)
+    return lambda value: remembered(value) if type(value) is str else validate(value)
+
+
+@lru_cache(maxsize=None)
+def _constructor(model_cls: Type[ModelT]) -> Callable[[Dict[str, Any]], ModelT]:
+    """
+    Non-validating constructor for a model class, compiled once
+
+    A payload with exactly the model's fields (what model_dump() produces)
+    is copied in one go and only the fields that need converting (nested
+    models, datetimes, URLs, ...) are touched; anything else goes through
+    model_construct().
+    """
+    fields = model_cls.model_fields
+    names = tuple(fields)
+    plan = tuple((name, _builder_for(field.annotation)) for name, field in fields.items())
+    converters: Tuple[Tuple[str, Builder], ...] = tuple(
+        (name, builder) for name, builder in plan if builder is not None
+    )
+    keep_extra = model_cls.model_config.get("extra") == "allow"
+    direct = not model_cls.__private_attributes__ and model_cls.__pydantic_post_init__ is None
+
+    def construct(data: Dict[str, Any]) -> ModelT:
+        if direct and data.keys() == fields.keys():
+            # Serialization follows the instance dict, so keep the field order
+            ordered = tuple(data) == names
+            values = dict(data) if ordered else {name: data[name] for name in names}
+            for name, convert in converters:
+                value = values[name]
+                if value is not None:
+                    values[name] = convert(value)
+            model: ModelT = model_cls.__new__(model_cls)
+            object.__setattr__(model, "__dict__", values)
+            object.__setattr__(model, "__pydantic_fields_set__", set(values))
+            object.__setattr__(model, "__pydantic_extra__", {} if keep_extra else None)
+            object.__setattr__(model, "__pydantic_private__", None)
+            return model
+        values = {}
+        for name, builder in plan:
+            if name in data:
+                value = data[name]
+                values[name] = value if builder is None or value is None else builder(value)
+        if keep_extra:
+            values.update((k, v) for k, v in data.items() if k not in fields)
+        return model_cls.model_construct(set(values) & fields.keys(), **values)
+
+    return construct
+
+
+def construct_trusted(model_cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """
+    Build a model from trusted JSON-mode data without validation
+
+    Nested models, lists and dicts of models are constructed recursively.
+    Missing fields get their defaults, as with model_construct(); undeclared
+    keys are kept only for models that allow extra fields.
+    """
+    return cast(ModelT, _constructor(model_cls)(data))
+
+
+# ============================================================================
+# Envelope helpers
+# ============================================================================
+
+
+def to_trusted_payload(model: BaseModel) -> Dict[str, Any]:
+    """Wrap a model for a trusted hop (returns a JSON-ready dict)"""
+    model_cls = type(model)
+    return {
+        "model": model_cls.__name__,
+        "fingerprint": schema_fingerprint(model_cls),
+        "data": model.model_dump(mode="json"),
+    }
+
+
+def from_trusted_payload(
+    model_cls: Type[ModelT], payload: Dict[str, Any], trusted: bool = False
+) -> ModelT:
+    """
+    Rebuild a model from a payload created by to_trusted_payload()
+
+    Args:
+        model_cls: Expected model class
+        payload: Envelope dict
+        trusted: Whether the payload comes from a trusted internal source
+
+    The fast path is used only when `trusted` is set and the fingerprint
+    matches our model; otherwise the data is fully validated.
+    """
+    envelope = TrustedPayload.model_validate(payload)
+    matches = (
+        envelope.model == model_cls.__name__
+        and envelope.fingerprint == schema_fingerprint(model_cls)
+    )
+
+    if trusted and not matches:
+        logger.warning(
+            "Schema fingerprint mismatch for %s (got %s %s); falling back to validation",
+            model_cls.__name__,
+            envelope.model,
+            envelope.fingerprint[:12],
+        )
+    if not (trusted and matches):
+        return model_cls.model_validate(envelope.data)
+
+    if not _debug:
+        return construct_trusted(model_cls, envelope.data)
+
+    validated = model_cls.model_validate(envelope.data)
+    constructed = construct_trusted(model_cls, envelope.data)
+    expected = validated.model_dump(mode="json")
+    actual = constructed.model_dump(mode="json", warnings=False)
+    if expected != actual:
+        changed = sorted(k for k in expected if expected.get(k) != actual.get(k))
+        logger.warning(
+            "Trusted construction of %s differs from validation in fields: %s",
+            model_cls.__name__,
+            ", ".join(changed),
+        )
+    return validated
@@ -3,21 +3,23 @@ User Data Models
 """
 
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import Field
 from datetime import datetime
+from .common import CarmModel
+from .validators import CachedEmailStr
 
 
-class User(BaseModel):
+class User(CarmModel):
     """User model"""
     id: int = Field(..., description="User ID")
     username: str = Field(..., description="Username")
-    email: EmailStr = Field(..., description="Email address")
+    email: CachedEmailStr = Field(..., description="Email address")
     full_name: Optional[str] = Field(None, description="Full name")
     is_active: bool = Field(True, description="Is user active")
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
-class UserProfile(BaseModel):
+class UserProfile(CarmModel):
     """Extended user profile"""
     user: User = Field(..., description="Base user info")
     company_id: Optional[int] = Field(None, description="Associated company ID")
@@ -0,0 +1,159 @@
+"""
+Memoized Email / URL Validation
+
+Bulk ingest validates the same addresses and domains over and over
+(ContactInfo alone has an email and up to five URLs). These annotated types
+validate exactly like EmailStr / HttpUrl, but remember recent results.
+
+PSEUDO CODE:
+------------
+1. CachedEmailStr = EmailStr + a wrap validator; CachedHttpUrl = HttpUrl + one
+2. String input already seen -> return the cached normalized value
+   (email-validator / URL parsing is skipped)
+3. Otherwise run the normal validation and cache the result
+   (invalid input is not cached, so errors are always the original ones)
+4. Each cache is a bounded LRU with hit/miss counters
+5. configure() changes the size or disables caching at runtime;
+   CARM_VALIDATION_CACHE_SIZE sets the initial size (0 disables, a malformed
+   or negative value is logged and the default size is used)
+
+The JSON schema is unchanged, so schema fingerprints and OpenAPI docs are
+not affected.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel, EmailStr, Field, HttpUrl, ValidatorFunctionWrapHandler
+from pydantic import WrapValidator
+
+from ._compat import Annotated
+
+logger = logging.getLogger(__name__)
+
+SIZE_ENV_VAR = "CARM_VALIDATION_CACHE_SIZE"
+DEFAULT_MAXSIZE = 10_000
+
+
+class ValidationCacheStats(BaseModel):
+    """Counters of one validation cache"""
+    hits: int = Field(0, description="Lookups answered from the cache")
+    misses: int = Field(0, description="Lookups that ran full validation")
+    size: int = Field(0, description="Entries currently cached")
+    maxsize: int = Field(0, description="Maximum entries (0 = disabled)")
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class ValidationCache:
+    """Thread-safe bounded LRU of input string -> validated value"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+        if self.maxsize <= 0 or type(value) is not str:
+            return handler(value)
+        with self._lock:
+            cached = self._data.get(value)
+            if cached is not None:
+                self._data.move_to_end(value)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        result = handler(value)
+        with self._lock:
+            self._data[value] = result
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return result
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> ValidationCacheStats:
+        with self._lock:
+            return ValidationCacheStats(
+                hits=self.hits, misses=self.misses, size=len(self._data), maxsize=self.maxsize
+            )
+
+
+def _size_from_env(raw: Optional[str]) -> int:
+    """Cache size from SIZE_ENV_VAR; DEFAULT_MAXSIZE when unset or invalid"""
+    if raw is None or not raw.strip():
+        return DEFAULT_MAXSIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        size = -1
+    if size < 0:
+        logger.warning(
+            "Ignoring %s=%r (expected a non-negative integer), using %d",
+            SIZE_ENV_VAR,
+            raw,
+            DEFAULT_MAXSIZE,
+        )
+        return DEFAULT_MAXSIZE
+    return size
+
+
+_initial_size = _size_from_env(os.environ.get(SIZE_ENV_VAR))
+
+EMAIL_CACHE = ValidationCache(_initial_size)
+URL_CACHE = ValidationCache(_initial_size)
+
+CachedEmailStr = Annotated[EmailStr, WrapValidator(EMAIL_CACHE.validate)]
+CachedHttpUrl = Annotated[HttpUrl, WrapValidator(URL_CACHE.validate)]
+
+
+def configure(maxsize: Optional[int] = None, enabled: Optional[bool] = None) -> None:
+    """
+    Change cache settings for both caches
+
+    Args:
+        maxsize: New maximum entries per cache (older entries are evicted)
+        enabled: False disables caching (and drops cached entries);
+            True re-enables it with `maxsize` or the default size
+    """
+    if enabled is False:
+        maxsize = 0
+    elif enabled and maxsize is None:
+        maxsize = DEFAULT_MAXSIZE
+    if maxsize is not None:
+        EMAIL_CACHE.resize(maxsize)
+        URL_CACHE.resize(maxsize)
+
+
+def clear() -> None:
+    """Drop cached entries and reset counters"""
+    EMAIL_CACHE.clear()
+    URL_CACHE.clear()
+
+
+def stats() -> Dict[str, ValidationCacheStats]:
+    """Counters per cache ("email", "url")"""
+    return {"email": EMAIL_CACHE.stats(), "url": URL_CACHE.stats()}
+
+
+def cache_counters() -> Tuple[int, int]:
+    """Total (hits, misses) of both caches, for metrics.record_cache_counters()"""
+    both = stats().values()
+    return sum(s.hits for s in both), sum(s.misses for s in both)
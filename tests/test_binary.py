@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("msgpack")
+
+from carm_data_models.binary import FORMAT_VERSION, MAGIC, _to_array
+from carm_data_models.common import ServiceMetrics
+from carm_data_models.company import Company, ContactInfo
+from carm_data_models.email import EmailDraft
+from carm_data_models.responses import OrchestrationResponse
+from carm_data_models.tool import ToolExecution
+
+
+def _orchestration():
+    company = Company(
+        name="Acme",
+        website="https://acme.com",
+        employee_count=12,
+        found_at=datetime(2024, 1, 15, 10, 30, tzinfo=timezone(timedelta(hours=-5))),
+        contact_info=ContactInfo(email="info@acme.com"),
+        metadata={"tags": ["b2b"], "score": 1.5},
+    )
+    draft = EmailDraft(subject="Hi", body="Body", recipient_email="john@acme.com", company=company)
+    return OrchestrationResponse(
+        task_id="t1",
+        status="completed",
+        research_results=[company],
+        scraped_data=[{"name": "Acme"}],
+        drafts=[draft],
+        total_duration_seconds=3.5,
+        step_durations={"research": 1.0, "draft": 2.5},
+    )
+
+
+def test_round_trip_is_exact_and_smaller_than_json():
+    response = _orchestration()
+    data = response.to_bytes()
+    assert data[:4] == MAGIC + bytes([FORMAT_VERSION])
+    assert len(data) < len(response.model_dump_json())
+
+    assert OrchestrationResponse.from_bytes(data) == response
+
+
+def test_datetimes_keep_naive_and_aware_values():
+    naive = ToolExecution(tool_id=1, user_id=2, status="ok", started_at=datetime(2024, 5, 1, 8, 0, 0, 123))
+    assert ToolExecution.from_bytes(naive.to_bytes()).started_at == naive.started_at
+    assert ToolExecution.from_bytes(naive.to_bytes()).started_at.tzinfo is None
+
+    aware = _orchestration().drafts[0].company
+    assert Company.from_bytes(aware.to_bytes()).found_at == aware.found_at
+
+
+def test_older_reader_skips_appended_fields():
+    metrics = ServiceMetrics(duration_seconds=1.0, cache_misses=2)
+    body = _to_array(ServiceMetrics, metrics)
+    assert len(body) == 6
+
+    import msgpack
+
+    newer = MAGIC + bytes([FORMAT_VERSION]) + msgpack.packb(body + ["field from a newer writer"])
+    assert ServiceMetrics.from_bytes(newer) == metrics
+
+
+def test_partially_constructed_models_encode():
+    company = Company.model_construct(name="Acme", employee_count=3)
+    assert Company.from_bytes(company.to_bytes()) == Company(name="Acme", employee_count=3)
+
+
+def test_rejects_foreign_or_newer_payloads():
+    with pytest.raises(ValueError):
+        Company.from_bytes(b'{"name": "Acme"}')
+    with pytest.raises(ValueError):
+        Company.from_bytes(MAGIC + bytes([FORMAT_VERSION + 1]) + b"\x90")
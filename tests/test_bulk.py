@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from carm_data_models.bulk import COMPANY_LIST_ADAPTER, list_adapter, validate_many
+from carm_data_models.company import Company
+from carm_data_models.tool import ToolExecution
+
+
+def test_list_adapters_are_cached():
+    assert list_adapter(Company) is COMPANY_LIST_ADAPTER
+
+
+def test_validate_many_collects_errors_per_index():
+    data = [{"name": "A"}, {"name": ""}, {"name": "C", "founded_year": 1500}, {"name": "D"}]
+    result = validate_many(data, Company)
+
+    assert not result.ok
+    assert sorted(result.errors) == [1, 2]
+    assert result.errors[2][0]["loc"] == ("founded_year",)
+    assert [c.name for c in result.valid] == ["A", "D"]
+    assert result.items[1] is None
+
+
+def test_validate_many_from_json_bytes():
+    payload = json.dumps([{"tool_id": 1, "user_id": 2, "status": "ok"}] * 3).encode()
+    result = validate_many(payload, ToolExecution)
+    assert result.ok and len(result.items) == 3
+
+    bad = json.dumps([{"tool_id": 1, "user_id": 2, "status": "ok"}, {"tool_id": "x"}])
+    result = validate_many(bad, ToolExecution)
+    assert list(result.errors) == [1]
+
+    with pytest.raises(ValueError):
+        validate_many(b"{not json", ToolExecution)
+
+
+def test_validate_many_with_process_pool():
+    data = [{"name": f"C{i}"} if i % 7 else {"name": ""} for i in range(50)]
+    result = validate_many(data, Company, processes=2, chunk_size=10)
+    assert sorted(result.errors) == list(range(0, 50, 7))
+    assert len(result.items) == 50
+    assert result.items[1].name == "C1"
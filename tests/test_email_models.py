@@ -34,3 +34,105 @@ def test_email_template_and_message_defaults():
     m = Message(content="ok")
     assert isinstance(m.timestamp, datetime)
 
+
+
+def _outreach_template():
+    return EmailTemplate(
+        name="outreach",
+        subject_template="Partnership for {company_name}",
+        body_template="Hi {recipient_name},\n{sender_company} helps {industry} teams with {pain_point}.",
+        required_variables=["company_name", "recipient_name", "sender_company"],
+        optional_variables=["industry", "pain_point"],
+        tone="casual",
+    )
+
+
+def test_email_template_compile_is_cached_and_checks_variables():
+    from carm_data_models.templating import TemplateError
+
+    t = _outreach_template()
+    compiled = t.compile()
+    assert t.compile() is compiled
+    assert compiled.variables == {"company_name", "recipient_name", "sender_company", "industry", "pain_point"}
+
+    t.subject_template = "Hello {company_name}"
+    assert t.compile() is not compiled
+
+    bad = EmailTemplate(name="bad", subject_template="{oops}", body_template="x", required_variables=[])
+    with pytest.raises(TemplateError):
+        bad.compile()
+
+    texts, missing = t.compile().render({"company_name": "Acme", "sender_company": "Carm"})
+    assert texts is None and missing == ["recipient_name"]
+
+
+def test_email_template_render_batch_reports_missing_per_record():
+    from carm_data_models.company import CompanyProfile, ContactInfo
+
+    sender = CompanyProfile(company=Company(name="Carm Visuals"))
+    companies = [
+        Company(name="Acme", industry="retail", pain_points=["slow site"],
+                contact_info=ContactInfo(email="info@acme.com")),
+        Company(name="NoEmail"),
+        Company(name="Globex", contact_info=ContactInfo(email="hi@globex.com")),
+    ]
+    overrides = [{"recipient_name": "Ann"}, {"recipient_name": "Bob"}, None]
+
+    result = _outreach_template().render_batch(companies, sender, overrides)
+
+    assert result.missing == {1: ["recipient_email"], 2: ["recipient_name"]}
+    draft = result.drafts[0]
+    assert draft.subject == "Partnership for Acme"
+    assert draft.body == "Hi Ann,\nCarm Visuals helps retail teams with slow site."
+    assert draft.recipient_email == "info@acme.com" and draft.recipient_name == "Ann"
+    assert draft.company is companies[0] and draft.tone == "casual"
+    assert [d.company.name for d in result.rendered] == ["Acme"]
+
+    shared = _outreach_template().render_batch(companies[2:], sender, {"recipient_name": "Team"})
+    assert shared.drafts[0].body == "Hi Team,\nCarm Visuals helps  teams with ."
+    assert isinstance(shared.drafts[0].created_at, datetime)
+
+
+def test_render_batch_rejects_empty_texts_and_checks_unused_required_variables():
+    from carm_data_models.company import ContactInfo
+
+    company = Company(name="Acme", contact_info=ContactInfo(email="info@acme.com"))
+    template = EmailTemplate(
+        name="sparse", subject_template="{industry}", body_template="Hello from {sender_company}",
+        required_variables=["sender_company", "recipient_name"], optional_variables=["industry"],
+    )
+    overrides = {"sender_company": "Carm", "recipient_name": "Ann"}
+
+    result = template.render_batch([company], overrides=overrides)
+    assert result.drafts == [None] and result.missing == {0: ["subject"]}
+    assert template.compile().render({**overrides}) == (None, ["subject"])
+
+    result = template.render_batch([company], overrides={"sender_company": "Carm",
+                                                         "industry": "retail"})
+    assert result.missing == {0: ["recipient_name"]}
+    assert template.render_batch(
+        [company], overrides={**overrides, "industry": "retail"}
+    ).drafts[0].subject == "retail"
+
+    with pytest.raises(TypeError):
+        template.render_batch([company], overrides="recipient_name=Ann")
+
+
+def test_render_batch_reports_format_errors_per_record():
+    from carm_data_models.company import ContactInfo
+    from carm_data_models.templating import TemplateError
+
+    contact = ContactInfo(email="info@acme.com")
+    companies = [Company(name="Acme", employee_count=12, contact_info=contact),
+                 Company(name="Globex", employee_count=40, contact_info=contact)]
+    template = EmailTemplate(
+        name="sized", subject_template="Hi {company_name}",
+        body_template="Team of {employee_count:>5d}",
+        required_variables=["company_name", "employee_count"],
+    )
+    result = template.render_batch(companies, overrides=[{"employee_count": "twelve"}, None])
+    assert result.drafts[0] is None and result.drafts[1].body == "Team of    40"
+    assert list(result.errors) == [0] and "employee_count" in result.errors[0]
+    assert result.missing == {}
+    with pytest.raises(TemplateError):
+        template.compile().render({"company_name": "Acme", "employee_count": "twelve"})
@@ -0,0 +1,91 @@
+import pytest
+
+from carm_data_models.company import Company
+from carm_data_models.email import EmailDraft
+from carm_data_models.events import (
+    DraftProduced,
+    EventSequenceError,
+    StatusChanged,
+    TaskEventLog,
+    TaskReducer,
+    parse_event,
+    parse_events,
+    reduce_events,
+)
+from carm_data_models.payloads import WebsiteScrape
+from carm_data_models.responses import OrchestrationResponse
+
+
+def _run_task(log: TaskEventLog) -> None:
+    log.status("in_progress")
+    acme = Company(name="Acme", website="https://acme.com")
+    log.research_result(acme)
+    log.research_result({"name": "Globex"})
+    log.step_completed("research", 4.0)
+    log.scrape_finished({"source": "website", "url": "https://acme.com"})
+    log.error("timeout", step="scrape")
+    log.step_completed("scrape", 6.5)
+    log.draft_produced(EmailDraft(subject="Hi", body="Body", recipient_email="a@acme.com",
+                                  company=acme))
+    log.status("completed", total_duration_seconds=11.0)
+
+
+def test_reducer_rebuilds_the_snapshot_from_events():
+    log = TaskEventLog("task-1")
+    _run_task(log)
+
+    snapshot = log.snapshot
+    assert [c.name for c in snapshot.research_results] == ["Acme", "Globex"]
+    assert isinstance(snapshot.scraped_data[0], WebsiteScrape)
+    assert snapshot.step_durations == {"research": 4.0, "scrape": 6.5}
+    assert snapshot.errors == ["scrape: timeout"]
+    assert (snapshot.status, snapshot.total_duration_seconds) == ("completed", 11.0)
+
+    received = parse_events(log.since_json())
+    assert [event.seq for event in received] == list(range(1, 10))
+    rebuilt = reduce_events("task-1", received)
+    assert OrchestrationResponse.model_validate_json(rebuilt.model_dump_json()) == snapshot
+
+    log.error("late failure")
+    assert snapshot.errors == ["scrape: timeout"]
+    assert log.snapshot.errors == ["scrape: timeout", "late failure"]
+
+
+def test_client_resumes_from_its_sequence_number():
+    log = TaskEventLog("task-2")
+    client = TaskReducer("task-2")
+
+    log.status("in_progress")
+    log.research_result({"name": "Acme"})
+    assert client.apply_all(parse_events(log.since_json(client.seq))) == 2
+
+    log.research_result({"name": "Globex"})
+    log.step_completed("research", 1.5)
+    new = log.since(client.seq)
+    assert [event.seq for event in new] == [3, 4]
+    assert client.apply_all(new) == 2
+    assert client.apply_all(log.since(0)) == 0  # replays are ignored
+    assert client.response == log.snapshot
+
+
+def test_gaps_and_foreign_events_are_rejected():
+    log = TaskEventLog("task-3")
+    for name in ("A", "B", "C"):
+        log.research_result({"name": name})
+
+    client = TaskReducer("task-3")
+    client.apply(log.events[0])
+    with pytest.raises(EventSequenceError):
+        client.apply(log.events[2])
+    with pytest.raises(ValueError):
+        client.apply(StatusChanged(task_id="other", seq=2, status="failed"))
+
+
+def test_events_are_decoded_into_their_classes():
+    log = TaskEventLog("task-4")
+    draft = log.draft_produced({"subject": "Hi", "body": "Body", "recipient_email": "a@b.com",
+                                "company": {"name": "B"}})
+    event = parse_event(draft.model_dump_json())
+    assert isinstance(event, DraftProduced) and event == draft
+    assert isinstance(parse_event({"task_id": "t", "seq": 1, "type": "status", "status": "x"}),
+                      StatusChanged)
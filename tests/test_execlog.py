@@ -0,0 +1,149 @@
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from carm_data_models.execlog import (
+    ExecutionLogFull,
+    ExecutionLogWriter,
+    iter_executions,
+    log_files,
+    rollup,
+)
+from carm_data_models.tool import ToolExecution
+
+START = datetime(2024, 1, 15, 9, 0)
+
+
+def _execution(i: int) -> ToolExecution:
+    started = START + timedelta(minutes=i)
+    return ToolExecution(
+        tool_id=i % 2,
+        user_id=i % 3,
+        started_at=started,
+        completed_at=None if i % 10 == 9 else started + timedelta(seconds=1 + i % 4),
+        status="failed" if i % 5 == 0 else "completed",
+    )
+
+
+def test_blocks_are_compressed_and_readable_with_gzip(tmp_path):
+    executions = [_execution(i) for i in range(250)]
+    with ExecutionLogWriter(tmp_path, max_block_records=100) as log:
+        for execution in executions:
+            log.write(execution)
+    assert (log.records_written, log.blocks_written) == (250, 3)
+    assert log.compressed_bytes < log.raw_bytes
+
+    (path,) = log_files(tmp_path)
+    with gzip.open(path, "rt") as fp:
+        assert len([json.loads(line) for line in fp]) == 250
+    assert list(iter_executions(tmp_path)) == executions
+
+
+def test_rollups_per_tool_and_user(tmp_path):
+    with ExecutionLogWriter(tmp_path, max_block_records=7) as log:
+        for i in range(100):
+            log.write(_execution(i))
+
+    by_tool = rollup(tmp_path)
+    assert set(by_tool) == {0, 1}
+    tool = by_tool[0]
+    assert tool.count == 50
+    assert tool.failed == 10 and tool.failure_rate == 0.2
+    assert tool.unfinished == 0
+    assert tool.durations.count == 50
+    assert tool.durations.quantile(0) == pytest.approx(1, rel=0.01)
+    assert tool.durations.quantile(1) == pytest.approx(3, rel=0.01)
+    assert tool.first_started_at == START.replace(tzinfo=timezone.utc)
+    assert by_tool[1].unfinished == 10
+
+    pairs = rollup(tmp_path, by=("tool_id", "user_id"))
+    assert sum(r.count for r in pairs.values()) == 100 and (0, 0) in pairs
+    since, until = START + timedelta(minutes=90), START + timedelta(minutes=95)
+    window = rollup(tmp_path, since=since, until=until)
+    assert sum(r.count for r in window.values()) == 5
+    assert by_tool[0].merge(by_tool[1]).count == 100
+
+
+def test_mixed_naive_and_aware_timestamps(tmp_path):
+    eastern = timezone(timedelta(hours=-5))
+    with ExecutionLogWriter(tmp_path) as log:
+        # Naive start (UTC) with an aware completion 3 seconds later
+        log.write(ToolExecution(tool_id=1, user_id=1, started_at=START, status="completed",
+                                completed_at=datetime(2024, 1, 15, 4, 0, 3, tzinfo=eastern)))
+        # Later start written with an offset that sorts first as a string
+        log.write(ToolExecution(tool_id=1, user_id=1, status="completed",
+                                started_at=datetime(2024, 1, 15, 4, 30, tzinfo=eastern)))
+    (result,) = rollup(tmp_path).values()
+    assert result.durations.total == pytest.approx(3)
+    assert result.first_started_at == START.replace(tzinfo=timezone.utc)
+    assert result.last_started_at == datetime(2024, 1, 15, 4, 30, tzinfo=eastern)
+    window = rollup(tmp_path, since=datetime(2024, 1, 15, 9, 15))
+    assert window[1].count == 1
+
+
+def test_flush_waits_for_stale_blocks(tmp_path, monkeypatch):
+    log = ExecutionLogWriter(tmp_path, flush_interval=0.05)
+    original = log._write_block
+    writing = threading.Event()
+
+    def slow_write(data, records):
+        writing.set()
+        time.sleep(0.2)
+        original(data, records)
+
+    monkeypatch.setattr(log, "_write_block", slow_write)
+    log.write(_execution(1))
+    assert writing.wait(5)  # the background thread sealed the stale block
+    log.flush()
+    assert log.records_written == 1
+    log.close()
+
+
+def test_small_batches_are_flushed_after_the_interval(tmp_path):
+    log = ExecutionLogWriter(tmp_path, flush_interval=0.05)
+    log.write(_execution(1))
+    deadline = time.monotonic() + 5
+    while log.records_written == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert log.records_written == 1
+    assert len(list(iter_executions(tmp_path))) == 1
+    log.close()
+
+
+def test_backpressure_bounds_pending_blocks(tmp_path, monkeypatch):
+    log = ExecutionLogWriter(tmp_path, max_block_records=1, max_pending_blocks=1)
+    release = threading.Event()
+    original = log._write_block
+
+    def slow_write(data, records):
+        release.wait()
+        original(data, records)
+
+    monkeypatch.setattr(log, "_write_block", slow_write)
+    log.write(_execution(0))  # taken by the background thread
+    time.sleep(0.1)
+    log.write(_execution(1))  # waits in the queue
+    with pytest.raises(ExecutionLogFull):
+        log.write(_execution(2), timeout=0.05)
+    assert log.backpressure_waits == 1
+
+    release.set()
+    log.write(_execution(3))
+    log.close()
+    assert log.records_written == 3
+
+
+def test_truncated_last_block_is_skipped(tmp_path):
+    with ExecutionLogWriter(tmp_path, max_block_records=10) as log:
+        for i in range(20):
+            log.write(_execution(i))
+    (path,) = log_files(tmp_path)
+    data = path.read_bytes()
+    path.write_bytes(data[:-15])
+
+    assert len(list(iter_executions(tmp_path))) >= 10
+    assert rollup(tmp_path)[0].count <= 10
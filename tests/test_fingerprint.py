@@ -0,0 +1,119 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+from carm_data_models.company import Company
+from carm_data_models.fingerprint import (
+    DiskBackend,
+    MemoryBackend,
+    ResultCache,
+    canonical,
+    fingerprint,
+)
+from carm_data_models.requests import DraftRequest, ResearchRequest, ScrapeRequest
+from carm_data_models.responses import ResearchResponse
+
+
+def _research_response(name="Acme"):
+    return ResearchResponse(companies=[Company(name=name)], total_found=1,
+                            sources_used=["google"], duration_seconds=2.0)
+
+
+def test_fingerprint_ignores_key_order_defaults_and_number_spelling():
+    a = ResearchRequest(criteria="design agencies", sources=["google"],
+                        filters={"city": "Toronto", "min_size": 10})
+    b = ResearchRequest(criteria="design agencies", max_results=10, sources=["google"],
+                        filters={"min_size": 10.0, "city": "Toronto"})
+    assert canonical(a) == canonical(b)
+    assert fingerprint(a) == fingerprint(b)
+
+    assert fingerprint(a) != fingerprint(a.model_copy(update={"max_results": 20}))
+    assert fingerprint(a) != fingerprint(a.model_copy(update={"sources": ["google", "yelp"]}))
+
+    company = Company(name="Acme", website="https://acme.com")
+    assert fingerprint(company) == fingerprint(Company(name="Acme", website="https://acme.com/"))
+    assert fingerprint(ScrapeRequest(companies=[company], sources=["website"])) \
+        == fingerprint(ScrapeRequest(companies=[{"website": "https://acme.com", "name": "Acme"}],
+                                     sources=["website"], timeout_seconds=30))
+    draft = DraftRequest(companies=[company], sender_company={"name": "Carm Visuals"})
+    assert fingerprint(draft) != fingerprint(draft.model_copy(update={"tone": "casual"}))
+
+
+def test_fingerprint_is_stable_across_processes():
+    code = ("from carm_data_models.requests import ResearchRequest;"
+            "from carm_data_models.fingerprint import fingerprint;"
+            "print(fingerprint(ResearchRequest(criteria='x', filters={'b': 1, 'a': [2, 3]})))")
+    outputs = {
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                       env={**os.environ, "PYTHONHASHSEED": seed}, check=True).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert outputs == {fingerprint(ResearchRequest(criteria="x", filters={"a": [2, 3], "b": 1}))}
+
+
+def test_result_cache_skips_duplicate_work():
+    calls = []
+
+    def research(request):
+        calls.append(request)
+        return _research_response()
+
+    cache = ResultCache()
+    request = ResearchRequest(criteria="design agencies", filters={"a": 1, "b": 2})
+    first = cache.get_or_compute(request, ResearchResponse, research)
+    again = cache.get_or_compute(
+        ResearchRequest(criteria="design agencies", filters={"b": 2, "a": 1}),
+        ResearchResponse, research,
+    )
+    assert len(calls) == 1 and again == first
+
+    async def aresearch(request):
+        calls.append(request)
+        return _research_response("Other")
+
+    other = ResearchRequest(criteria="other")
+    assert asyncio.run(cache.aget_or_compute(other, ResearchResponse, aresearch)) \
+        .companies[0].name == "Other"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores, stats.entries) == (1, 2, 2, 2)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    backend.get("a")
+    backend.set("c", b"3")
+    assert backend.get("b") is None and backend.get("a") == b"1"
+    assert backend.evictions == 1
+
+    sized = MemoryBackend(max_bytes=10)
+    sized.set("a", b"12345")
+    sized.set("b", b"123456")
+    assert len(sized) == 1 and sized.nbytes == 6
+
+
+def test_disk_backend_persists_and_bounds_size(tmp_path):
+    cache = ResultCache(DiskBackend(tmp_path))
+    request = ResearchRequest(criteria="design agencies")
+    cache.put(request, _research_response())
+
+    reopened = ResultCache(DiskBackend(tmp_path))
+    assert reopened.get(request, ResearchResponse) == _research_response()
+
+    backend = DiskBackend(tmp_path / "small", max_bytes=10)
+    backend.set("aa01", b"12345")
+    backend.set("bb02", b"12345")
+    backend.get("aa01")
+    backend.set("cc03", b"12345")
+    assert backend.get("bb02") is None
+    assert backend.get("aa01") == b"12345" and backend.nbytes == 10
+
+
+def test_entries_that_no_longer_validate_are_dropped():
+    cache = ResultCache()
+    request = ResearchRequest(criteria="x")
+    cache.backend.set(fingerprint(request), b'{"companies": "not a list"}')
+    assert cache.get(request, ResearchResponse) is None
+    assert len(cache.backend) == 0
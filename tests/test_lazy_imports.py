@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import carm_data_models
+
+
+def _loaded_after(statement: str) -> set:
+    code = f"import sys\n{statement}\nprint(' '.join(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return set(out.stdout.split())
+
+
+def test_package_import_does_not_build_models():
+    loaded = _loaded_after("import carm_data_models")
+    assert not any(name.startswith("carm_data_models.") for name in loaded)
+    assert "email_validator" not in loaded
+
+
+def test_common_names_do_not_pull_in_email_validation():
+    loaded = _loaded_after("from carm_data_models import Status, ServiceMetrics")
+    assert "carm_data_models.common" in loaded
+    assert "carm_data_models.company" not in loaded
+    assert "email_validator" not in loaded
+
+
+def test_all_public_names_resolve():
+    from carm_data_models import Company
+    from carm_data_models.company import Company as DirectCompany
+
+    assert Company is DirectCompany
+    for name in carm_data_models.__all__:
+        assert getattr(carm_data_models, name).__name__ == name
+    assert set(carm_data_models.__all__) <= set(dir(carm_data_models))
+
+    with pytest.raises(AttributeError):
+        carm_data_models.DoesNotExist
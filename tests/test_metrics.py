@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from carm_data_models.common import ServiceMetrics
+from carm_data_models.metrics import LatencyHistogram, MetricsAggregate, record_cache_counters
+
+
+def test_histogram_percentiles_within_one_percent():
+    rng = random.Random(7)
+    samples = [rng.lognormvariate(0, 1) for _ in range(5000)]
+    histogram = LatencyHistogram()
+    for value in samples:
+        histogram.add(value)
+
+    ordered = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert histogram.count == 5000 and histogram.min == min(samples)
+    assert len(histogram.counts) < 1000
+    assert LatencyHistogram().quantile(0.5) is None
+
+
+def test_merge_is_associative_and_matches_single_histogram():
+    rng = random.Random(3)
+    shards = [[rng.uniform(0.01, 5) for _ in range(200)] + [0.0] for _ in range(3)]
+    parts = []
+    whole = LatencyHistogram()
+    for shard in shards:
+        part = LatencyHistogram()
+        for value in shard:
+            part.add(value)
+            whole.add(value)
+        parts.append(part)
+
+    a, b, c = parts
+    left = a.merge(b).merge(c)
+    right = a.merge(b.merge(c))
+    assert left.counts == right.counts == whole.counts
+    assert left.zero_count == 3
+    assert left.percentiles() == whole.percentiles()
+
+
+def test_metrics_aggregate_ingests_and_round_trips():
+    shard1, shard2 = MetricsAggregate(), MetricsAggregate()
+    shard1.add_metrics(
+        ServiceMetrics(duration_seconds=1.0, tokens_used=100, cache_hits=3, cache_misses=1)
+    )
+    shard1.add_step_durations({"research": 0.4, "draft": 0.6})
+    shard2.add_metrics(ServiceMetrics(duration_seconds=3.0, tokens_used=50, estimated_cost=0.01))
+    shard2.add_step_durations({"research": 2.0})
+
+    total = MetricsAggregate.merge_all([shard1, shard2])
+    assert total.runs == 2 and total.tokens_used == 150 and total.estimated_cost == 0.01
+    assert total.cache_hit_rate == 0.75
+    assert total.steps["research"].count == 2 and total.steps["draft"].count == 1
+    assert shard1.steps["research"].count == 1
+    assert total.to_service_metrics().duration_seconds == 4.0
+
+    restored = MetricsAggregate.model_validate_json(total.model_dump_json())
+    assert restored == total
+
+
+def test_record_cache_counters_adds_lookups_since_the_start_of_the_run():
+    metrics = ServiceMetrics(duration_seconds=1.0, cache_hits=1)
+    record_cache_counters(metrics, (10, 4), since=(7, 4))
+    assert (metrics.cache_hits, metrics.cache_misses) == (4, 0)
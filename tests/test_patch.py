@@ -0,0 +1,62 @@
+import pytest
+from pydantic import ValidationError
+
+from carm_data_models import CompanyProfile
+from carm_data_models.patch import PATCH_ADAPTER, PatchError, apply_patch, diff
+from carm_data_models.synthetic import SyntheticData
+
+
+def _profile():
+    profile = SyntheticData(seed=5).build(CompanyProfile)
+    return profile.model_copy(update={"case_studies": [{"title": "A", "metrics": {"roi": 2}}]})
+
+
+def test_diff_is_compact_and_round_trips():
+    old = _profile()
+    new = old.model_copy(deep=True)
+    new.company.industry = "Retail"
+    new.tagline = None
+    new.case_studies[0]["metrics"]["roi"] = 3
+    new.case_studies.append({"title": "B"})
+    new.team_members = []
+
+    ops = diff(old, new)
+    assert [(op.op, op.path) for op in ops] == [
+        ("replace", "/company/industry"),
+        ("replace", "/tagline"),
+        ("remove", "/team_members/0"),
+        ("replace", "/case_studies/0/metrics/roi"),
+        ("add", "/case_studies/-"),
+    ]
+    assert diff(old, old) == []
+
+    wire = PATCH_ADAPTER.dump_json(ops)
+    assert len(wire) < len(new.model_dump_json()) / 5
+    assert apply_patch(old, PATCH_ADAPTER.validate_json(wire)) == new
+
+
+def test_untouched_objects_are_shared():
+    old = _profile()
+    updated = apply_patch(old, [{"op": "replace", "path": "/company/name", "value": "Renamed"}])
+
+    assert updated.company.name == "Renamed" and old.company.name != "Renamed"
+    assert updated.company.contact_info is old.company.contact_info
+    assert updated.services_detailed is old.services_detailed
+    assert updated.case_studies is old.case_studies
+
+
+def test_only_touched_paths_are_validated():
+    old = _profile()
+    with pytest.raises(ValidationError):
+        apply_patch(old, [{"op": "replace", "path": "/company/confidence_score", "value": 5}])
+    with pytest.raises(ValidationError):
+        apply_patch(old, [{"op": "add", "path": "/team_members/-", "value": {"name": 1}}])
+    with pytest.raises(PatchError):
+        apply_patch(old, [{"op": "replace", "path": "/company/nope", "value": 1}])
+    with pytest.raises(PatchError):
+        apply_patch(old, [{"op": "remove", "path": "/company"}])
+
+    patched = apply_patch(
+        old, [{"op": "replace", "path": "/company/website", "value": "https://new.example.com"}]
+    )
+    assert str(patched.company.website) == "https://new.example.com/"
@@ -0,0 +1,112 @@
+from carm_data_models import records
+from carm_data_models.company import Company, CompanyProfile
+from carm_data_models.payloads import GenericScrape, LinkedInScrape, WebsiteScrape
+from carm_data_models.requests import DraftRequest, ScrapeRequest
+from carm_data_models.responses import OrchestrationResponse, ScrapeResponse
+
+
+def _scrape_response(*records_):
+    return ScrapeResponse(scraped_data=list(records_), successful_scrapes=len(records_),
+                          failed_scrapes=0, duration_seconds=0.3)
+
+
+def test_scraped_records_are_decoded_by_source():
+    response = ScrapeResponse.model_validate_json(_scrape_response(
+        {"source": "website", "url": "https://acme.com", "emails": ["hi@acme.com"]},
+        {"source": "linkedin", "url": "https://linkedin.com/company/acme", "followers": 12},
+        {"source": "google-maps", "name": "Acme", "rating": 4.5},
+    ).model_dump_json())
+
+    website, linkedin, other = response.scraped_data
+    assert isinstance(website, WebsiteScrape) and website.emails == ["hi@acme.com"]
+    assert isinstance(linkedin, LinkedInScrape) and linkedin.followers == 12
+    assert isinstance(other, GenericScrape) and other.model_extra == {"rating": 4.5}
+    assert other.source == "google-maps"
+
+    (invalid,) = _scrape_response(
+        {"source": "linkedin", "url": "https://linkedin.com/x", "followers": -1}
+    ).scraped_data
+    assert isinstance(invalid, GenericScrape) and invalid.model_extra == {"followers": -1}
+
+
+def test_old_untyped_shapes_still_decode():
+    scrape = _scrape_response({"name": "Acme", "emails": ["a@acme.com"]})
+    assert scrape.scraped_data[0].model_dump() == {
+        "source": None, "name": "Acme", "url": None, "emails": ["a@acme.com"]
+    }
+
+    draft = DraftRequest(companies=[{"name": "Acme", "website": "https://acme.com"}],
+                         sender_company={"name": "Carm Visuals", "industry": "Design"})
+    assert isinstance(draft.companies[0], Company)
+    assert isinstance(draft.sender_company, CompanyProfile)
+    assert draft.sender_company.company.industry == "Design"
+
+    profile = CompanyProfile(company=Company(name="Carm Visuals"), tagline="We build")
+    assert DraftRequest(companies=[], sender_company=profile).sender_company == profile
+    assert DraftRequest(companies=[], sender_company=profile.company).sender_company.company.name \
+        == "Carm Visuals"
+
+    request = ScrapeRequest(companies=[{"name": "Acme", "website": "https://acme.com"}],
+                            sources=["website"])
+    assert str(request.companies[0].website) == "https://acme.com/"
+
+
+def test_orchestration_response_carries_typed_records():
+    response = OrchestrationResponse(
+        task_id="t1", status="completed", total_duration_seconds=1.0,
+        scraped_data=[{"source": "website", "url": "https://acme.com"}],
+    )
+    assert isinstance(response.scraped_data[0], WebsiteScrape)
+
+
+def test_records_keep_extra_fields_of_generic_scrapes():
+    response = _scrape_response({"name": "Acme", "tags": ["x", "y"]},
+                                {"source": "website", "url": "https://acme.com"})
+    record = records.to_record(response)
+    generic = record.scraped_data[0]
+    assert generic.extra == {"tags": ("x", "y")}
+    assert record.to_model() == response
+
+
+def test_old_request_and_record_shapes_are_kept_intact():
+    request = ScrapeRequest(
+        companies=[{"website": "https://acme.com"},
+                   {"name": "Acme", "url": "https://acme.com", "linkedin": "acme"},
+                   {"name": "Beta", "website": "https://beta.io"}],
+        sources=["website", "linkedin"],
+    )
+    nameless, extra, typed = request.companies
+    assert nameless == {"website": "https://acme.com"}
+    assert extra == {"name": "Acme", "url": "https://acme.com", "linkedin": "acme"}
+    assert isinstance(typed, Company)
+    draft = DraftRequest(companies=[{"company_name": "Acme", "pain_point": "slow site"}],
+                         sender_company={"name": "Carm Visuals"})
+    assert draft.companies[0] == {"company_name": "Acme", "pain_point": "slow site"}
+
+    website, linkedin, no_url = _scrape_response(
+        {"source": "website", "url": "https://acme.com", "html_length": 5120},
+        {"source": "linkedin", "url": "https://linkedin.com/company/acme", "logo": "x.png"},
+        {"source": "website", "name": "Acme", "emails": ["a@acme.com"]},
+    ).scraped_data
+    assert isinstance(website, WebsiteScrape) and website.model_extra == {"html_length": 5120}
+    assert isinstance(linkedin, LinkedInScrape) and linkedin.model_extra == {"logo": "x.png"}
+    assert isinstance(no_url, GenericScrape) and no_url.source == "website"
+    assert no_url.model_extra == {"emails": ["a@acme.com"]}
+    assert website.model_dump(exclude_none=True)["html_length"] == 5120
+
+
+def test_payloads_the_typed_models_reject_fall_back_to_the_old_shape():
+    request = ScrapeRequest(companies=[{"name": "Acme", "website": "acme.com"}],
+                            sources=["website"])
+    assert request.companies == [{"name": "Acme", "website": "acme.com"}]
+    assert ScrapeRequest.model_validate_json(request.model_dump_json()) == request
+
+    draft = DraftRequest(companies=[], sender_company={"company_name": "Carm"})
+    assert draft.sender_company == {"company_name": "Carm"}
+
+    website, numeric_name = _scrape_response(
+        {"source": "website", "url": "acme.com"}, {"name": 5}
+    ).scraped_data
+    assert isinstance(website, GenericScrape)
+    assert (website.source, website.url) == ("website", "acme.com")
+    assert isinstance(numeric_name, GenericScrape) and numeric_name.name == 5
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from carm_data_models.common import ServiceMetrics
+from carm_data_models.company import Company, CompanyProfile
+from carm_data_models.profile_cache import ProfileCache, content_hash, freeze
+
+
+def _profile_data(tenant_id, tagline="We build websites"):
+    return {"company": {"name": f"Tenant {tenant_id}", "website": "https://carm.example.com"},
+            "tagline": tagline, "values": ["Quality"]}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hits_misses_ttl_and_lru():
+    loads = []
+    clock = Clock()
+
+    def loader(tenant_id):
+        loads.append(tenant_id)
+        return _profile_data(tenant_id)
+
+    cache = ProfileCache(loader, ttl=10, maxsize=2, clock=clock)
+    first = cache.get(1)
+    assert isinstance(first, CompanyProfile) and first.company.name == "Tenant 1"
+    assert cache.get(1) is first
+
+    cache.get(2)
+    cache.get(1)          # 1 is now most recently used
+    cache.get(3)          # evicts 2
+    assert 2 not in cache and 1 in cache
+
+    clock.now = 11
+    cache.get(1)          # expired -> reloaded
+    assert loads == [1, 2, 3, 1]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.expirations) == (2, 4, 1, 1)
+    metrics = ServiceMetrics(duration_seconds=1.0)
+    cache.record_metrics(metrics)
+    assert (metrics.cache_hits, metrics.cache_misses) == (2, 4)
+
+
+def test_cached_profiles_are_read_only_and_serialize_unchanged():
+    cache = ProfileCache(lambda tenant_id: _profile_data(tenant_id))
+    profile = cache.get(1)
+    with pytest.raises(ValidationError):
+        profile.tagline = "changed"
+    with pytest.raises(ValidationError):
+        profile.company.name = "changed"
+    assert isinstance(profile.company, Company)
+
+    original = CompanyProfile.model_validate(_profile_data(1))
+    assert profile.model_dump_json() == original.model_dump_json()
+    assert content_hash(profile) == content_hash(original)
+    assert freeze(profile) is profile
+
+
+def test_concurrent_misses_share_one_load():
+    calls = []
+    started = threading.Event()
+
+    def slow_loader(tenant_id):
+        calls.append(tenant_id)
+        started.set()
+        time.sleep(0.1)
+        return CompanyProfile.model_validate(_profile_data(tenant_id))
+
+    cache = ProfileCache(slow_loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(7))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == [7]
+    assert all(result is results[0] for result in results)
+
+    async def load_async(tenant_id):
+        calls.append(tenant_id)
+        await asyncio.sleep(0.05)
+        return _profile_data(tenant_id)
+
+    async_cache = ProfileCache(async_loader=load_async)
+
+    async def many():
+        return await asyncio.gather(*(async_cache.aget(9) for _ in range(10)))
+
+    profiles = asyncio.run(many())
+    assert calls == [7, 9]
+    assert len({id(profile) for profile in profiles}) == 1
+
+
+def test_failed_loads_are_not_cached():
+    attempts = []
+
+    def flaky(tenant_id):
+        attempts.append(tenant_id)
+        if len(attempts) == 1:
+            raise ConnectionError("database unavailable")
+        return _profile_data(tenant_id)
+
+    cache = ProfileCache(flaky)
+    with pytest.raises(ConnectionError):
+        cache.get(1)
+    assert cache.get(1).company.name == "Tenant 1"
+    assert cache.stats().load_errors == 1
+
+
+def test_invalidation_by_content_hash():
+    versions = {1: _profile_data(1)}
+    cache = ProfileCache(lambda tenant_id: versions[tenant_id])
+    cached = cache.get(1)
+    current = cache.content_hash(1)
+
+    assert not cache.invalidate(1, current_hash=current)   # same version: kept
+    assert cache.put(1, versions[1]) is cached               # unchanged content: same instance
+
+    versions[1] = _profile_data(1, tagline="New tagline")
+    new_hash = content_hash(CompanyProfile.model_validate(versions[1]))
+    assert cache.invalidate(1, current_hash=new_hash)
+    assert cache.get(1).tagline == "New tagline"
+    assert cache.content_hash(1) == new_hash
+
+
+def test_cancelled_load_is_retried_by_a_waiter():
+    calls = []
+
+    async def load_async(tenant_id):
+        calls.append(tenant_id)
+        await asyncio.sleep(0.05)
+        return _profile_data(tenant_id)
+
+    cache = ProfileCache(async_loader=load_async)
+
+    async def scenario():
+        owner = asyncio.create_task(cache.aget(3))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(cache.aget(3))
+        cancelled_waiter = asyncio.create_task(cache.aget(3))
+        await asyncio.sleep(0.01)
+        cancelled_waiter.cancel()
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled_waiter
+        return await waiter
+
+    assert asyncio.run(scenario()).company.name == "Tenant 3"
+    assert calls == [3, 3]
+    assert cache.stats().load_errors == 0
@@ -0,0 +1,54 @@
+import pytest
+from pydantic import ValidationError
+
+from carm_data_models import Company, ResearchResponse
+from carm_data_models import profiling
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    profiling.reset()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_disabled_profiler_leaves_models_untouched():
+    Company.model_validate({"name": "Acme"})
+    assert "model_validate" not in vars(profiling.CarmModel)
+    assert profiling.stats() == []
+
+
+def test_records_calls_errors_and_bytes():
+    with profiling.profiling():
+        company = Company.model_validate({"name": "Acme"})
+        text = company.model_dump_json()
+        Company.model_validate_json(text)
+        with pytest.raises(ValidationError):
+            Company.model_validate({"confidence_score": 5})
+
+    assert not profiling.is_enabled()
+    by_op = {s.operation: s for s in profiling.stats("Company")}
+    assert by_op["model_validate"].calls == 2 and by_op["model_validate"].errors == 1
+    assert by_op["model_dump_json"].bytes == len(text.encode())
+    assert by_op["model_validate_json"].bytes == len(text.encode())
+    assert by_op["model_validate_json"].max_seconds > 0
+
+    metrics = profiling.to_service_metrics("Company")
+    assert metrics.requests_made == 4
+    assert "Company.model_dump_json" in profiling.to_dict()
+    assert "Company" in profiling.report()
+
+
+def test_stats_are_per_model_class():
+    profiling.enable()
+    ResearchResponse.model_validate(
+        {
+            "companies": [{"name": "Acme"}],
+            "total_found": 1,
+            "sources_used": [],
+            "duration_seconds": 1,
+        }
+    )
+    profiling.disable()
+    assert [s.model for s in profiling.stats()] == ["ResearchResponse"]
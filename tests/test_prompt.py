@@ -0,0 +1,65 @@
+import json
+
+from carm_data_models.company import Company, CompanyProfile
+from carm_data_models.prompt import to_prompt
+
+
+def _profile():
+    return CompanyProfile(
+        company=Company(name="Carm Visuals", website="https://carmvisuals.com",
+                        industry="Design & Marketing", description="Design studio " * 20),
+        tagline="Bringing your vision to life",
+        unique_selling_points=["10+ years experience", "100% satisfaction guarantee"],
+        case_studies=[{"title": "Bakery rebrand", "industry": "Food"},
+                      {"title": "SaaS analytics dashboard", "industry": "Software", "notes": None}],
+        awards=["Best Agency 2023"],
+        mission="",
+    )
+
+
+def test_compact_output_drops_empty_fields_and_shortens_keys():
+    payload = to_prompt(_profile())
+    data = json.loads(payload.text)
+    assert data["usp"] == ["10+ years experience", "100% satisfaction guarantee"]
+    assert "mission" not in data and "null" not in payload.text
+    assert data["cases"][1] == {"title": "SaaS analytics dashboard", "industry": "Software"}
+    assert payload.complete and payload.chars < len(_profile().model_dump_json())
+
+    assert json.loads(to_prompt(Company(name="Acme", employee_count=0)).text) \
+        == {"name": "Acme", "employees": 0}
+
+
+def test_budget_keeps_high_priority_fields_and_reports_the_rest():
+    target = Company(name="Acme", industry="Software", services=["analytics dashboard"])
+    payload = to_prompt(_profile(), max_chars=260, relevant_to=target)
+    data = json.loads(payload.text)
+
+    assert payload.chars <= 260
+    assert data["usp"] and data["cases"] == [
+        {"title": "SaaS analytics dashboard", "industry": "Software"}
+    ]
+    assert payload.dropped == ["case_studies[0]", "company.description", "awards"]
+    assert to_prompt(_profile(), max_chars=260, relevant_to=target) == payload
+
+    tuned = to_prompt(_profile(), max_chars=230, priority=["awards"])
+    assert json.loads(tuned.text)["awards"] == ["Best Agency 2023"]
+
+
+def test_long_text_is_truncated_to_fit():
+    payload = to_prompt(_profile(), max_chars=340)
+    data = json.loads(payload.text)
+    assert payload.truncated == ["company.description"]
+    assert data["desc"].startswith("Design studio") and data["desc"].endswith("…")
+    assert payload.chars <= 340 and payload.dropped == ["awards"]
+
+
+def test_token_budget_with_custom_counter():
+    def count_words(text):
+        return len(text.split())
+
+    payload = to_prompt(_profile(), max_tokens=20, count_tokens=count_words)
+    assert payload.tokens == count_words(payload.text) <= 20
+    assert payload.dropped
+
+    estimated = to_prompt(_profile(), max_tokens=50)
+    assert estimated.chars <= 200 and estimated.tokens <= 50
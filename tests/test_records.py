@@ -0,0 +1,45 @@
+import pickle
+
+import pytest
+
+from carm_data_models import Company, OrchestrationResponse
+from carm_data_models.records import from_records, record_type, to_record, to_records
+from carm_data_models.synthetic import SyntheticData
+
+
+def test_record_round_trip_and_compactness():
+    company = SyntheticData(seed=1).build(Company)
+    record = to_record(company)
+
+    assert type(record).__name__ == "CompanyRecord"
+    assert not hasattr(record, "__dict__")
+    assert record.website == str(company.website)
+    assert record.services == tuple(company.services)
+    assert type(record.contact_info).__name__ == "ContactInfoRecord"
+    assert record.to_model() == company
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_records_are_frozen_hashable_and_interned():
+    data = SyntheticData(seed=2).payload(Company)
+    first = record_type(Company).from_dict(dict(data))
+    second = to_record(Company.model_validate(data))
+
+    assert first == second and hash(first) == hash(second)
+    assert len({first, second}) == 1
+    assert first.industry is second.industry
+    with pytest.raises(AttributeError):
+        first.name = "Other"
+    with pytest.raises(TypeError):
+        first.metadata["rank"] = 0
+
+    renamed = first.replace(name="Renamed")
+    assert renamed.name == "Renamed" and renamed != first and first.name != "Renamed"
+
+
+def test_nested_lists_of_models():
+    response = SyntheticData(seed=3).build(OrchestrationResponse, 4)
+    record = to_record(response)
+    assert len(record.drafts) == 4
+    assert record.drafts[0].company == record.research_results[0]
+    assert from_records(to_records([response])) == [response]
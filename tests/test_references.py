@@ -0,0 +1,53 @@
+import json
+
+from carm_data_models.company import Company, ContactInfo
+from carm_data_models.email import EmailDraft
+from carm_data_models.responses import DraftResponse, OrchestrationResponse
+from carm_data_models.references import dump_with_refs, dumps_with_refs, load_with_refs, loads_with_refs
+
+
+def _orchestration():
+    acme = Company(name="Acme", website="https://acme.com", contact_info=ContactInfo(email="info@acme.com"))
+    globex = Company(name="Globex")
+    acme_copy = Company.model_validate(acme.model_dump())  # equal content, different object
+    drafts = [
+        EmailDraft(subject="Hi", body="One", recipient_email="a@acme.com", company=acme),
+        EmailDraft(subject="Hi", body="Two", recipient_email="b@acme.com", company=acme_copy),
+        EmailDraft(subject="Hi", body="Three", recipient_email="c@globex.com", company=globex),
+    ]
+    return OrchestrationResponse(
+        task_id="t1", status="completed", research_results=[acme, globex], drafts=drafts,
+        total_duration_seconds=1.0,
+    )
+
+
+def test_each_company_is_sent_once():
+    response = _orchestration()
+    payload = dump_with_refs(response)
+
+    assert [c["name"] for c in payload["companies"]] == ["Acme", "Globex"]
+    assert payload["data"]["research_results"] == [{"$ref": 0}, {"$ref": 1}]
+    assert [d["company"] for d in payload["data"]["drafts"]] == [{"$ref": 0}, {"$ref": 0}, {"$ref": 1}]
+    assert len(dumps_with_refs(response)) < len(response.model_dump_json())
+
+
+def test_decoded_graph_shares_company_instances():
+    response = _orchestration()
+    restored = loads_with_refs(OrchestrationResponse, dumps_with_refs(response))
+
+    assert restored.model_dump() == response.model_dump()
+    acme = restored.research_results[0]
+    assert restored.drafts[0].company is acme
+    assert restored.drafts[1].company is acme
+    assert restored.drafts[2].company is restored.research_results[1]
+
+
+def test_trusted_decoding_and_inline_companies():
+    drafts = DraftResponse(drafts=_orchestration().drafts, total_generated=3, duration_seconds=0.1)
+    payload = json.loads(dumps_with_refs(drafts))
+    restored = load_with_refs(DraftResponse, payload, trusted=True)
+    assert restored.drafts[0].company is restored.drafts[1].company
+    assert restored.model_dump_json() == drafts.model_dump_json()
+
+    payload["data"]["drafts"][2]["company"] = {"name": "Inline Co"}
+    assert load_with_refs(DraftResponse, payload).drafts[2].company.name == "Inline Co"
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from carm_data_models.company import Address, Company, ContactInfo
+from carm_data_models.resolution import (
+    CompanyIndex,
+    email_domain,
+    merge_companies,
+    normalize_domain,
+    normalize_name,
+)
+
+
+def test_normalizers():
+    assert normalize_domain("https://www.Acme.com/about/") == "acme.com"
+    assert normalize_domain("http://acme.com:8080?x=1") == "acme.com"
+    assert normalize_domain("acme.com") == "acme.com"
+    assert email_domain("sales@Acme.com") == "acme.com"
+    assert email_domain("someone@gmail.com") is None
+    assert normalize_name("Acme, Inc.") == "acme"
+    assert normalize_name("Smith & Sons Ltd") == "smith and sons"
+
+
+def test_index_clusters_by_domain_email_and_fuzzy_name():
+    records = [
+        Company(name="Acme Inc", website="https://acme.com"),
+        Company(name="ACME", website="http://www.acme.com/"),
+        Company(name="Acme Labs", contact_info=ContactInfo(email="hello@acme.com")),
+        Company(name="Tech Innovations Inc"),
+        Company(name="Tech Innovation"),
+        Company(name="Globex", website="https://globex.com"),
+        Company(name="Globex", website="https://globex.io"),  # same name, conflicting domain
+    ]
+    index = CompanyIndex()
+    index.extend(records)
+
+    assert index.clusters() == [[0, 1, 2], [3, 4], [5], [6]]
+    assert index.duplicates_of(4) == [3]
+    assert len(index.resolve()) == 4
+
+
+def test_merge_prefers_confident_and_recent_records():
+    old = Company(
+        name="Acme",
+        industry="Retail",
+        employee_count=10,
+        services=["Design"],
+        confidence_score=0.4,
+        found_at=datetime(2023, 1, 1),
+        address=Address(city="Toronto"),
+        metadata={"a": 1, "b": 1},
+    )
+    new = Company(
+        name="Acme Inc",
+        industry="E-commerce",
+        services=["design", "SEO"],
+        confidence_score=0.9,
+        found_at=datetime(2024, 1, 1),
+        address=Address(country="Canada"),
+        metadata={"b": 2},
+    )
+    merged = merge_companies([old, new])
+
+    assert merged.name == "Acme Inc"
+    assert merged.industry == "E-commerce"
+    assert merged.employee_count == 10
+    assert merged.services == ["design", "SEO"]
+    assert merged.address.city == "Toronto" and merged.address.country == "Canada"
+    assert merged.metadata == {"a": 1, "b": 2}
+    assert merged.confidence_score == 0.9
+
+
+def test_punctuation_only_names_are_not_merged():
+    index = CompanyIndex()
+    index.extend([Company(name="???"), Company(name="---"), Company(name="!!!")])
+    assert normalize_name("???") == ""
+    assert index.clusters() == [[0], [1], [2]]
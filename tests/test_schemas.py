@@ -0,0 +1,92 @@
+import json
+from typing import List, Literal, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from carm_data_models import schemas
+from carm_data_models.company import Company, CompanyProfile
+from carm_data_models.responses import OrchestrationResponse
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    schemas.configure(None)
+    schemas.clear()
+    yield
+    schemas.configure(None)
+    schemas.clear()
+
+
+class ProducerV1(BaseModel):
+    name: str
+    tags: List[str] = []
+    level: Literal["a", "b", "c"] = "a"
+    note: Optional[str] = None
+
+
+class ConsumerV2(BaseModel):
+    name: str = Field(..., max_length=10)
+    tags: List[int] = []
+    level: Literal["a", "b"] = "a"
+    note: str = ""
+    score: int
+
+
+def test_cached_schema_matches_pydantic_and_is_a_copy():
+    schema = schemas.json_schema(CompanyProfile)
+    assert schema == CompanyProfile.model_json_schema()
+    schema["title"] = "changed"
+    assert schemas.json_schema(CompanyProfile)["title"] == "CompanyProfile"
+    assert schemas.json_schema_bytes(Company) is schemas.json_schema_bytes(Company)
+    assert (schemas.json_schema(Company, "serialization")
+            == Company.model_json_schema(mode="serialization"))
+
+
+def test_precomputed_bundle_is_used_instead_of_generating(tmp_path, monkeypatch):
+    path = schemas.precompute(tmp_path)
+    assert path.name == f"schemas-{schemas.cache_key()}.json"
+    assert "OrchestrationResponse" in schemas.load_bundle(path)["schemas"]
+
+    schemas.configure(tmp_path)
+    schemas.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema was regenerated")
+
+    monkeypatch.setattr(OrchestrationResponse, "model_json_schema", fail)
+    assert schemas.json_schema(OrchestrationResponse)["title"] == "OrchestrationResponse"
+
+
+def test_current_models_are_compatible_with_themselves():
+    for model in schemas.public_models():
+        assert schemas.check_compatibility(model, model).compatible, model.__name__
+
+
+def test_incompatible_changes_are_reported_with_paths():
+    report = schemas.check_compatibility(ProducerV1, ConsumerV2)
+    assert not report.compatible
+    issues = {issue.path: issue.message for issue in report.issues}
+    assert set(issues) == {"/score", "/name", "/tags/*", "/level", "/note"}
+    assert "required" in issues["/score"]
+    assert "maxLength" in issues["/name"]
+    assert "['c']" in issues["/level"]
+    assert "null" in issues["/note"]
+
+    # Widening in the other direction is fine except for the narrowed list items
+    reverse = schemas.check_compatibility(ConsumerV2, ProducerV1)
+    assert [issue.path for issue in reverse.issues] == ["/tags/*"]
+
+
+def test_check_command_compares_bundles(tmp_path, capsys):
+    old = schemas.precompute(tmp_path)
+    assert schemas.main(["check", str(old), "current"]) == 0
+
+    bundle = schemas.load_bundle(old)
+    company = bundle["schemas"]["Company"]["validation"]
+    company["properties"]["region"] = {"type": "string"}
+    company["required"].append("region")
+    incompatible = tmp_path / "consumer.json"
+    incompatible.write_text(json.dumps(bundle))
+    assert schemas.main(["check", "current", str(incompatible)]) == 1
+    assert "Company: INCOMPATIBLE" in capsys.readouterr().out
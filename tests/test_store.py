@@ -0,0 +1,108 @@
+import pytest
+
+from carm_data_models import Company, EmailDraft
+from carm_data_models.store import RecordStore, StoreError
+from carm_data_models.synthetic import SyntheticData
+
+
+def _companies(count, seed=0):
+    return list(SyntheticData(seed).iter_models(Company, count))
+
+
+def test_put_get_scan_and_reopen(tmp_path):
+    companies = _companies(50)
+    with RecordStore(tmp_path / "companies", Company, writable=True) as store:
+        assert store.put_many(companies, batch_size=16) == 50
+        key = store.put(Company(name="Acme, Inc."))
+        assert key == "name:acme"
+
+    store = RecordStore(tmp_path / "companies", Company)
+    assert len(store) == 51
+    assert store.get("company1.example.com") == companies[0]
+    assert store.get("missing.example.com") is None
+    assert [c.name for c in store.scan(prefix="name:")] == ["Acme, Inc."]
+    keys = store.keys()
+    assert [store.get(k) for k in keys[10:20]] == list(store.scan(keys[10], keys[20]))
+    assert sum(1 for _ in store) == 51
+    with pytest.raises(StoreError):
+        store.put(companies[0])
+    store.close()
+
+
+def test_single_writer_and_reader_refresh(tmp_path):
+    writer = RecordStore(tmp_path / "s", Company, writable=True, max_segment_bytes=4096)
+    with pytest.raises(StoreError):
+        RecordStore(tmp_path / "s", Company, writable=True)
+
+    reader = RecordStore(tmp_path / "s", Company)
+    companies = _companies(40)
+    writer.put_many(companies, batch_size=5)
+    assert len(reader) == 0
+    reader.refresh()
+    assert len(reader) == 40 and len(writer._segments) > 1
+
+    # Overwrites and deletes leave dead bytes until compaction
+    renamed = companies[3].model_copy(update={"name": "Renamed"})
+    writer.put(renamed)
+    assert writer.delete("company2.example.com")
+    assert not writer.delete("company2.example.com")
+    assert writer.dead_bytes > 0
+    reclaimed = writer.compact()
+    assert reclaimed > 0 and writer.dead_bytes == 0
+
+    reader.refresh()
+    assert reader.generation == writer.generation == 1
+    assert len(reader) == 39 and "company2.example.com" not in reader
+    assert reader.get(writer.key(renamed)).name == "Renamed"
+    writer.close()
+    reader.close()
+
+    # Lock is released on close
+    RecordStore(tmp_path / "s", Company, writable=True).close()
+
+
+def test_partial_tail_is_ignored_and_repaired(tmp_path):
+    with RecordStore(tmp_path / "s", Company, writable=True) as store:
+        store.put_many(_companies(3))
+        segment = store._segments[-1].path
+    with open(segment, "ab") as fp:
+        fp.write(b"\x00\x00\x10\x00garbage")
+
+    assert len(RecordStore(tmp_path / "s", Company)) == 3
+    with RecordStore(tmp_path / "s", Company, writable=True) as store:
+        store.put(Company(name="Next"))
+    assert len(RecordStore(tmp_path / "s", Company, trusted=True)) == 4
+
+
+def test_email_drafts_keyed_by_recipient(tmp_path):
+    data = SyntheticData(seed=3)
+    drafts = list(data.iter_models(EmailDraft, 5))
+    with RecordStore(tmp_path / "drafts", EmailDraft, writable=True) as store:
+        store.put_many(drafts)
+        recipient = drafts[2].recipient_email.lower()
+        assert list(store.scan(prefix=recipient + "/")) == [drafts[2]]
+
+
+def test_drafts_created_together_keep_separate_keys(tmp_path):
+    first = next(SyntheticData(seed=4).iter_models(EmailDraft, 1))
+    second = first.model_copy(update={"subject": "Another idea"})
+    with RecordStore(tmp_path / "drafts", EmailDraft, writable=True) as store:
+        keys = {store.put(first), store.put(second)}
+        assert len(keys) == 2 and len(store) == 2
+        assert store.put(first.model_copy(update={"is_approved": True})) in keys
+        assert len(store) == 2
+
+
+def test_key_order_is_kept_across_writes_and_deletes(tmp_path):
+    with RecordStore(tmp_path / "s", Company, writable=True) as store:
+        store.put_many(_companies(30))
+        for name in ("Zeta", "Alpha", "Mid"):
+            store.put(Company(name=name))
+        store.delete("name:mid")
+        store.delete("company3.example.com")
+        keys = store.keys()
+        assert keys == sorted(keys) and len(keys) == 31
+        assert "name:mid" not in keys and "name:alpha" in keys
+        assert [c.name for c in store.scan(prefix="name:")] == ["Alpha", "Zeta"]
+        store.compact()
+        assert store.keys() == keys
@@ -0,0 +1,150 @@
+import asyncio
+import io
+import json
+
+import pytest
+
+from carm_data_models.common import ServiceMetrics
+from carm_data_models.company import Company, ContactInfo
+from carm_data_models.email import EmailDraft
+from carm_data_models.responses import DraftResponse, ResearchResponse, ScrapeResponse
+from carm_data_models.streaming import (
+    JSONReader,
+    NDJSONReader,
+    aread_json,
+    aread_ndjson,
+    iter_ndjson,
+    read_json,
+    read_ndjson,
+    write_ndjson,
+)
+
+
+def _chunked(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+def _research_response():
+    companies = [
+        Company(name=f"Acme {i}", website=f"https://acme{i}.com", employee_count=i,
+                contact_info=ContactInfo(email=f"info@acme{i}.com"))
+        for i in range(5)
+    ]
+    return ResearchResponse(
+        companies=companies,
+        total_found=5,
+        sources_used=["web_search"],
+        duration_seconds=1.5,
+        metrics=ServiceMetrics(duration_seconds=1.5, tokens_used=10),
+    )
+
+
+def test_research_response_round_trip_in_small_chunks():
+    response = _research_response()
+    data = b"".join(iter_ndjson(response))
+    assert data.count(b"\n") == 6
+
+    restored = read_ndjson(_chunked(data, 7), ResearchResponse)
+    assert restored.model_dump_json() == response.model_dump_json()
+
+
+def test_reader_yields_items_before_stream_ends():
+    data = b"".join(iter_ndjson(_research_response()))
+    reader = NDJSONReader(ResearchResponse)
+    first = next(reader.iter_items(_chunked(data, 16)))
+    assert first.name == "Acme 0"
+    assert reader.header["total_found"] == 5
+
+
+def test_scrape_and_draft_responses_round_trip():
+    scrape = ScrapeResponse(scraped_data=[{"name": "A", "emails": ["a@a.com"]}, {"name": "B"}],
+                            successful_scrapes=2, failed_scrapes=0, duration_seconds=0.4)
+    buf = io.BytesIO()
+    write_ndjson(scrape, buf)
+    buf.seek(0)
+    assert read_ndjson(buf, ScrapeResponse).model_dump_json() == scrape.model_dump_json()
+
+    drafts = DraftResponse(
+        drafts=[EmailDraft(subject="Hi", body="Body", recipient_email="x@y.com", company=Company(name="Y"))],
+        total_generated=1,
+        duration_seconds=0.2,
+    )
+    assert read_ndjson(iter_ndjson(drafts), DraftResponse).model_dump_json() == drafts.model_dump_json()
+
+
+def test_async_reader_round_trip():
+    response = _research_response()
+    data = b"".join(iter_ndjson(response))
+
+    async def source():
+        for chunk in _chunked(data, 11):
+            yield chunk
+
+    restored = asyncio.run(aread_ndjson(source(), ResearchResponse))
+    assert restored == response
+
+
+def test_reader_rejects_stream_of_other_model():
+    data = b"".join(iter_ndjson(_research_response()))
+    with pytest.raises(ValueError):
+        read_ndjson([data], DraftResponse)
+
+
+def test_json_reader_parses_regular_body_in_tiny_chunks():
+    response = _research_response()
+    response.companies[1].description = 'Braces {like} these, "quotes" and \\ back\\slashes ]'
+    data = response.model_dump_json(indent=2).encode()
+
+    for size in (1, 3, 64, len(data)):
+        assert read_json(_chunked(data, size), ResearchResponse) == response
+
+
+def test_json_reader_yields_items_as_they_arrive():
+    response = _research_response()
+    data = response.model_dump_json().encode()
+    received = []
+
+    async def stand_in_stream():
+        for chunk in _chunked(data, 32):
+            received.append(chunk)
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def consume():
+        reader = JSONReader(ResearchResponse)
+        items = []
+        async for company in reader.aiter_items(stand_in_stream()):
+            items.append((company.name, sum(map(len, received))))
+        return reader, items
+
+    reader, items = asyncio.run(consume())
+    assert [name for name, _ in items] == [f"Acme {i}" for i in range(5)]
+    assert items[0][1] < len(data) // 2
+    assert reader.header["total_found"] == 5
+    assert reader.header["metrics"]["tokens_used"] == 10
+    assert reader.build_response([c for c in response.companies]) == response
+
+
+def test_json_reader_accepts_fields_in_any_order():
+    scrape = ScrapeResponse(scraped_data=[{"name": "A", "tags": ["x", "y"]}, {"name": "B"}],
+                            successful_scrapes=2, failed_scrapes=0, duration_seconds=0.4)
+    body = scrape.model_dump()
+    reordered = {k: body[k] for k in reversed(list(body))}
+    data = json.dumps(reordered).encode()
+
+    async def source():
+        for chunk in _chunked(data, 5):
+            yield chunk
+
+    assert asyncio.run(aread_json(source(), ScrapeResponse)) == scrape
+
+
+def test_json_reader_rejects_truncated_and_malformed_bodies():
+    data = _research_response().model_dump_json().encode()
+    with pytest.raises(ValueError, match="Truncated"):
+        read_json(_chunked(data[:-10], 8), ResearchResponse)
+    with pytest.raises(ValueError):
+        read_json([b"[" + data + b"]"], ResearchResponse)
+    with pytest.raises(ValueError):
+        read_json([data + b"{}"], ResearchResponse)
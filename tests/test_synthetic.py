@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+import carm_data_models
+from carm_data_models.synthetic import GENERATORS, SyntheticConfig, SyntheticData
+
+
+@pytest.mark.parametrize("model_name", sorted(GENERATORS))
+def test_every_generator_produces_valid_payloads(model_name):
+    model_cls = getattr(carm_data_models, model_name)
+    data = SyntheticData(seed=1)
+    for _ in range(5):
+        model_cls.model_validate(data.payload(model_cls, 3))
+
+
+def test_same_seed_same_payloads():
+    first, second = SyntheticData(seed=7), SyntheticData(seed=7)
+    assert first.payload(carm_data_models.DraftResponse, 4) == second.payload(
+        carm_data_models.DraftResponse, 4
+    )
+    assert SyntheticData(seed=8).company() != SyntheticData(seed=7).company()
+
+
+def test_size_controls_list_lengths():
+    response = SyntheticData().build(carm_data_models.OrchestrationResponse, 25)
+    assert len(response.research_results) == len(response.drafts) == 25
+    assert response.drafts[3].company == response.research_results[3]
+    with pytest.raises(ValueError):
+        SyntheticData().payload(carm_data_models.CarmModel)
+
+
+def test_config_shapes_the_data():
+    sparse = SyntheticData(seed=2, config=SyntheticConfig(fill_rate=0.0))
+    company = sparse.company()
+    assert list(company) == ["name"]
+    carm_data_models.EmailDraft.model_validate(sparse.email_draft())
+    carm_data_models.OrchestrationResponse.model_validate(sparse.orchestration_response(5))
+
+    wide = SyntheticData(seed=2, config=SyntheticConfig(list_length=(12, 12), text_scale=3))
+    company = wide.company()
+    assert len(company["services"]) == len(company["technologies"]) == 12
+    assert len(company["description"].split()) == 60
+
+    half = SyntheticData(seed=3, config=SyntheticConfig(fill_rate=0.5))
+    filled = sum(len(half.company()) for _ in range(200)) / 200
+    assert 7 < filled < 10
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_streams_ndjson_and_json_to_disk(tmp_path, validate):
+    data = SyntheticData(seed=4)
+    path = tmp_path / "companies.ndjson"
+    assert data.write_ndjson(path, carm_data_models.Company, 2500, validate=validate) == 2500
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2500
+    carm_data_models.Company.model_validate_json(lines[-1])
+
+    array = tmp_path / "drafts.json"
+    SyntheticData(seed=4).write_json(array, carm_data_models.DraftResponse, 3, size=2)
+    responses = json.loads(array.read_text())
+    assert len(responses) == 3 and len(responses[0]["drafts"]) == 2
+
+    empty = io.StringIO()
+    data.write_json(empty, carm_data_models.Company, 0)
+    assert empty.getvalue() == "[]"
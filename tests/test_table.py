@@ -0,0 +1,82 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from carm_data_models.company import Company
+from carm_data_models.requests import ResearchRequest
+from carm_data_models.responses import ResearchResponse
+from carm_data_models.table import CompanyTable, compile_filters
+
+
+def _table():
+    companies = [
+        Company(name="A", industry="Technology", employee_count=50, founded_year=2015, confidence_score=0.9),
+        Company(name="B", industry="Retail", employee_count=500, confidence_score=0.4, source="linkedin"),
+        Company(name="C", industry="technology", employee_count=5, founded_year=2020),
+        Company(name="D", employee_count=None, founded_year=2001, confidence_score=0.7),
+        Company(name="E", industry="Retail", employee_count=120, founded_year=2012, confidence_score=0.95),
+    ]
+    response = ResearchResponse(companies=companies, total_found=5, sources_used=["web"], duration_seconds=1)
+    return CompanyTable.from_response(response)
+
+
+def _names(table):
+    return [c.name for c in table.to_companies()]
+
+
+def test_columns_and_round_trip():
+    table = _table()
+    assert len(table) == 5
+    assert table.present("employee_count").tolist() == [True, True, True, False, True]
+    assert table.labels("industry") == ["Technology", "Retail", "technology", None, "Retail"]
+    assert table.to_companies()[0].name == "A"
+
+
+def test_sort_and_top_k_put_nulls_last():
+    table = _table()
+    assert _names(table.sort("employee_count")) == ["C", "A", "E", "B", "D"]
+    assert _names(table.sort("employee_count", descending=True)) == ["B", "E", "A", "C", "D"]
+    assert _names(table.sort(["industry", "employee_count"])) == ["E", "B", "A", "C", "D"]
+    assert _names(table.top_k("confidence_score", 2)) == ["E", "A"]
+    assert _names(table.top_k("founded_year", 10, descending=False)) == ["D", "E", "A", "C"]
+
+
+def test_group_operations():
+    table = _table()
+    groups = table.group_by("industry")
+    assert _names(groups["Retail"]) == ["B", "E"]
+    assert _names(groups[None]) == ["D"]
+    assert table.group_counts("industry") == {"Technology": 1, "Retail": 2, "technology": 1, None: 1}
+    assert table.group_mean("industry", "employee_count")["Retail"] == 310.0
+    assert table.group_mean("industry", "employee_count")[None] is None
+
+
+def test_request_filters_compile_to_predicate():
+    request = ResearchRequest(
+        criteria="tech",
+        filters={"industry": "TECHNOLOGY", "employee_count": {"gte": 10}, "min_founded_year": 2010},
+    )
+    assert _names(_table().apply_filters(request.filters)) == ["A"]
+    assert _names(_table().apply_filters({"source": ["linkedin"], "max_employee_count": 1000})) == ["B"]
+
+    assert len(_table().apply_filters({"location": "Toronto"})) == len(_table())
+    with pytest.raises(ValueError):
+        _table().apply_filters({"revenue": "$1M"}, strict=True)
+    with pytest.raises(ValueError):
+        _table().apply_filters({"employee_count": {"in": 10}})
+    for spec in ({"gte": "3"}, {"in": [10, "50"]}, True):
+        with pytest.raises(ValueError):
+            compile_filters({"employee_count": spec})
+    with pytest.raises(ValueError):
+        compile_filters({"min_founded_year": "2010"})
+    with pytest.raises(ValueError):
+        _table().apply_filters({"industry": {"in": "Retail"}})
+
+
+def test_null_category_filters_match_nothing():
+    table = CompanyTable.from_companies(
+        [*_table().to_companies(), Company(name="F", industry="None")]
+    )
+    assert len(table.apply_filters({"industry": None})) == 0
+    assert _names(table.apply_filters({"industry": ["Retail", None]})) == ["B", "E"]
+    assert _names(table.apply_filters({"industry": {"ne": None}})) == ["A", "B", "C", "E", "F"]
@@ -0,0 +1,84 @@
+import json
+import logging
+from datetime import datetime
+
+import pytest
+from pydantic import HttpUrl, ValidationError
+
+from carm_data_models import trusted
+from carm_data_models.company import Company, ContactInfo
+from carm_data_models.email import EmailDraft
+from carm_data_models.responses import DraftResponse
+from carm_data_models.trusted import (
+    construct_trusted,
+    from_trusted_payload,
+    schema_fingerprint,
+    to_trusted_payload,
+)
+
+
+def _response():
+    company = Company(
+        name="Acme",
+        website="https://acme.com",
+        found_at=datetime(2024, 1, 15, 10, 30),
+        contact_info=ContactInfo(email="info@acme.com", linkedin="https://linkedin.com/company/acme"),
+    )
+    draft = EmailDraft(subject="Hi", body="Body", recipient_email="john@acme.com", company=company)
+    return DraftResponse(drafts=[draft, draft], total_generated=2, duration_seconds=0.5)
+
+
+def test_fingerprint_is_stable_and_model_specific():
+    assert schema_fingerprint(Company) == schema_fingerprint(Company)
+    assert schema_fingerprint(Company) != schema_fingerprint(ContactInfo)
+
+
+def test_trusted_round_trip_builds_nested_models_without_validation():
+    response = _response()
+    payload = json.loads(json.dumps(to_trusted_payload(response)))
+
+    restored = from_trusted_payload(DraftResponse, payload, trusted=True)
+    company = restored.drafts[0].company
+    assert isinstance(company, Company) and isinstance(company.contact_info, ContactInfo)
+    assert isinstance(company.website, HttpUrl)
+    assert company.found_at == datetime(2024, 1, 15, 10, 30)
+    assert restored.model_dump_json() == response.model_dump_json()
+
+
+def test_partial_or_reordered_payloads_match_model_construct():
+    data = _response().drafts[0].company.model_dump(mode="json")
+    reordered = dict(reversed(list(data.items())))
+    assert construct_trusted(Company, reordered).model_dump_json() \
+        == Company.model_validate(data).model_dump_json()
+
+    partial = construct_trusted(Company, {"name": "Acme", "website": "https://acme.com"})
+    assert isinstance(partial.website, HttpUrl) and partial.services is None
+    assert partial.model_fields_set == {"name", "website"}
+
+
+def test_untrusted_or_mismatched_payloads_are_validated():
+    payload = to_trusted_payload(Company(name="Acme"))
+    payload["data"]["founded_year"] = 1200
+
+    # Trusted + matching fingerprint skips validation entirely
+    assert construct_trusted(Company, payload["data"]).founded_year == 1200
+
+    with pytest.raises(ValidationError):
+        from_trusted_payload(Company, payload)
+    with pytest.raises(ValidationError):
+        from_trusted_payload(Company, {**payload, "fingerprint": "stale"}, trusted=True)
+
+
+def test_debug_mode_validates_and_reports_differences(caplog):
+    payload = to_trusted_payload(_response())
+    payload["data"]["drafts"][0]["recipient_email"] = "John@ACME.com"
+
+    trusted.set_debug(True)
+    try:
+        with caplog.at_level(logging.WARNING, logger="carm_data_models.trusted"):
+            restored = from_trusted_payload(DraftResponse, payload, trusted=True)
+    finally:
+        trusted.set_debug(False)
+
+    assert restored.drafts[0].recipient_email == "John@acme.com"
+    assert "drafts" in caplog.text
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from carm_data_models import ContactInfo, User
+from carm_data_models import validators
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    validators.configure(enabled=True)
+    validators.clear()
+    yield
+    validators.configure(enabled=True)
+    validators.clear()
+
+
+def test_repeated_values_hit_the_cache():
+    for _ in range(3):
+        info = ContactInfo(
+            email="Info@Acme.com", website="https://acme.com", linkedin="https://acme.com"
+        )
+    stats = validators.stats()
+    assert stats["email"].misses == 1 and stats["email"].hits == 2
+    assert stats["url"].misses == 1 and stats["url"].hits == 5
+    assert str(info.website) == "https://acme.com/"
+    assert validators.cache_counters() == (7, 2)
+
+
+def test_invalid_values_keep_original_errors_and_are_not_cached():
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc:
+            ContactInfo(website="not a url")
+        assert exc.value.errors()[0]["type"] == "url_parsing"
+    with pytest.raises(ValidationError):
+        User(id=1, username="u", email="nope")
+    assert validators.stats()["url"].size == 0
+
+
+def test_lru_eviction_and_disable():
+    validators.configure(maxsize=2)
+    for name in ("a", "b", "a", "c"):
+        ContactInfo(email=f"{name}@example.com")
+    assert validators.stats()["email"].size == 2
+    ContactInfo(email="a@example.com")  # most recently used survived
+    ContactInfo(email="b@example.com")  # evicted
+    assert validators.stats()["email"].hits == 2
+
+    validators.configure(enabled=False)
+    ContactInfo(email="a@example.com")
+    assert validators.stats()["email"].size == 0
+    assert validators.stats()["email"].maxsize == 0
+
+
+@pytest.mark.parametrize("raw, expected", [
+    (None, validators.DEFAULT_MAXSIZE),
+    ("", validators.DEFAULT_MAXSIZE),
+    ("0", 0),
+    (" 500 ", 500),
+    ("10k", validators.DEFAULT_MAXSIZE),
+    ("-5", validators.DEFAULT_MAXSIZE),
+])
+def test_size_env_var_is_parsed_defensively(raw, expected, caplog):
+    assert validators._size_from_env(raw) == expected
+    warned = validators.SIZE_ENV_VAR in caplog.text
+    assert warned == (raw in ("10k", "-5"))
+
+
+def test_malformed_size_env_var_does_not_break_import():
+    import subprocess
+    import sys
+
+    env = dict(os.environ, **{validators.SIZE_ENV_VAR: "lots"})
+    code = "from carm_data_models import validators; print(validators.EMAIL_CACHE.maxsize)"
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == str(validators.DEFAULT_MAXSIZE)
+